@@ -0,0 +1,370 @@
+"""
+ARA* (Anytime Repairing A*) Search Algorithm
+A* ponderado anytime: entrega rapido una solucion con f(n) = g(n) + w * h(n)
+y la mejora bajando el peso w hasta 1, reutilizando los costos g ya calculados
+Cada solucion mejorada se reporta con su cota de suboptimalidad
+"""
+
+import heapq
+import math
+import time
+
+
+def solve(params: dict):
+    """
+    Ejecuta ARA* para recolectar las 3 muestras con soluciones cada vez mejores.
+    La primera busqueda usa un peso alto sobre la heuristica (rapida pero
+    suboptima). Luego el peso baja de a poco y cada busqueda repara la anterior
+    en lugar de empezar de cero. Termina al llegar a w = 1 (solucion optima) o
+    al vencer el plazo.
+
+    Args:
+        params: Diccionario con parametros del problema
+               - map: Matriz 10x10 con valores 0-6
+               - start: Tupla (fila, columna) de la posicion inicial
+               - goal: NO SE USA, el objetivo es recolectar 3 muestras (valor 6)
+               - operator_order: Orden de expansion de los movimientos (opcional)
+               - initial_weight: Peso inicial de la heuristica (3.0 por defecto)
+               - weight_step: Cuanto baja el peso en cada mejora (0.5 por defecto)
+               - time_limit: Plazo en segundos (opcional, sin plazo por defecto)
+
+    Returns:
+        dict: Resultado con el mejor camino encontrado, estadisticas y la lista
+              'solutions' con cada solucion mejorada (costo, peso y cota)
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Validaciones básicas
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Mapa inválido"
+        }
+
+    # Encontrar todas las muestras (valor 6)
+    muestras = set()
+    for i in range(10):
+        for j in range(10):
+            if mapa[i][j] == 6:
+                muestras.add((i, j))
+
+    # Validar que haya exactamente 3 muestras
+    if len(muestras) != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Se esperan 3 muestras, se encontraron {len(muestras)}"
+        }
+
+    # Obtener orden de operadores desde parámetros (opcional)
+    operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
+
+    peso = max(1.0, float(params.get("initial_weight", 3.0)))
+    paso_peso = float(params.get("weight_step", 0.5))
+    limite_tiempo = params.get("time_limit")
+    inicio = time.perf_counter()
+    plazo = inicio + limite_tiempo if limite_tiempo is not None else None
+
+    def get_neighbors(pos, mapa, order):
+        """
+        Obtiene los vecinos válidos de una posición.
+        El orden se determina por el parámetro 'order'
+        Args:
+            pos: Tupla (fila, columna) de la posición actual
+            mapa: Mapa/grafo para determinar obstáculos
+            order: Lista con el orden de movimientos a considerar
+        Returns:
+            list: Lista de posiciones vecinas válidas
+        """
+        fila, col = pos
+
+        # Mapeo de nombres a movimientos
+        movimientos = {
+            'arriba': (-1, 0),
+            'abajo': (1, 0),
+            'izquierda': (0, -1),
+            'derecha': (0, 1)
+        }
+
+        # Crear lista de direcciones según el orden especificado
+        direcciones = [movimientos[op] for op in order if op in movimientos]
+        vecinos = []
+
+        # Explorar cada dirección
+        for df, dc in direcciones:
+            nueva_fila, nueva_col = fila + df, col + dc
+
+            # Verificar límites del mapa
+            if 0 <= nueva_fila < 10 and 0 <= nueva_col < 10:
+                # Verificar que no sea obstáculo (valor 1)
+                if mapa[nueva_fila][nueva_col] != 1:
+                    vecinos.append((nueva_fila, nueva_col))
+
+        return vecinos
+
+    def calcular_costo_movimiento(pos, combustible_antes, mapa):
+        """
+        Calcula el costo real de moverse a una posición
+
+        Args:
+            pos: Tupla (fila, columna) de la posición destino
+            combustible_antes: Cantidad de combustible antes del movimiento
+            mapa: Mapa/grafo para determinar el tipo de terreno
+
+        Returns:
+            float: Costo del movimiento
+        """
+        fila, col = pos
+        celda = mapa[fila][col]
+
+        # Si tenía combustible antes del movimiento, cuesta 0.5
+        if combustible_antes > 0:
+            return 0.5
+
+        # Sin combustible, depende del terreno
+        if celda in [0, 2, 5, 6]:
+            return 1
+        elif celda == 3:
+            return 3
+        elif celda == 4:
+            return 5
+
+        return 1
+
+    def heuristic(pos, muestras_recolectadas, todas_muestras):
+        """
+        Calcula h(n): la misma heuristica admisible y consistente de A*
+        Distancia Manhattan a la muestra no recolectada más cercana por 0.5
+        """
+        if len(muestras_recolectadas) == 3:
+            return 0
+
+        muestras_restantes = todas_muestras - muestras_recolectadas
+        min_distancia = float('inf')
+
+        for muestra in muestras_restantes:
+            distancia = abs(pos[0] - muestra[0]) + abs(pos[1] - muestra[1])
+            min_distancia = min(min_distancia, distancia)
+
+        return min_distancia * 0.5
+
+    def h_estado(estado):
+        """Heuristica de un estado (posición, muestras, combustible, estacion_usada)"""
+        return heuristic(estado[0], estado[1], muestras)
+
+    # Estado: (posición, muestras_recolectadas, combustible, estacion_usada)
+    # La muestra se recolecta al llegar a la celda, asi el estado ya la incluye
+    estado_inicial = (start, frozenset({start}) & muestras, 0, False)
+
+    # Informacion que se conserva entre busquedas (reutilizacion del esfuerzo)
+    g = {estado_inicial: 0}
+    padres = {estado_inicial: None}
+    profundidad = {estado_inicial: 0}
+
+    # ABIERTOS: heap con entradas (f_ponderado, contador, g, estado); las
+    # entradas con g desactualizado se descartan al extraerlas
+    contador = 0
+    abiertos = [(peso * h_estado(estado_inicial), contador, 0, estado_inicial)]
+    en_abiertos = {estado_inicial}
+    cerrados = set()
+    # INCONSISTENTES: estados cerrados cuyo g mejoró; vuelven a ABIERTOS al bajar w
+    inconsistentes = set()
+
+    mejor_meta = None
+    mejor_costo = float('inf')
+    nodos_expandidos = 0
+    max_profundidad = 0
+    soluciones = []
+    plazo_vencido = False
+    max_frontera = 0
+
+    def mejorar_camino(peso):
+        """
+        Busqueda A* ponderada que repara la busqueda anterior (ImprovePath).
+        Expande mientras algun estado en ABIERTOS pueda mejorar la solucion
+        actual con el peso dado.
+
+        Returns:
+            bool: False si el plazo vencio antes de terminar
+        """
+        nonlocal contador, mejor_meta, mejor_costo, nodos_expandidos, max_profundidad, max_frontera
+
+        while abiertos:
+            f_actual, _, g_entrada, estado = abiertos[0]
+
+            # Descartar entradas viejas (el estado mejoró o ya se cerró)
+            if estado in cerrados or g_entrada != g[estado]:
+                heapq.heappop(abiertos)
+                continue
+
+            # Ningun estado abierto puede mejorar la solucion con este peso
+            if mejor_costo <= f_actual:
+                return True
+
+            if plazo is not None and time.perf_counter() > plazo:
+                return False
+
+            heapq.heappop(abiertos)
+            # ABIERTOS sin las entradas viejas del heap
+            max_frontera = max(max_frontera, len(en_abiertos))
+            en_abiertos.discard(estado)
+            cerrados.add(estado)
+            max_profundidad = max(max_profundidad, profundidad[estado])
+
+            pos_actual, muestras_recolectadas, combustible, estacion_usada = estado
+            vecinos_agregados = 0
+            for vecino in get_neighbors(pos_actual, mapa, operator_order):
+                nuevo_g = g[estado] + calcular_costo_movimiento(vecino, combustible, mapa)
+
+                nuevo_combustible = combustible
+                nueva_estacion_usada = estacion_usada
+
+                # Solo recargar si estamos en estación (5) y NO la hemos usado antes
+                if mapa[vecino[0]][vecino[1]] == 5 and not estacion_usada:
+                    nuevo_combustible = 20
+                    nueva_estacion_usada = True
+                elif nuevo_combustible > 0:
+                    nuevo_combustible -= 1
+
+                nuevas_muestras = muestras_recolectadas
+                if vecino in muestras and vecino not in muestras_recolectadas:
+                    nuevas_muestras = frozenset(muestras_recolectadas | {vecino})
+
+                nuevo_estado = (vecino, nuevas_muestras, nuevo_combustible, nueva_estacion_usada)
+
+                if nuevo_g >= g.get(nuevo_estado, float('inf')):
+                    continue
+
+                g[nuevo_estado] = nuevo_g
+                padres[nuevo_estado] = estado
+                profundidad[nuevo_estado] = profundidad[estado] + 1
+                vecinos_agregados += 1
+
+                # Los estados meta no se expanden: solo actualizan la mejor solucion
+                if len(nuevas_muestras) == 3:
+                    if nuevo_g < mejor_costo:
+                        mejor_costo = nuevo_g
+                        mejor_meta = nuevo_estado
+                    continue
+
+                if nuevo_estado in cerrados:
+                    inconsistentes.add(nuevo_estado)
+                else:
+                    contador += 1
+                    heapq.heappush(abiertos, (nuevo_g + peso * h_estado(nuevo_estado), contador, nuevo_g, nuevo_estado))
+                    en_abiertos.add(nuevo_estado)
+
+            if vecinos_agregados > 0:
+                nodos_expandidos += 1
+
+        return True
+
+    def cota_suboptimalidad(peso):
+        """
+        Cota de suboptimalidad de la solucion actual:
+        min(w, costo / min(g + h) sobre ABIERTOS e INCONSISTENTES).
+        Con peso=inf (pasada interrumpida, que no garantiza w) queda solo
+        el cociente, valido en cualquier momento porque h es admisible
+        """
+        candidatos = [
+            g[estado] + h_estado(estado)
+            for estado in en_abiertos | inconsistentes
+        ]
+        if not candidatos:
+            return 1.0
+        cota_inferior = min(candidatos)
+        if cota_inferior <= 0:
+            return peso
+        # Redondear hacia arriba para que la cota reportada siga siendo valida
+        return max(1.0, min(peso, math.ceil(mejor_costo / cota_inferior * 10000) / 10000))
+
+    def reconstruir_camino(estado):
+        """Reconstruye el camino siguiendo los padres hasta el inicio"""
+        camino = []
+        while estado is not None:
+            camino.append(list(estado[0]))
+            estado = padres[estado]
+        camino.reverse()
+        return camino
+
+    while True:
+        costo_anterior = mejor_costo
+        if not mejorar_camino(peso):
+            plazo_vencido = True
+
+        if mejor_meta is None:
+            # Sin solucion: si el plazo no vencio, el espacio alcanzable se agotó
+            break
+
+        if plazo_vencido:
+            # La busqueda quedo a medias; si aun asi mejoró el costo, la cota
+            # de la iteracion anterior sigue siendo valida. Si es la primera
+            # pasada no hay cota anterior y el peso no esta garantizado
+            if mejor_costo < costo_anterior:
+                soluciones.append({
+                    "cost": mejor_costo,
+                    "weight": peso,
+                    "suboptimality_bound": soluciones[-1]["suboptimality_bound"] if soluciones
+                                           else cota_suboptimalidad(float('inf')),
+                    "nodes_expanded": nodos_expandidos,
+                    "time": round(time.perf_counter() - inicio, 4)
+                })
+            break
+
+        cota = cota_suboptimalidad(peso)
+        if mejor_costo < costo_anterior or not soluciones or cota < soluciones[-1]["suboptimality_bound"]:
+            soluciones.append({
+                "cost": mejor_costo,
+                "weight": peso,
+                "suboptimality_bound": cota,
+                "nodes_expanded": nodos_expandidos,
+                "time": round(time.perf_counter() - inicio, 4)
+            })
+
+        if peso <= 1.0 or cota <= 1.0:
+            break
+
+        # Bajar el peso y volver a ordenar ABIERTOS junto con los inconsistentes.
+        # Los valores g y los padres se conservan: solo se repara lo necesario
+        peso = max(1.0, peso - paso_peso)
+        en_abiertos |= inconsistentes
+        inconsistentes.clear()
+        abiertos = []
+        for estado in en_abiertos:
+            contador += 1
+            abiertos.append((g[estado] + peso * h_estado(estado), contador, g[estado], estado))
+        heapq.heapify(abiertos)
+        cerrados.clear()
+
+    if mejor_meta is None:
+        return {
+            "path": [],
+            "nodes_expanded": nodos_expandidos,
+            "cost": 0,
+            "max_depth": max_profundidad,
+            "solutions": soluciones,
+            "max_frontier": max_frontera,
+            "visited_states": len(g),
+            "message": "Plazo agotado sin solución" if plazo_vencido
+                       else "No se encontró solución para recolectar las 3 muestras"
+        }
+
+    cota_final = soluciones[-1]["suboptimality_bound"]
+    return {
+        "path": reconstruir_camino(mejor_meta),
+        "nodes_expanded": nodos_expandidos,
+        "cost": mejor_costo,
+        "max_depth": max_profundidad,
+        "solutions": soluciones,
+        "suboptimality_bound": cota_final,
+        "max_frontier": max_frontera,
+        "visited_states": len(g),
+        "message": "Solución óptima encontrada - 3 muestras recolectadas" if cota_final <= 1.0
+                   else f"Solución encontrada (a lo sumo {cota_final}x el óptimo) - 3 muestras recolectadas"
+    }
@@ -8,6 +8,9 @@ Utiliza f(n) = g(n) + h(n) donde:
 
 import heapq
 
+from core.heuristics import get_fuel_aware_heuristic, get_mst_table, get_subset_table
+from core.landmarks import get_landmark_table
+
 def solve(params: dict):
     """
     Ejecuta el algoritmo A* para encontrar el camino optimo que recolecte las 3 muestras.
@@ -19,6 +22,8 @@ def solve(params: dict):
                - map: Matriz 10x10 con valores 0-6
                - start: Tupla (fila, columna) de la posicion inicial
                - goal: NO SE USA, el objetivo es recolectar 3 muestras (valor 6)
+               - dominance_pruning: Poda por dominancia de combustible (True por defecto)
+               - heuristic: "fuel_aware" (por defecto), "subset_dp", "mst", "alt" o "manhattan"
     
     Returns:
         dict: Resultado con el camino encontrado y estadisticas
@@ -56,6 +61,26 @@ def solve(params: dict):
     # Obtener orden de operadores desde parámetros (opcional)
     operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
     
+    # Poda por dominancia: dos estados en la misma celda, con las mismas muestras
+    # y el mismo uso de la nave solo difieren en combustible. Si uno tiene g
+    # menor o igual y combustible mayor o igual, el otro nunca puede terminar en
+    # una solucion mas barata (el combustible solo abarata movimientos futuros)
+    poda_dominancia = params.get("dominance_pruning", True)
+    
+    # Heuristica a usar: "manhattan" es la original (muestra más cercana);
+    # "subset_dp", "mst" y "fuel_aware" usan tablas precalculadas por mapa
+    # (core/heuristics.py); "fuel_aware" además considera el combustible;
+    # "alt" usa cotas de landmarks (core/landmarks.py)
+    nombre_heuristica = params.get("heuristic", "fuel_aware")
+    if nombre_heuristica not in ("fuel_aware", "subset_dp", "mst", "alt", "manhattan"):
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Heurística desconocida: '{nombre_heuristica}'"
+        }
+    
     def get_neighbors(pos, mapa, order):
         """
         Obtiene los vecinos válidos de una posición.
@@ -126,7 +151,7 @@ def solve(params: dict):
         
         return 1
     
-    def heuristic(pos, muestras_recolectadas, todas_muestras):
+    def heuristic(pos, muestras_recolectadas, todas_muestras, combustible=0, estacion_usada=False):
         """
         Calcula h(n): estimacion heuristica del costo restante
         (Componente de Greedy)
@@ -149,6 +174,71 @@ def solve(params: dict):
         # Multiplicamos por 0.5 (costo mínimo por movimiento) para mejor estimación
         return min_distancia * 0.5
     
+    if nombre_heuristica == "subset_dp":
+        tabla_subconjuntos = get_subset_table(mapa)
+        
+        def heuristic(pos, muestras_recolectadas, todas_muestras, combustible=0, estacion_usada=False):
+            """
+            Calcula h(n) con la tabla subset_dp: movimientos mínimos (evitando
+            obstáculos) para recoger todas las muestras restantes en el mejor
+            orden, por 0.5 (costo mínimo por movimiento). Sigue siendo admisible
+            porque ningún camino que las recoja tiene menos movimientos.
+            """
+            return tabla_subconjuntos.moves(pos, muestras_recolectadas) * 0.5
+    
+    elif nombre_heuristica == "mst":
+        tabla_mst = get_mst_table(mapa)
+        
+        def heuristic(pos, muestras_recolectadas, todas_muestras, combustible=0, estacion_usada=False):
+            """
+            Calcula h(n) con la tabla mst: distancia real a la muestra restante
+            más cercana más el árbol de expansión mínima entre las restantes,
+            por 0.5 (costo mínimo por movimiento)
+            """
+            return tabla_mst.moves(pos, muestras_recolectadas) * 0.5
+    
+    elif nombre_heuristica == "alt":
+        tabla_landmarks, _ = get_landmark_table(mapa, count=4, mode="unit")
+        cotas = {muestra: tabla_landmarks.lower_bounds_to(muestra) for muestra in muestras}
+        
+        def heuristic(pos, muestras_recolectadas, todas_muestras, combustible=0, estacion_usada=False):
+            """
+            Calcula h(n) con landmarks (ALT): cota inferior por desigualdad
+            triangular de los movimientos hasta la muestra restante más lejana
+            (hay que llegar a todas), por 0.5 (costo mínimo por movimiento)
+            """
+            restantes = todas_muestras - muestras_recolectadas
+            return max((cotas[muestra].get(pos[0], pos[1]) for muestra in restantes), default=0) * 0.5
+    
+    elif nombre_heuristica == "fuel_aware":
+        heuristica_combustible = get_fuel_aware_heuristic(mapa)
+        
+        def heuristic(pos, muestras_recolectadas, todas_muestras, combustible=0, estacion_usada=False):
+            """
+            Calcula h(n) según el estado: con la nave usada solo los movimientos
+            que cubre el combustible restante cuestan 0.5 y el resto al menos 1;
+            sin usarla, el mínimo entre caminar todo y pasar por la nave
+            """
+            return heuristica_combustible.cost(pos, muestras_recolectadas, combustible, estacion_usada)
+    
+    def es_dominado(frente, g, combustible):
+        """
+        Verifica si la etiqueta (g, combustible) esta dominada por el frente
+        de estados ya expandidos
+        
+        Args:
+            frente: Lista de etiquetas (g, combustible) no dominadas
+            g: Costo real acumulado de la nueva etiqueta
+            combustible: Combustible restante de la nueva etiqueta
+
+        Returns:
+            bool: True si alguna etiqueta del frente es igual o mejor en ambos
+        """
+        for g_frente, combustible_frente in frente:
+            if g_frente <= g and combustible_frente >= combustible:
+                return True
+        return False
+    
     # Estado: (posición, muestras_recolectadas, combustible, estacion_usada)
     estado_inicial = (start, frozenset(), 0, False)
     
@@ -164,10 +254,16 @@ def solve(params: dict):
     
     # Diccionario para guardar el mejor costo g por estado
     visitados = {}
+    # Frente de Pareto de (g, combustible) expandidos por (posición, muestras, estacion_usada)
+    frentes = {}
+    nodos_podados = 0
     nodos_expandidos = 0
     max_profundidad = 0
+    # Tamaño máximo de la cola (incluye entradas que luego se descartan)
+    max_frontera = 0
 
     while cola_prioridad:
+        max_frontera = max(max_frontera, len(cola_prioridad))
         # Extraer el nodo con el menor f (g + h)
         # - (f, g, contador, estado, camino)
         f_actual, g_actual, _, (pos_actual, muestras_recolectadas, combustible, estacion_usada), camino = heapq.heappop(cola_prioridad)
@@ -178,6 +274,18 @@ def solve(params: dict):
         # Esto asegura que siempre expandimos el camino más barato a cada estado
         if estado_key in visitados and visitados[estado_key] <= g_actual:
             continue
+        
+        if poda_dominancia:
+            frente = frentes.setdefault((pos_actual, muestras_recolectadas, estacion_usada), [])
+            if es_dominado(frente, g_actual, combustible):
+                nodos_podados += 1
+                continue
+            # Retirar del frente las etiquetas que la nueva domina
+            frente[:] = [
+                (g, f) for g, f in frente
+                if not (g_actual <= g and combustible >= f)
+            ]
+            frente.append((g_actual, combustible))
             
         visitados[estado_key] = g_actual
         max_profundidad = max(max_profundidad, len(camino)) - 1
@@ -195,6 +303,9 @@ def solve(params: dict):
                 "nodes_expanded": nodos_expandidos,
                 "cost": g_actual,  # Retornar el costo real g(n)
                 "max_depth": max_profundidad,
+                "dominance_pruned": nodos_podados,
+                "max_frontier": max_frontera,
+                "visited_states": len(visitados),
                 "message": "Solución óptima encontrada - 3 muestras recolectadas"
             }
         
@@ -227,8 +338,16 @@ def solve(params: dict):
             # - Componente de no revisitar estados con mayor costo g
             # - SÍ permite volver a posiciones anteriores en el mismo camino
             if nuevo_estado_key not in visitados or visitados[nuevo_estado_key] > nuevo_g:
+                # Descartar sucesores dominados por un estado ya expandido
+                if poda_dominancia and es_dominado(
+                    frentes.get((vecino, muestras_recolectadas, nueva_estacion_usada), []),
+                    nuevo_g, nuevo_combustible
+                ):
+                    nodos_podados += 1
+                    continue
+                
                 # Calcular h(vecino): estimación heurística
-                nuevo_h = heuristic(vecino, muestras_recolectadas, muestras)
+                nuevo_h = heuristic(vecino, muestras_recolectadas, muestras, nuevo_combustible, nueva_estacion_usada)
                 
                 # Calcular f(vecino) = g(vecino) + h(vecino)
                 nuevo_f = nuevo_g + nuevo_h
@@ -247,5 +366,8 @@ def solve(params: dict):
         "nodes_expanded": nodos_expandidos,
         "cost": 0,
         "max_depth": max_profundidad,
+        "dominance_pruned": nodos_podados,
+        "max_frontier": max_frontera,
+        "visited_states": len(visitados),
         "message": "No se encontró solución para recolectar las 3 muestras"
     }
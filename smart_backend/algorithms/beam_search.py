@@ -0,0 +1,240 @@
+"""
+Beam Search Algorithm
+Beam search that expands the search tree layer by layer keeping only the
+best-k states of each depth, ranked by the greedy sample-distance heuristic
+Memory is O(k x depth) regardless of map size
+"""
+
+
+def solve(params: dict):
+    """
+    Executes Beam Search to find a path that collects all 3 samples.
+    Each layer keeps at most `beam_width` states (the ones with the lowest
+    heuristic value); the rest are discarded, so the search is neither
+    complete nor optimal, but its memory does not grow with the map.
+
+    Args:
+        params: Dictionary with problem parameters
+               - map: 10x10 matrix with values 0-6
+               - start: Tuple (row, column) of starting position
+               - goal: NOT USED, objective is to collect 3 samples (value 6)
+               - operator_order: Movement expansion order (optional)
+               - beam_width: States kept per depth layer (default 10)
+               - beam_widening: Retry with double width when no solution is
+                 found (default False)
+               - max_beam_width: Upper limit for widening retries (default 1000)
+
+    Returns:
+        dict: Result with found path and statistics
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Basic validations
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Invalid map"
+        }
+
+    # Find all samples (value 6)
+    samples = set()
+    for i in range(10):
+        for j in range(10):
+            if mapa[i][j] == 6:
+                samples.add((i, j))
+
+    if len(samples) != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Expected 3 samples, found {len(samples)}"
+        }
+
+    operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
+    beam_width = max(1, int(params.get("beam_width", 10)))
+    widening = params.get("beam_widening", False)
+    max_beam_width = max(beam_width, int(params.get("max_beam_width", 1000)))
+
+    def get_neighbors(pos, mapa, order):
+        """Get valid neighbors of a position in the given operator order"""
+        row, col = pos
+        movements = {
+            'arriba': (-1, 0),
+            'abajo': (1, 0),
+            'izquierda': (0, -1),
+            'derecha': (0, 1)
+        }
+        directions = [movements[op] for op in order if op in movements]
+        neighbors = []
+
+        for dr, dc in directions:
+            new_row, new_col = row + dr, col + dc
+
+            # Check map boundaries
+            if 0 <= new_row < 10 and 0 <= new_col < 10:
+                # Check that it's not an obstacle (value 1)
+                if mapa[new_row][new_col] != 1:
+                    neighbors.append((new_row, new_col))
+
+        return neighbors
+
+    def movement_cost(pos, fuel_before, mapa):
+        """Cost of moving into pos: 0.5 with fuel, otherwise terrain cost"""
+        if fuel_before > 0:
+            return 0.5
+
+        cell = mapa[pos[0]][pos[1]]
+        if cell == 3:
+            return 3
+        elif cell == 4:
+            return 5
+        return 1
+
+    def heuristic(pos, collected_samples, all_samples):
+        """
+        Heuristic function (same as greedy): Manhattan distance to the closest
+        uncollected sample divided by 2. Returns 0 if all samples are collected.
+        """
+        if len(collected_samples) == 3:
+            return 0
+
+        remaining_samples = all_samples - collected_samples
+        min_distance = float('inf')
+
+        for sample in remaining_samples:
+            distance = abs(pos[0] - sample[0]) + abs(pos[1] - sample[1])
+            min_distance = min(min_distance, distance)
+
+        return min_distance / 2
+
+    def beam_search(width):
+        """
+        Runs one beam search with the given width.
+
+        Each layer is a list of (state, cost, parent_index) where parent_index
+        points into the previous layer; paths are rebuilt by walking back the
+        layers, so no state stores its full path.
+
+        Returns:
+            tuple: (layers, goal_index, nodes_expanded); goal_index is None
+                   when the beam died out without reaching the goal
+        """
+        # State: (position, collected_samples, fuel, has_taken_ship)
+        initial_state = (start, frozenset({start}) & samples, 0, False)
+        layers = [[(initial_state, 0, None)]]
+        # Only states kept in some beam are remembered: at most width per layer
+        kept = {initial_state}
+        nodes_expanded = 0
+
+        if len(initial_state[1]) == 3:
+            return layers, 0, nodes_expanded
+
+        while layers[-1]:
+            candidates = {}
+            for index, ((pos, collected, fuel, has_taken_ship), cost, _) in enumerate(layers[-1]):
+                neighbors_added = 0
+                for neighbor in get_neighbors(pos, mapa, operator_order):
+                    new_cost = cost + movement_cost(neighbor, fuel, mapa)
+
+                    new_fuel = fuel
+                    has_taken_ship_new = has_taken_ship
+
+                    # Can only take the ship if at cell 5 and hasn't taken it before
+                    if mapa[neighbor[0]][neighbor[1]] == 5 and not has_taken_ship:
+                        new_fuel = 20
+                        has_taken_ship_new = True
+                    elif new_fuel > 0:
+                        new_fuel -= 1
+
+                    new_collected = collected
+                    if neighbor in samples and neighbor not in collected:
+                        new_collected = frozenset(collected | {neighbor})
+
+                    new_state = (neighbor, new_collected, new_fuel, has_taken_ship_new)
+                    if new_state in kept:
+                        continue
+
+                    # Keep the cheapest way of reaching each state in this layer
+                    if new_state not in candidates or candidates[new_state][0] > new_cost:
+                        candidates[new_state] = (new_cost, index)
+                    neighbors_added += 1
+
+                if neighbors_added > 0:
+                    nodes_expanded += 1
+
+            # Rank by heuristic (ties broken by accumulated cost) and keep the best-k
+            ranked = sorted(
+                candidates.items(),
+                key=lambda item: (heuristic(item[0][0], item[0][1], samples), item[1][0])
+            )[:width]
+
+            layer = []
+            for state, (cost, parent_index) in ranked:
+                kept.add(state)
+                layer.append((state, cost, parent_index))
+                if len(state[1]) == 3:
+                    layers.append(layer)
+                    return layers, len(layer) - 1, nodes_expanded
+            layers.append(layer)
+
+        return layers, None, nodes_expanded
+
+    total_expanded = 0
+    attempts = []
+    width = beam_width
+
+    while True:
+        layers, goal_index, nodes_expanded = beam_search(width)
+        total_expanded += nodes_expanded
+        attempts.append({"beam_width": width, "nodes_expanded": nodes_expanded})
+
+        if goal_index is not None or not widening or width >= max_beam_width:
+            break
+        width = min(width * 2, max_beam_width)
+
+    # The last layer is empty when the beam died out
+    max_depth = len(layers) - 1 if layers[-1] else len(layers) - 2
+
+    # The frontier is one layer; every kept state belongs to exactly one layer
+    max_frontier = max(len(layer) for layer in layers)
+    visited_states = sum(len(layer) for layer in layers)
+
+    if goal_index is None:
+        return {
+            "path": [],
+            "nodes_expanded": total_expanded,
+            "cost": 0,
+            "max_depth": max_depth,
+            "beam_width": width,
+            "attempts": attempts,
+            "max_frontier": max_frontier,
+            "visited_states": visited_states,
+            "message": "No solution found to collect the 3 samples"
+        }
+
+    # Rebuild path walking back through the layers
+    path = []
+    index = goal_index
+    for layer in reversed(layers):
+        state, cost, parent_index = layer[index]
+        path.append(list(state[0]))
+        index = parent_index
+    path.reverse()
+
+    return {
+        "path": path,
+        "nodes_expanded": total_expanded,
+        "cost": layers[-1][goal_index][1],
+        "max_depth": max_depth,
+        "beam_width": width,
+        "attempts": attempts,
+        "max_frontier": max_frontier,
+        "visited_states": visited_states,
+        "message": "Solution found - 3 samples collected"
+    }
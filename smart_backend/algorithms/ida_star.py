@@ -0,0 +1,301 @@
+"""
+IDA* Search Algorithm
+A* por profundizacion iterativa: mismo costo optimo que A* con memoria O(profundidad)
+Repite busquedas en profundidad acotadas por f(n) = g(n) + h(n), subiendo el
+umbral al menor f que lo supero en la iteracion anterior
+"""
+
+def solve(params: dict):
+    """
+    Ejecuta IDA* para encontrar el camino optimo que recolecte las 3 muestras.
+    Usa la misma heuristica admisible de A*, pero en lugar de guardar todos los
+    estados generados solo mantiene el camino actual y, opcionalmente, una
+    tabla de transposicion de tamano acotado.
+
+    Args:
+        params: Diccionario con parametros del problema
+               - map: Matriz 10x10 con valores 0-6
+               - start: Tupla (fila, columna) de la posicion inicial
+               - goal: NO SE USA, el objetivo es recolectar 3 muestras (valor 6)
+               - operator_order: Orden de expansion de los movimientos (opcional)
+               - transposition_table: Usar tabla de transposicion (True por defecto)
+               - transposition_table_size: Maximo de entradas de la tabla (50000 por defecto)
+
+    Returns:
+        dict: Resultado con el camino encontrado y estadisticas
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Validaciones básicas
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Mapa inválido"
+        }
+
+    # Encontrar todas las muestras (valor 6)
+    muestras = set()
+    for i in range(10):
+        for j in range(10):
+            if mapa[i][j] == 6:
+                muestras.add((i, j))
+
+    # Validar que haya exactamente 3 muestras
+    if len(muestras) != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Se esperan 3 muestras, se encontraron {len(muestras)}"
+        }
+
+    # Obtener orden de operadores desde parámetros (opcional)
+    operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
+
+    # Tabla de transposicion: mejor g visto por estado en la iteracion actual.
+    # Su tamano esta acotado, asi que la memoria total sigue siendo
+    # O(profundidad + tamano_tabla) sin importar cuantos estados se generen.
+    # Sin tabla solo se evitan ciclos en el camino actual y el numero de
+    # caminos explorados crece exponencialmente en mapas abiertos
+    usar_tabla = params.get("transposition_table", True)
+    tamano_tabla = params.get("transposition_table_size", 50000)
+
+    def get_neighbors(pos, mapa, order):
+        """
+        Obtiene los vecinos válidos de una posición.
+        El orden se determina por el parámetro 'order'
+        Args:
+            pos: Tupla (fila, columna) de la posición actual
+            mapa: Mapa/grafo para determinar obstáculos
+            order: Lista con el orden de movimientos a considerar
+        Returns:
+            list: Lista de posiciones vecinas válidas
+        """
+        fila, col = pos
+
+        # Mapeo de nombres a movimientos
+        movimientos = {
+            'arriba': (-1, 0),
+            'abajo': (1, 0),
+            'izquierda': (0, -1),
+            'derecha': (0, 1)
+        }
+
+        # Crear lista de direcciones según el orden especificado
+        direcciones = [movimientos[op] for op in order if op in movimientos]
+        vecinos = []
+
+        # Explorar cada dirección
+        for df, dc in direcciones:
+            nueva_fila, nueva_col = fila + df, col + dc
+
+            # Verificar límites del mapa
+            if 0 <= nueva_fila < 10 and 0 <= nueva_col < 10:
+                # Verificar que no sea obstáculo (valor 1)
+                if mapa[nueva_fila][nueva_col] != 1:
+                    vecinos.append((nueva_fila, nueva_col))
+
+        return vecinos
+
+    def calcular_costo_movimiento(pos, combustible_antes, mapa):
+        """
+        Calcula el costo real de moverse a una posición
+
+        Args:
+            pos: Tupla (fila, columna) de la posición destino
+            combustible_antes: Cantidad de combustible antes del movimiento
+            mapa: Mapa/grafo para determinar el tipo de terreno
+
+        Returns:
+            float: Costo del movimiento
+        """
+        fila, col = pos
+        celda = mapa[fila][col]
+
+        # Si tenía combustible antes del movimiento, cuesta 0.5
+        if combustible_antes > 0:
+            return 0.5
+
+        # Sin combustible, depende del terreno
+        if celda in [0, 2, 5, 6]:
+            return 1
+        elif celda == 3:
+            return 3
+        elif celda == 4:
+            return 5
+
+        return 1
+
+    def heuristic(pos, muestras_recolectadas, todas_muestras):
+        """
+        Calcula h(n): la misma heuristica admisible de A*
+        Distancia Manhattan a la muestra no recolectada más cercana por 0.5
+        (costo mínimo de un movimiento)
+        """
+        if len(muestras_recolectadas) == 3:
+            return 0
+
+        muestras_restantes = todas_muestras - muestras_recolectadas
+        min_distancia = float('inf')
+
+        for muestra in muestras_restantes:
+            distancia = abs(pos[0] - muestra[0]) + abs(pos[1] - muestra[1])
+            min_distancia = min(min_distancia, distancia)
+
+        return min_distancia * 0.5
+
+    def sucesores(estado, g):
+        """
+        Genera los sucesores de un estado con su nuevo costo g
+
+        Args:
+            estado: (posición, muestras_recolectadas, combustible, estacion_usada)
+            g: Costo real acumulado hasta el estado
+
+        Returns:
+            list: Lista de tuplas (nuevo_estado, nuevo_g)
+        """
+        pos_actual, muestras_recolectadas, combustible, estacion_usada = estado
+        resultado = []
+        for vecino in get_neighbors(pos_actual, mapa, operator_order):
+            nuevo_g = g + calcular_costo_movimiento(vecino, combustible, mapa)
+
+            nuevo_combustible = combustible
+            nueva_estacion_usada = estacion_usada
+
+            # Solo recargar si estamos en estación (5) y NO la hemos usado antes
+            if mapa[vecino[0]][vecino[1]] == 5 and not estacion_usada:
+                nuevo_combustible = 20
+                nueva_estacion_usada = True
+            elif nuevo_combustible > 0:
+                nuevo_combustible -= 1
+
+            # La muestra se recolecta al llegar a la celda
+            nuevas_muestras = muestras_recolectadas
+            if vecino in muestras and vecino not in muestras_recolectadas:
+                nuevas_muestras = frozenset(muestras_recolectadas | {vecino})
+
+            resultado.append(((vecino, nuevas_muestras, nuevo_combustible, nueva_estacion_usada), nuevo_g))
+        return resultado
+
+    muestras_iniciales = frozenset({start}) if start in muestras else frozenset()
+    estado_inicial = (start, muestras_iniciales, 0, False)
+
+    umbral = heuristic(start, muestras_iniciales, muestras)
+    nodos_expandidos = 0
+    max_profundidad = 0
+    iteraciones = []
+    # Maximo de la frontera (marcos de la pila mas sus sucesores pendientes)
+    # y de entradas en la tabla en todas las iteraciones
+    max_frontera = 1
+    max_tabla = 0
+
+    while True:
+        # Busqueda en profundidad acotada por el umbral actual.
+        # La pila guarda (estado, g, sucesores_pendientes) del camino actual,
+        # por eso la memoria de la busqueda es O(profundidad)
+        tabla = {}
+        if usar_tabla:
+            tabla[estado_inicial] = 0
+        camino = [start]
+        en_camino = {estado_inicial}
+        pila = [(estado_inicial, 0, None)]
+        # Sucesores generados y aún no visitados, sumados en todos los marcos
+        pendientes_total = 0
+        siguiente_umbral = float('inf')
+        nodos_iteracion = 0
+        solucion = None
+
+        while pila:
+            estado, g, pendientes = pila[-1]
+
+            # Verificar si recolectamos todas las muestras (OBJETIVO)
+            if len(estado[1]) == 3:
+                solucion = g
+                break
+
+            # Primera visita al nodo: generar sus sucesores dentro del umbral
+            if pendientes is None:
+                pendientes = []
+                for nuevo_estado, nuevo_g in sucesores(estado, g):
+                    f = nuevo_g + heuristic(nuevo_estado[0], nuevo_estado[1], muestras)
+                    if f > umbral:
+                        # Guardar el menor f que supera el umbral para la siguiente iteracion
+                        siguiente_umbral = min(siguiente_umbral, f)
+                        continue
+                    # Evitar ciclos en el camino actual
+                    if nuevo_estado in en_camino:
+                        continue
+                    # Podar si ya alcanzamos este estado con menor o igual costo en esta iteracion
+                    if usar_tabla and nuevo_estado in tabla and tabla[nuevo_estado] <= nuevo_g:
+                        continue
+                    pendientes.append((nuevo_estado, nuevo_g))
+
+                if pendientes:
+                    nodos_iteracion += 1
+                    pendientes_total += len(pendientes)
+                    max_frontera = max(max_frontera, len(pila) + pendientes_total)
+                # Invertir para sacar los sucesores en el orden de operadores
+                pendientes.reverse()
+                pila[-1] = (estado, g, pendientes)
+
+            if not pendientes:
+                # Retroceder: quitar el nodo del camino actual
+                pila.pop()
+                en_camino.discard(estado)
+                camino.pop()
+                continue
+
+            nuevo_estado, nuevo_g = pendientes.pop()
+            pendientes_total -= 1
+            # La tabla pudo mejorar desde que se generó este sucesor
+            if usar_tabla and nuevo_estado in tabla and tabla[nuevo_estado] <= nuevo_g:
+                continue
+            if usar_tabla and (nuevo_estado in tabla or len(tabla) < tamano_tabla):
+                tabla[nuevo_estado] = nuevo_g
+
+            pila.append((nuevo_estado, nuevo_g, None))
+            en_camino.add(nuevo_estado)
+            camino.append(nuevo_estado[0])
+            max_profundidad = max(max_profundidad, len(camino) - 1)
+
+        nodos_expandidos += nodos_iteracion
+        max_tabla = max(max_tabla, len(tabla))
+        iteraciones.append({
+            "threshold": umbral,
+            "nodes_expanded": nodos_iteracion
+        })
+
+        if solucion is not None:
+            return {
+                "path": [list(pos) for pos in camino],
+                "nodes_expanded": nodos_expandidos,
+                "cost": solucion,
+                "max_depth": max_profundidad,
+                "iterations": iteraciones,
+                "max_frontier": max_frontera,
+                "visited_states": max_tabla,
+                "message": "Solución óptima encontrada - 3 muestras recolectadas"
+            }
+
+        # Ningun nodo supero el umbral: el espacio alcanzable se agotó
+        if siguiente_umbral == float('inf'):
+            break
+        umbral = siguiente_umbral
+
+    # No se encontró solución
+    return {
+        "path": [],
+        "nodes_expanded": nodos_expandidos,
+        "cost": 0,
+        "max_depth": max_profundidad,
+        "iterations": iteraciones,
+        "max_frontier": max_frontera,
+        "visited_states": max_tabla,
+        "message": "No se encontró solución para recolectar las 3 muestras"
+    }
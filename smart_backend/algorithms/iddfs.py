@@ -0,0 +1,280 @@
+"""
+Iterative Deepening DFS (IDDFS) Algorithm
+Búsqueda en profundidad iterativa: repite DFS con límite de profundidad
+creciente. Encuentra la solución con menos movimientos (como BFS) usando
+memoria O(profundidad) (como DFS)
+"""
+
+def solve(params: dict):
+    """
+    Ejecuta IDDFS para encontrar un camino que recolecte las 3 muestras.
+    Cada iteración es un DFS limitado a 'límite' movimientos; si no encuentra
+    solución, el límite sube en 1 y se repite desde el inicio.
+
+    Args:
+        params: Diccionario con parámetros del problema
+               - map: Matriz 10x10 con valores 0-6
+               - start: Tupla (fila, columna) del inicio
+               - goal: NO SE USA, el objetivo es recolectar las 3 muestras (valor 6)
+               - operator_order: Orden de expansión de los movimientos (opcional)
+               - reuse_ordering: Explorar primero el camino más prometedor de la
+                 iteración anterior (True por defecto)
+               - max_depth_limit: Límite de profundidad máximo (100 por defecto)
+
+    Returns:
+        dict: Resultado con el camino encontrado y estadísticas, incluyendo
+              'iterations' con límite, nodos expandidos, profundidad alcanzada
+              y tamaño máximo de la pila de cada iteración
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Validaciones básicas
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Mapa inválido"
+        }
+
+    # Encontrar todas las muestras (valor 6)
+    muestras = set()
+    for i in range(10):
+        for j in range(10):
+            if mapa[i][j] == 6:
+                muestras.add((i, j))
+
+    if len(muestras) != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Se esperan 3 muestras, se encontraron {len(muestras)}"
+        }
+
+    # Obtener orden de operadores desde parámetros (opcional)
+    # Por defecto: ['arriba', 'abajo', 'izquierda', 'derecha']
+    operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
+    reusar_orden = params.get("reuse_ordering", True)
+    limite_maximo = params.get("max_depth_limit", 100)
+
+    def get_neighbors(pos, mapa, order):
+        """
+        Obtiene los vecinos válidos de una posición.
+        El orden se determina por el parámetro 'order'
+        """
+        fila, col = pos
+
+        # Mapeo de nombres a movimientos
+        movimientos = {
+            'arriba': (-1, 0),
+            'abajo': (1, 0),
+            'izquierda': (0, -1),
+            'derecha': (0, 1)
+        }
+
+        # Crear lista de direcciones según el orden especificado
+        direcciones = [movimientos[op] for op in order if op in movimientos]
+
+        vecinos = []
+        for df, dc in direcciones:
+            nueva_fila, nueva_col = fila + df, col + dc
+
+            # Verificar límites del mapa
+            if 0 <= nueva_fila < 10 and 0 <= nueva_col < 10:
+                # Verificar que no sea obstáculo (valor 1)
+                if mapa[nueva_fila][nueva_col] != 1:
+                    vecinos.append((nueva_fila, nueva_col))
+
+        return vecinos
+
+    def movimientos_restantes(pos, muestras_rec):
+        """
+        Cota inferior de movimientos para terminar: hay que llegar a todas las
+        muestras pendientes, así que al menos a la más lejana (Manhattan).
+        Permite cortar ramas que no pueden terminar dentro del límite.
+        """
+        restantes = muestras - muestras_rec
+        if not restantes:
+            return 0
+        return max(abs(pos[0] - m[0]) + abs(pos[1] - m[1]) for m in restantes)
+
+    def calcular_costo(camino):
+        """
+        Calcula el costo del camino con las reglas de combustible:
+        la nave recarga 20 movimientos a costo 0.5 una sola vez
+        """
+        costo_total = 0
+        combustible = 0
+        nave_usada = False
+
+        for fila, col in camino[1:]:
+            celda = mapa[fila][col]
+            if combustible > 0:
+                costo_total += 0.5
+                combustible -= 1
+            elif celda == 3:
+                costo_total += 3
+            elif celda == 4:
+                costo_total += 5
+            else:
+                costo_total += 1
+
+            if celda == 5 and not nave_usada:
+                combustible = 20
+                nave_usada = True
+
+        return costo_total
+
+    def dfs_limitado(limite, camino_guia):
+        """
+        DFS con límite de profundidad usando una pila explícita.
+
+        La pila solo contiene el camino actual: cada marco es
+        (posición, muestras, vecinos_pendientes, en_camino_guia), así que la
+        memoria es O(límite). Para evitar ciclos se impide repetir
+        (posición, muestras) dentro del camino actual: volver a ese par nunca
+        acorta la solución en movimientos.
+
+        Args:
+            limite: Máximo número de movimientos
+            camino_guia: Camino más prometedor de la iteración anterior (o None)
+
+        Returns:
+            tuple: (camino_solución o None, nodos, profundidad_max, pila_max,
+                    frontera_max, mejor_camino, cortado); frontera_max cuenta
+                    los marcos más los hijos pendientes de todos ellos (la
+                    lista de abiertos real) y cortado indica si alguna rama
+                    se cortó por el límite
+        """
+        muestras_iniciales = frozenset({start}) & muestras
+        camino = [start]
+        en_camino = {(start, muestras_iniciales)}
+        pila = [(start, muestras_iniciales, None, camino_guia is not None)]
+        nodos = 0
+        profundidad_max = 0
+        pila_max = 1
+        # Hijos generados y aún no visitados, sumados en todos los marcos
+        pendientes_total = 0
+        frontera_max = 1
+        # Camino que más muestras recolectó en esta iteración
+        mejor_camino = list(camino)
+        mejor_muestras = len(muestras_iniciales)
+        cortado = False
+
+        while pila:
+            pos, muestras_rec, pendientes, en_guia = pila[-1]
+            profundidad = len(camino) - 1
+
+            if len(muestras_rec) == 3:
+                return camino, nodos, profundidad_max, pila_max, frontera_max, mejor_camino, cortado
+
+            # Primera visita al marco: generar sus hijos dentro del límite
+            if pendientes is None:
+                pendientes = []
+                if profundidad + movimientos_restantes(pos, muestras_rec) > limite or profundidad >= limite:
+                    cortado = True
+                else:
+                    vecinos = get_neighbors(pos, mapa, operator_order)
+                    # Reutilizar el orden: el paso del camino guía va primero
+                    if en_guia and profundidad + 1 < len(camino_guia):
+                        siguiente = camino_guia[profundidad + 1]
+                        if siguiente in vecinos:
+                            vecinos.remove(siguiente)
+                            vecinos.insert(0, siguiente)
+                    for vecino in vecinos:
+                        nuevas = muestras_rec
+                        if vecino in muestras and vecino not in muestras_rec:
+                            nuevas = frozenset(muestras_rec | {vecino})
+                        if (vecino, nuevas) not in en_camino:
+                            pendientes.append((vecino, nuevas))
+                    if pendientes:
+                        nodos += 1
+                        pendientes_total += len(pendientes)
+                        frontera_max = max(frontera_max, len(pila) + pendientes_total)
+                # Invertir para sacar los hijos en el orden de operadores
+                pendientes.reverse()
+                pila[-1] = (pos, muestras_rec, pendientes, en_guia)
+
+            if not pendientes:
+                # Retroceder
+                pila.pop()
+                en_camino.discard((pos, muestras_rec))
+                camino.pop()
+                continue
+
+            vecino, nuevas = pendientes.pop()
+            pendientes_total -= 1
+            hijo_en_guia = (
+                en_guia and profundidad + 1 < len(camino_guia)
+                and camino_guia[profundidad + 1] == vecino
+            )
+            pila.append((vecino, nuevas, None, hijo_en_guia))
+            en_camino.add((vecino, nuevas))
+            camino.append(vecino)
+
+            profundidad_max = max(profundidad_max, len(camino) - 1)
+            pila_max = max(pila_max, len(pila))
+            if len(nuevas) > mejor_muestras:
+                mejor_muestras = len(nuevas)
+                mejor_camino = list(camino)
+
+        return None, nodos, profundidad_max, pila_max, frontera_max, mejor_camino, cortado
+
+    nodos_expandidos = 0
+    max_profundidad = 0
+    max_pila = 0
+    max_frontera = 0
+    iteraciones = []
+    camino_guia = None
+
+    # Los límites menores que la cota inicial no pueden tener solución
+    limite_inicial = movimientos_restantes(start, frozenset({start}) & muestras)
+
+    for limite in range(limite_inicial, limite_maximo + 1):
+        camino, nodos, profundidad, pila_max, frontera_max, mejor_camino, cortado = dfs_limitado(limite, camino_guia)
+        nodos_expandidos += nodos
+        max_profundidad = max(max_profundidad, profundidad)
+        max_pila = max(max_pila, pila_max)
+        max_frontera = max(max_frontera, frontera_max)
+        iteraciones.append({
+            "depth_limit": limite,
+            "nodes_expanded": nodos,
+            "max_depth": profundidad,
+            "max_stack": pila_max
+        })
+
+        if camino is not None:
+            return {
+                "path": [list(pos) for pos in camino],
+                "nodes_expanded": nodos_expandidos,
+                "cost": calcular_costo(camino),
+                "max_depth": max_profundidad,
+                "iterations": iteraciones,
+                # Los únicos estados guardados son los del camino actual (la pila)
+                "max_frontier": max_frontera,
+                "visited_states": max_pila,
+                "message": "Solución encontrada - 3 muestras recolectadas"
+            }
+
+        # Ninguna rama llegó al límite: subirlo no alcanzaría nuevos estados
+        if not cortado:
+            break
+
+        if reusar_orden:
+            camino_guia = mejor_camino
+
+    # No se encontró solución (o no dentro del límite máximo)
+    return {
+        "path": [],
+        "nodes_expanded": nodos_expandidos,
+        "cost": 0,
+        "max_depth": max_profundidad,
+        "iterations": iteraciones,
+        "max_frontier": max_frontera,
+        "visited_states": max_pila,
+        "message": "No se encontró solución para recolectar las 3 muestras"
+    }
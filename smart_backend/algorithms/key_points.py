@@ -0,0 +1,84 @@
+"""
+Key-Point Decomposition Algorithm
+Descompone el problema en tramos entre puntos clave (inicio, muestras y nave):
+calcula una vez por mapa las rutas minimas entre ellos con el modelo de
+combustible y luego busca exhaustivamente el mejor orden de visita.
+Da el mismo costo optimo que Costo Uniforme sin recorrer el espacio de estados
+"""
+
+from core.key_point_graph import get_key_point_graph
+
+
+def solve(params: dict):
+    """
+    Ejecuta la descomposicion por puntos clave para recolectar las 3 muestras.
+    Con 3 muestras y una nave hay a lo sumo 3! * 4 = 24 ordenes de visita;
+    cada uno se evalua sumando tramos precalculados.
+
+    Args:
+        params: Diccionario con parametros del problema
+               - map: Matriz 10x10 con valores 0-6
+               - start: Tupla (fila, columna) de la posicion inicial
+               - goal: NO SE USA, el objetivo es recolectar 3 muestras (valor 6)
+
+    Returns:
+        dict: Resultado con el camino optimo y estadisticas; nodes_expanded es
+              la cantidad de ordenes de visita evaluados, visit_order los puntos
+              clave en el orden elegido y cache_hit si los tramos ya existian
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Validaciones básicas
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Mapa inválido"
+        }
+
+    # Validar que haya exactamente 3 muestras
+    total_muestras = sum(fila.count(6) for fila in mapa)
+    if total_muestras != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Se esperan 3 muestras, se encontraron {total_muestras}"
+        }
+
+    fila, col = start
+    if not (0 <= fila < 10 and 0 <= col < 10) or mapa[fila][col] == 1:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Posición inicial inválida"
+        }
+
+    grafo, cache_hit = get_key_point_graph(mapa)
+    resultado = grafo.solve(start)
+
+    if resultado["cost"] == float('inf'):
+        return {
+            "path": [],
+            "nodes_expanded": resultado["orderings"],
+            "cost": 0,
+            "max_depth": 0,
+            "cache_hit": cache_hit,
+            "message": "No se encontró solución para recolectar las 3 muestras"
+        }
+
+    return {
+        "path": [list(pos) for pos in resultado["path"]],
+        "nodes_expanded": resultado["orderings"],
+        "cost": resultado["cost"],
+        "max_depth": len(resultado["path"]) - 1,
+        "visit_order": [list(pos) for pos in resultado["order"]],
+        "cache_hit": cache_hit,
+        "message": "Solución óptima encontrada - 3 muestras recolectadas"
+    }
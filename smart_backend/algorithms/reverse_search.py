@@ -0,0 +1,90 @@
+"""
+Reverse Search (Cost-To-Go) Algorithm
+Busqueda inversa desde la meta: una sola busqueda de Dijkstra hacia atras
+calcula el costo optimo restante de todos los estados, y la tabla se guarda
+por mapa. Cualquier posicion inicial se resuelve luego en O(largo del camino)
+"""
+
+from core.cost_to_go import build_cost_to_go
+from core.map_cache import map_cache
+
+
+def solve(params: dict):
+    """
+    Resuelve el problema de las 3 muestras consultando la tabla de costo
+    hasta la meta del mapa. La primera llamada sobre un mapa construye la
+    tabla (busqueda inversa completa); las siguientes, con cualquier inicio,
+    solo reconstruyen el camino.
+
+    Args:
+        params: Diccionario con parametros del problema
+               - map: Matriz 10x10 con valores 0-6
+               - start: Tupla (fila, columna) de la posicion inicial
+               - goal: NO SE USA, el objetivo es recolectar 3 muestras (valor 6)
+               - include_table: Incluir la matriz de costos de todas las
+                 posiciones iniciales (False por defecto)
+
+    Returns:
+        dict: Resultado con el camino optimo y estadisticas; nodes_expanded
+              y max_frontier son los estados asentados y el tamano maximo del
+              heap al construir la tabla (0 si vino de la cache),
+              visited_states los estados guardados en la tabla y cache_hit
+              indica si la tabla ya existia
+    """
+    mapa = params.get("map", [])
+    start = tuple(params.get("start", [0, 0]))
+
+    # Validaciones básicas
+    if not mapa or len(mapa) != 10 or len(mapa[0]) != 10:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": "Mapa inválido"
+        }
+
+    # Validar que haya exactamente 3 muestras
+    total_muestras = sum(fila.count(6) for fila in mapa)
+    if total_muestras != 3:
+        return {
+            "path": [],
+            "nodes_expanded": 0,
+            "cost": 0,
+            "max_depth": 0,
+            "message": f"Error: Se esperan 3 muestras, se encontraron {total_muestras}"
+        }
+
+    tabla, cache_hit = map_cache.get(mapa, "cost_to_go", lambda: build_cost_to_go(mapa))
+    nodos_expandidos = 0 if cache_hit else tabla.nodes_expanded
+
+    resultado = {
+        "path": [],
+        "nodes_expanded": nodos_expandidos,
+        "cost": 0,
+        "max_depth": 0,
+        "max_frontier": 0 if cache_hit else tabla.max_frontier,
+        "visited_states": tabla.visited_states,
+        "cache_hit": cache_hit,
+        "message": "No se encontró solución para recolectar las 3 muestras"
+    }
+    if params.get("include_table", False):
+        resultado["cost_table"] = tabla.table()
+
+    fila, col = start
+    if not (0 <= fila < 10 and 0 <= col < 10) or mapa[fila][col] == 1:
+        resultado["message"] = "Posición inicial inválida"
+        return resultado
+
+    costo = tabla.cost(start)
+    if costo is None:
+        return resultado
+
+    camino = tabla.path(start)
+    resultado.update({
+        "path": [list(pos) for pos in camino],
+        "cost": costo,
+        "max_depth": len(camino) - 1,
+        "message": "Solución óptima encontrada - 3 muestras recolectadas"
+    })
+    return resultado
@@ -3,6 +3,9 @@ Uniform Cost Search Algorithm
 Busqueda de costo uniforme para encontrar el camino de menor costo
 """
 
+from algorithms import greedy
+from core.heuristics import get_fuel_aware_heuristic
+
 def solve(params: dict):
     """
     Ejecuta el algoritmo de Costo Uniforme
@@ -12,6 +15,11 @@ def solve(params: dict):
                - map: Mapa/grafo a resolver
                - start: Nodo inicial
                - goal: Nodo objetivo
+               - dominance_pruning: Poda por dominancia de combustible (True por defecto)
+               - upper_bound: Ramificación y poda con la solución de Avara como
+                 cota superior inicial (False por defecto)
+               - bound_heuristic: Podar por g + h (heurística admisible) en lugar
+                 de solo g al comparar con la cota (True por defecto)
     
     Returns:
         dict: Resultado con el camino encontrado y estadisticas
@@ -50,6 +58,21 @@ def solve(params: dict):
     # Por defecto: ['arriba', 'abajo', 'izquierda', 'derecha']
     operator_order = params.get("operator_order", ['arriba', 'abajo', 'izquierda', 'derecha'])
     
+    # Poda por dominancia: dos estados en la misma celda, con las mismas muestras
+    # y el mismo uso de la nave solo difieren en combustible. Si uno tiene costo
+    # menor o igual y combustible mayor o igual, el otro nunca puede terminar en
+    # una solucion mas barata (el combustible solo abarata movimientos futuros)
+    poda_dominancia = params.get("dominance_pruning", True)
+    
+    # Ramificación y poda: Avara da rápido una solución (incumbente) y se
+    # descartan los sucesores cuyo costo, o cota inferior g + h, ya no puede
+    # mejorarla. Cada solución más barata que se genere baja la incumbente.
+    # Con solo g casi no se poda (Costo Uniforme termina antes de sacar estados
+    # con costo mayor al óptimo); con g + h se podan estados más baratos que
+    # el óptimo que igual no pueden llevar a una solución mejor
+    usar_cota = params.get("upper_bound", False)
+    cota_con_heuristica = params.get("bound_heuristic", True)
+    
     def get_neighbors(pos, mapa, order):
         """
         Obtiene los vecinos válidos de una posición.
@@ -119,16 +142,84 @@ def solve(params: dict):
         
         return 1
     
+    def es_dominado(frente, costo, combustible):
+        """
+        Verifica si la etiqueta (costo, combustible) esta dominada por el frente
+        
+        Args:
+            frente: Lista de etiquetas (costo, combustible) no dominadas
+            costo: Costo acumulado de la nueva etiqueta
+            combustible: Combustible restante de la nueva etiqueta
+
+        Returns:
+            bool: True si alguna etiqueta del frente es igual o mejor en ambos
+        """
+        for costo_frente, combustible_frente in frente:
+            if costo_frente <= costo and combustible_frente >= combustible:
+                return True
+        return False
+    
+    def costo_camino(camino):
+        """
+        Calcula el costo de un camino con las reglas de combustible
+        (la nave recarga una sola vez)
+        """
+        costo = 0
+        combustible = 0
+        estacion_usada = False
+        for pos in camino[1:]:
+            costo += calcular_costo_movimiento(pos, combustible, mapa)
+            if mapa[pos[0]][pos[1]] == 5 and not estacion_usada:
+                combustible = 20
+                estacion_usada = True
+            elif combustible > 0:
+                combustible -= 1
+        return costo
+    
+    # Solución incumbente para la ramificación y poda
+    mejor_camino = None
+    costo_incumbente = float('inf')
+    heuristica = None
+    if usar_cota:
+        solucion_avara = greedy.solve({"map": mapa, "start": list(start), "heuristic": "grid_distance"})
+        if solucion_avara["path"]:
+            mejor_camino = [tuple(pos) for pos in solucion_avara["path"]]
+            # Se recalcula el costo con las reglas de este algoritmo
+            costo_incumbente = costo_camino(mejor_camino)
+        if cota_con_heuristica:
+            heuristica = get_fuel_aware_heuristic(mapa)
+    cota_inicial = costo_incumbente
+    mejoras_incumbente = 0
+    nodos_acotados = 0
+    
+    def estadisticas_cota():
+        """Estadísticas de la ramificación y poda para el resultado"""
+        if not usar_cota:
+            return {"bound_pruned": 0}
+        return {
+            "bound_pruned": nodos_acotados,
+            "initial_upper_bound": cota_inicial if cota_inicial != float('inf') else None,
+            "upper_bound_updates": mejoras_incumbente
+        }
+    
     # Estado: (posición, muestras_recolectadas, combustible, estacion_usada)
     estado_inicial = (start, frozenset(), 0, False)
     # Cola de prioridad: lista de tuplas (estado, camino, costo_acumulado)
     cola_prioridad = [(estado_inicial, [start], 0)]
-    # Seguimiento de visitados
-    visitados = {estado_inicial}
+    # Mejor costo conocido por estado: un estado ya generado se vuelve a
+    # agregar si aparece un camino más barato (marcarlo como visitado al
+    # generarlo descartaba ese camino y el costo final podía no ser óptimo)
+    mejor_costo = {estado_inicial: 0}
+    # Frente de Pareto de (costo, combustible) por (posición, muestras, estacion_usada)
+    frentes = {(start, frozenset(), False): [(0, 0)]}
+    nodos_podados = 0
     nodos_expandidos = 0
     max_profundidad = 0
+    # Tamaño máximo de la cola (incluye entradas que luego se descartan)
+    max_frontera = 0
 
     while cola_prioridad:
+        max_frontera = max(max_frontera, len(cola_prioridad))
         # Extraer el nodo con el menor costo, para ordenar por costo
         cola_prioridad.sort(key=lambda x: x[2])
         
@@ -136,6 +227,16 @@ def solve(params: dict):
         # - estado_actual: (0: posición, 1: muestras, 2: combustible, 3: estación usada)
         # - (0: estado_actual, 1: camino, 2: costo_acumulado)
         (pos_actual, muestras_recolectadas, combustible, estacion_usada), camino, costo_acumulado = cola_prioridad.pop(0)
+        
+        # Si una etiqueta generada despues domino a este estado, ya salio del frente
+        if poda_dominancia and (costo_acumulado, combustible) not in frentes[(pos_actual, muestras_recolectadas, estacion_usada)]:
+            nodos_podados += 1
+            continue
+        
+        # Entrada obsoleta: el estado se volvió a agregar con menor costo
+        if costo_acumulado > mejor_costo[(pos_actual, muestras_recolectadas, combustible, estacion_usada)]:
+            continue
+        
         max_profundidad = max(max_profundidad, len(camino)) - 1
         
         # Verificar si estamos en una muestra y aún no la hemos recolectado
@@ -152,6 +253,10 @@ def solve(params: dict):
                 "nodes_expanded": nodos_expandidos,
                 "cost": costo_acumulado,  # Usar costo acumulado real
                 "max_depth": max_profundidad,
+                "dominance_pruned": nodos_podados,
+                "max_frontier": max_frontera,
+                "visited_states": len(mejor_costo),
+                **estadisticas_cota(),
                 "message": "Solución encontrada - 3 muestras recolectadas"
             }
         
@@ -179,10 +284,38 @@ def solve(params: dict):
             
             nuevo_estado = (vecino, muestras_recolectadas, nuevo_combustible, nueva_estacion_usada)
             
-            # Solo visitamos si no hemos estado en este estado exacto
+            if usar_cota:
+                # Un sucesor que completa las muestras es una solución: si es
+                # más barata que la incumbente la reemplaza y no hace falta encolarlo
+                if vecino in muestras and len(muestras_recolectadas | {vecino}) == 3:
+                    if nuevo_costo < costo_incumbente:
+                        costo_incumbente = nuevo_costo
+                        mejor_camino = camino + [vecino]
+                        mejoras_incumbente += 1
+                    continue
+                cota = nuevo_costo
+                if heuristica is not None:
+                    cota += heuristica.cost(vecino, muestras_recolectadas, nuevo_combustible, nueva_estacion_usada)
+                if cota >= costo_incumbente:
+                    nodos_acotados += 1
+                    continue
+            
+            # Solo agregamos estados nuevos o alcanzados con menor costo
             # PERO permitimos revisitar posiciones con diferentes estados de muestras/combustible
-            if nuevo_estado not in visitados:
-                visitados.add(nuevo_estado)
+            if nuevo_estado not in mejor_costo or nuevo_costo < mejor_costo[nuevo_estado]:
+                if poda_dominancia:
+                    clave = (vecino, muestras_recolectadas, nueva_estacion_usada)
+                    frente = frentes.setdefault(clave, [])
+                    if es_dominado(frente, nuevo_costo, nuevo_combustible):
+                        nodos_podados += 1
+                        continue
+                    # Retirar del frente las etiquetas que la nueva domina
+                    frente[:] = [
+                        (c, f) for c, f in frente
+                        if not (nuevo_costo <= c and nuevo_combustible >= f)
+                    ]
+                    frente.append((nuevo_costo, nuevo_combustible))
+                mejor_costo[nuevo_estado] = nuevo_costo
                 cola_prioridad.append((nuevo_estado, camino + [vecino], nuevo_costo))  # Agregar nuevo_costo
                 vecinos_agregados += 1
         
@@ -190,11 +323,29 @@ def solve(params: dict):
         if vecinos_agregados > 0:
             nodos_expandidos += 1
                             
+    # Se agotó la cola: si hay incumbente, ningún estado podado podía mejorarla
+    if mejor_camino is not None:
+        return {
+            "path": [list(pos) for pos in mejor_camino],
+            "nodes_expanded": nodos_expandidos,
+            "cost": costo_incumbente,
+            "max_depth": max_profundidad,
+            "dominance_pruned": nodos_podados,
+            "max_frontier": max_frontera,
+            "visited_states": len(mejor_costo),
+            **estadisticas_cota(),
+            "message": "Solución encontrada - 3 muestras recolectadas"
+        }
+    
     # No se encontró solución
     return {
         "path": [],
         "nodes_expanded": nodos_expandidos,
         "cost": 0,
         "max_depth": max_profundidad,
+        "dominance_pruned": nodos_podados,
+        "max_frontier": max_frontera,
+        "visited_states": len(mejor_costo),
+        **estadisticas_cota(),
         "message": "No se encontró solución para recolectar las 3 muestras"
     }
\ No newline at end of file
@@ -1,11 +1,15 @@
+import hashlib
+import json
 import os
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 
+from core.etag import etag_matches, json_with_etag, not_modified
 from core.executor import run_algorithm, get_algorithm_info
 from routes.map_routes import router as map_router
+from routes.route_routes import router as route_router
 
 # Aplicación principal del backend Smart Astronaut
 app = FastAPI(title="SmartAstronaut Backend", version="1.0.0")
@@ -24,6 +28,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
@@ -31,6 +36,14 @@ app.add_middleware(
 class AlgorithmRequest(BaseModel):
     algorithm: str
     params: Optional[Dict[str, Any]] = {}
+    # Perfilado con cProfile (solo si ENABLE_PROFILING esta activo en el servidor)
+    profile: bool = False
+    profile_top: int = 20
+
+
+def profiling_enabled() -> bool:
+    """El perfilado por solicitud se habilita con ENABLE_PROFILING=1 (o true)"""
+    return os.getenv("ENABLE_PROFILING", "").lower() in ("1", "true", "yes")
 
 
 @app.get("/")
@@ -44,10 +57,14 @@ async def health_check():
 
 
 @app.get("/api/algorithms")
-async def list_algorithms():
+async def list_algorithms(if_none_match: Optional[str] = Header(None)):
     """
     Lista todos los algoritmos disponibles
     
+    La lista solo cambia si cambian los archivos de algorithms/, asi que se
+    construye una vez por (nombre, fecha de modificacion) de los archivos y se
+    responde 304 si el cliente ya tiene esa version.
+    
     Returns:
         Lista de algoritmos con su informacion
     """
@@ -58,50 +75,92 @@ async def list_algorithms():
         if not os.path.exists(algorithms_dir):
             return {"algorithms": [], "error": "Directorio de algoritmos no encontrado"}
         
-        files = [
+        files = sorted(
             f[:-3] for f in os.listdir(algorithms_dir) 
             if f.endswith(".py") and f != "__init__.py"
-        ]
+        )
         
-        # Obtener informacion detallada de cada algoritmo
-        algorithms_list = []
-        for name in files:
-            info = get_algorithm_info(name)
-            # Crear display_name según el enunciado del proyecto
-            display_names = {
-                "bfs": "Amplitud",
-                "dfs": "Profundidad evitando ciclos",
-                "uniform_cost": "Costo Uniforme",
-                "greedy": "Avara",
-                "astar": "A*"
-            }
-            
-            algorithms_list.append({
-                "name": name,
-                "display_name": display_names.get(name, name.upper()),
-                "description": info.get("docstring", "Sin descripción"),
-                "available": info.get("available", False)
-            })
+        signature = tuple(
+            (name, os.stat(os.path.join(algorithms_dir, f"{name}.py")).st_mtime_ns) for name in files
+        )
+        if _algorithms_cache.get("signature") != signature:
+            body = _build_algorithms_list(files)
+            digest = hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()[:20]
+            _algorithms_cache.update(signature=signature, body=body, etag=f'"{digest}"')
         
-        return {
-            "algorithms": algorithms_list,
-            "count": len(algorithms_list)
-        }
+        etag = _algorithms_cache["etag"]
+        if etag_matches(etag, if_none_match):
+            return not_modified(etag)
+        
+        return json_with_etag(_algorithms_cache["body"], etag)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listando algoritmos: {str(e)}")
 
 
+# Ultima lista de algoritmos construida: signature, body y etag
+_algorithms_cache: Dict[str, Any] = {}
+
+
+def _build_algorithms_list(files: list) -> Dict[str, Any]:
+    """
+    Construye la respuesta de /api/algorithms
+    
+    Args:
+        files: Nombres de los modulos de algorithms/
+        
+    Returns:
+        Diccionario con algorithms y count
+    """
+    # Crear display_name según el enunciado del proyecto
+    display_names = {
+        "bfs": "Amplitud",
+        "dfs": "Profundidad evitando ciclos",
+        "uniform_cost": "Costo Uniforme",
+        "greedy": "Avara",
+        "astar": "A*",
+        "ida_star": "IDA*",
+        "ara_star": "ARA* (anytime)",
+        "beam_search": "Búsqueda en haz",
+        "iddfs": "Profundidad iterativa",
+        "reverse_search": "Búsqueda inversa (todas las posiciones)",
+        "key_points": "Puntos clave (orden de visita)"
+    }
+    
+    # Obtener informacion detallada de cada algoritmo
+    algorithms_list = []
+    for name in files:
+        info = get_algorithm_info(name)
+        algorithms_list.append({
+            "name": name,
+            "display_name": display_names.get(name, name.upper()),
+            "description": info.get("docstring", "Sin descripción"),
+            "available": info.get("available", False)
+        })
+    
+    return {
+        "algorithms": algorithms_list,
+        "count": len(algorithms_list)
+    }
+
+
 @app.post("/api/run")
 async def run_algorithm_endpoint(data: AlgorithmRequest):
     """
     Ejecuta un algoritmo especifico
     
     Args:
-        data: Objeto con el nombre del algoritmo y sus parametros
+        data: Objeto con el nombre del algoritmo y sus parametros; con
+              profile=true la respuesta incluye "profile" (requiere
+              ENABLE_PROFILING; los .pstats se guardan en PROFILE_DIR)
     
     Returns:
         Resultado de la ejecucion del algoritmo
     """
+    if data.profile and not profiling_enabled():
+        raise HTTPException(status_code=403, detail="Perfilado deshabilitado: defina ENABLE_PROFILING=1")
+    if data.profile and data.profile_top < 1:
+        raise HTTPException(status_code=400, detail="profile_top debe ser al menos 1")
+    
     try:
         algorithm_name = data.algorithm
         params = data.params or {}
@@ -110,7 +169,7 @@ async def run_algorithm_endpoint(data: AlgorithmRequest):
             raise HTTPException(status_code=400, detail="Nombre de algoritmo requerido")
         
         # Ejecutar el algoritmo
-        result = run_algorithm(algorithm_name, params)
+        result = run_algorithm(algorithm_name, params, profile=data.profile, profile_top=data.profile_top)
         
         # Si hay error en la ejecucion
         if "error" in result:
@@ -141,3 +200,6 @@ async def get_algorithm_details(name: str):
 
 # Incluir router de mapas
 app.include_router(map_router, prefix="/api/map", tags=["maps"])
+
+# Incluir router de rutas punto a punto
+app.include_router(route_router, prefix="/api/route", tags=["route"])
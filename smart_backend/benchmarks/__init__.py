@@ -0,0 +1,2 @@
+# Benchmarks module
+# Scripts de medicion de rendimiento de los algoritmos de busqueda
@@ -0,0 +1,83 @@
+"""
+A* Heuristics Benchmark
+Compara nodos expandidos y latencia de A* con cada heuristica en los mapas mapa*.txt
+
+La latencia en frio incluye construir las tablas del mapa (cache vacia); la
+latencia en caliente es la mediana de varias ejecuciones con las tablas ya
+guardadas, que es el caso normal al repetir /api/run sobre el mismo mapa.
+
+Uso (desde smart_backend/):
+    python -m benchmarks.astar_heuristics [--repeats 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from algorithms import astar
+from benchmarks.maps import find_start, load_bundled_maps
+from core.map_cache import map_cache
+
+HEURISTICS = ["manhattan", "alt", "mst", "subset_dp", "fuel_aware"]
+
+
+def run(grid, start, heuristic: str, repeats: int) -> dict:
+    """
+    Ejecuta A* con una heuristica midiendo la latencia en frio y en caliente
+
+    Args:
+        grid: Matriz del mapa
+        start: Posicion inicial
+        heuristic: Nombre de la heuristica
+        repeats: Ejecuciones para la mediana en caliente
+
+    Returns:
+        Diccionario con cost, nodes_expanded, cold_ms y warm_ms
+    """
+    params = {"map": grid, "start": start, "heuristic": heuristic}
+
+    map_cache.clear()
+    start_time = time.perf_counter()
+    result = astar.solve(params)
+    cold = time.perf_counter() - start_time
+
+    warm = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        astar.solve(params)
+        warm.append(time.perf_counter() - start_time)
+
+    return {
+        "cost": result["cost"],
+        "nodes_expanded": result["nodes_expanded"],
+        "cold_ms": cold * 1000,
+        "warm_ms": statistics.median(warm) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=20,
+                        help="Ejecuciones para la mediana en caliente")
+    args = parser.parse_args()
+
+    print(f"{'mapa':<10} {'heuristica':<10} {'costo':>6} {'nodos':>6} {'frio ms':>8} {'caliente ms':>12}")
+    totals = {name: {"nodes_expanded": 0, "warm_ms": 0.0} for name in HEURISTICS}
+
+    for name, grid in load_bundled_maps().items():
+        start = find_start(grid)
+        for heuristic in HEURISTICS:
+            stats = run(grid, start, heuristic, args.repeats)
+            totals[heuristic]["nodes_expanded"] += stats["nodes_expanded"]
+            totals[heuristic]["warm_ms"] += stats["warm_ms"]
+            print(f"{name:<10} {heuristic:<10} {stats['cost']:>6} {stats['nodes_expanded']:>6} "
+                  f"{stats['cold_ms']:>8.2f} {stats['warm_ms']:>12.2f}")
+
+    print()
+    for heuristic, total in totals.items():
+        print(f"{heuristic:<10} nodos totales {total['nodes_expanded']}, "
+              f"caliente total {total['warm_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
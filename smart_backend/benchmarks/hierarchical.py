@@ -0,0 +1,101 @@
+"""
+Hierarchical Routing Benchmark
+Compara HPA* (core/hierarchical.py) con Dijkstra bidireccional plano en mapas generados grandes
+
+Para cada tamano se mide el tiempo de construir la abstraccion (una vez por
+mapa), la mediana de las consultas con la abstraccion ya en cache, la
+mediana de la busqueda plana y la diferencia de costo contra el optimo.
+
+Uso (desde smart_backend/):
+    python -m benchmarks.hierarchical [--sizes 256 1024] [--queries 5] [--cluster-size 16] [--seed 0]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.maps import generate_map
+from core.hierarchical import ClusterAbstraction, find_route_hierarchical
+from core.map_cache import map_cache
+from core.routing import find_route
+
+
+def run(size: int, queries: int, cluster_size: int, seed: int) -> dict:
+    """
+    Ejecuta el benchmark sobre un mapa generado
+
+    Args:
+        size: Filas y columnas del mapa
+        queries: Cantidad de pares inicio/objetivo aleatorios
+        cluster_size: Lado de los clusters
+        seed: Semilla del mapa y de las consultas
+
+    Returns:
+        Diccionario con build_s, entrances, hpa_ms, flat_ms, mean_gap y max_gap
+        (gap = costo HPA* / costo optimo - 1), nodos expandidos medios de cada uno
+    """
+    grid = generate_map(seed, size=size, obstacle_density=0.2)
+    rng = random.Random(seed)
+    free = [(i, j) for i in range(size) for j in range(size) if grid[i][j] != 1]
+
+    map_cache.clear()
+    start_time = time.perf_counter()
+    abstraction = ClusterAbstraction(grid, cluster_size)
+    build = time.perf_counter() - start_time
+    # Deja la abstraccion en la cache para medir solo las consultas
+    map_cache.get(grid, ("hpa", cluster_size), lambda: abstraction)
+
+    hpa_times, flat_times, gaps = [], [], []
+    hpa_nodes, flat_nodes = [], []
+    while len(gaps) < queries:
+        start, goal = rng.sample(free, 2)
+
+        start_time = time.perf_counter()
+        route = find_route_hierarchical(grid, start, goal, cluster_size=cluster_size)
+        hpa_times.append(time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        flat = find_route(grid, start, goal, mode="terrain")
+        flat_times.append(time.perf_counter() - start_time)
+
+        if flat["path"]:
+            gaps.append(route["cost"] / flat["cost"] - 1)
+            hpa_nodes.append(route["nodes_expanded"])
+            flat_nodes.append(flat["nodes_expanded"])
+
+    return {
+        "build_s": build,
+        "entrances": abstraction.node_count,
+        "hpa_ms": statistics.median(hpa_times) * 1000,
+        "flat_ms": statistics.median(flat_times) * 1000,
+        "hpa_nodes": statistics.mean(hpa_nodes),
+        "flat_nodes": statistics.mean(flat_nodes),
+        "mean_gap": statistics.mean(gaps),
+        "max_gap": max(gaps),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024],
+                        help="Tamanos de mapa a generar")
+    parser.add_argument("--queries", type=int, default=5,
+                        help="Consultas con ruta por mapa")
+    parser.add_argument("--cluster-size", type=int, default=16,
+                        help="Lado de los clusters")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla de los mapas y las consultas")
+    args = parser.parse_args()
+
+    print(f"{'tamano':>6} {'entradas':>8} {'constr s':>9} {'HPA* ms':>8} {'plano ms':>9} "
+          f"{'nodos HPA*':>10} {'nodos plano':>11} {'gap medio':>9} {'gap max':>8}")
+    for size in args.sizes:
+        stats = run(size, args.queries, args.cluster_size, args.seed)
+        print(f"{size:>6} {stats['entrances']:>8} {stats['build_s']:>9.2f} {stats['hpa_ms']:>8.1f} "
+              f"{stats['flat_ms']:>9.1f} {stats['hpa_nodes']:>10.0f} {stats['flat_nodes']:>11.0f} "
+              f"{stats['mean_gap']:>9.2%} {stats['max_gap']:>8.2%}")
+
+
+if __name__ == "__main__":
+    main()
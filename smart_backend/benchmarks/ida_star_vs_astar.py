@@ -0,0 +1,80 @@
+"""
+IDA* vs A* Benchmark
+Compara memoria pico y tiempo de ida_star contra astar en mapas generados
+
+Uso (desde smart_backend/):
+    python -m benchmarks.ida_star_vs_astar [--maps 20] [--seed 0]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from algorithms import astar, ida_star
+from benchmarks.maps import find_start, generate_map
+
+
+def measure(solve, params: dict) -> dict:
+    """
+    Ejecuta un solver midiendo tiempo y memoria pico
+
+    El tiempo se mide en una ejecucion sin tracemalloc (que agrega
+    sobrecosto) y la memoria en una segunda ejecucion.
+
+    Args:
+        solve: Funcion solve(params) del algoritmo
+        params: Parametros del problema
+
+    Returns:
+        Diccionario con time_ms, peak_kib, cost y nodes_expanded
+    """
+    start_time = time.perf_counter()
+    result = solve(params)
+    elapsed = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    solve(params)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time_ms": elapsed * 1000,
+        "peak_kib": peak / 1024,
+        "cost": result["cost"],
+        "nodes_expanded": result["nodes_expanded"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--maps", type=int, default=20, help="Cantidad de mapas generados")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del primer mapa")
+    parser.add_argument("--table-size", type=int, default=50000,
+                        help="Tamano de la tabla de transposicion de IDA*")
+    args = parser.parse_args()
+
+    solvers = {
+        "astar": (astar.solve, {}),
+        "ida_star": (ida_star.solve, {"transposition_table_size": args.table_size}),
+    }
+
+    print(f"{'seed':>6} {'algoritmo':<10} {'costo':>7} {'nodos':>8} {'tiempo ms':>10} {'pico KiB':>10}")
+    totals = {name: {"time_ms": 0.0, "peak_kib": 0.0} for name in solvers}
+
+    for seed in range(args.seed, args.seed + args.maps):
+        grid = generate_map(seed)
+        params = {"map": grid, "start": find_start(grid)}
+        for name, (solve, extra) in solvers.items():
+            stats = measure(solve, {**params, **extra})
+            totals[name]["time_ms"] += stats["time_ms"]
+            totals[name]["peak_kib"] = max(totals[name]["peak_kib"], stats["peak_kib"])
+            print(f"{seed:>6} {name:<10} {stats['cost']:>7} {stats['nodes_expanded']:>8} "
+                  f"{stats['time_ms']:>10.1f} {stats['peak_kib']:>10.1f}")
+
+    print()
+    for name, total in totals.items():
+        print(f"{name:<10} tiempo total {total['time_ms']:.1f} ms, pico maximo {total['peak_kib']:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Incremental Replanning Benchmark
+Compara la reparacion de D* Lite con una busqueda completa tras editar pocas celdas
+
+Simula un recorrido: en cada ronda el astronauta avanza unos pasos por la
+ruta actual y se editan algunas celdas de la ruta por delante (derrumbes que
+agregan obstaculos o terreno volcanico) y de su entorno (caminos despejados).
+Se mide la reparacion de D* Lite contra Dijkstra bidireccional y A* con
+Manhattan desde cero sobre el mapa editado, verificando que el costo coincida.
+
+Uso (desde smart_backend/):
+    python -m benchmarks.incremental [--sizes 64 128 256] [--rounds 20] [--edits 3] [--seed 0]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.maps import generate_map
+from core.incremental import DStarLite
+from core.routing import find_route
+
+
+def run(size: int, rounds: int, edits: int, seed: int) -> dict:
+    """
+    Ejecuta el recorrido simulado sobre un mapa generado
+
+    Args:
+        size: Filas y columnas del mapa
+        rounds: Rondas de edicion y replanificacion
+        edits: Celdas editadas por ronda
+        seed: Semilla del mapa, el recorrido y las ediciones
+
+    Returns:
+        Diccionario con initial_ms, tiempos medianos y nodos totales de la
+        reparacion y de cada busqueda completa
+    """
+    grid = generate_map(seed, size=size, obstacle_density=0.2)
+    rng = random.Random(seed)
+    free = [(i, j) for i in range(size) for j in range(size) if grid[i][j] != 1]
+    start, goal = rng.sample(free, 2)
+
+    planner = DStarLite(grid, start, goal)
+    start_time = time.perf_counter()
+    planner.compute()
+    initial = time.perf_counter() - start_time
+
+    times = {"dstar_lite": [], "dijkstra": [], "astar": []}
+    nodes = {"dstar_lite": 0, "dijkstra": 0, "astar": 0}
+    current = start
+    for _ in range(rounds):
+        path = planner.path()
+        if len(path) < 8:
+            break
+        current = path[min(3, len(path) - 5)]
+        planner.move_start(current)
+
+        changes = []
+        ahead = path[path.index(current) + 2:]
+        for _ in range(edits):
+            if rng.random() < 0.6:
+                r, c = rng.choice(ahead[:10])
+                value = rng.choice([1, 1, 4])
+            else:
+                r = min(max(current[0] + rng.randint(-5, 5), 0), size - 1)
+                c = min(max(current[1] + rng.randint(-5, 5), 0), size - 1)
+                value = 0
+            if (r, c) not in (current, goal):
+                grid[r][c] = value
+                changes.append((r, c, value))
+        planner.update_cells(changes)
+
+        start_time = time.perf_counter()
+        nodes["dstar_lite"] += planner.compute()
+        times["dstar_lite"].append(time.perf_counter() - start_time)
+
+        for name, kwargs in (("dijkstra", {}), ("astar", {"heuristic": "manhattan"})):
+            start_time = time.perf_counter()
+            result = find_route(grid, current, goal, **kwargs)
+            times[name].append(time.perf_counter() - start_time)
+            nodes[name] += result["nodes_expanded"]
+            if result["path"]:
+                assert result["cost"] == planner.cost(), "D* Lite debe dar el costo optimo"
+
+    return {
+        "initial_ms": initial * 1000,
+        "rounds": len(times["dstar_lite"]),
+        **{f"{name}_ms": statistics.median(values) * 1000 for name, values in times.items()},
+        **{f"{name}_nodes": total for name, total in nodes.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256],
+                        help="Tamanos de mapa a generar")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="Rondas de edicion por mapa")
+    parser.add_argument("--edits", type=int, default=3,
+                        help="Celdas editadas por ronda")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla de los mapas y las ediciones")
+    args = parser.parse_args()
+
+    print(f"{'tamano':>6} {'rondas':>6} {'inicial ms':>10} {'D* Lite ms':>10} {'Dijkstra ms':>11} "
+          f"{'A* ms':>7} {'nodos D* Lite':>13} {'nodos Dijkstra':>14} {'nodos A*':>9}")
+    for size in args.sizes:
+        stats = run(size, args.rounds, args.edits, args.seed)
+        print(f"{size:>6} {stats['rounds']:>6} {stats['initial_ms']:>10.1f} {stats['dstar_lite_ms']:>10.2f} "
+              f"{stats['dijkstra_ms']:>11.2f} {stats['astar_ms']:>7.2f} {stats['dstar_lite_nodes']:>13} "
+              f"{stats['dijkstra_nodes']:>14} {stats['astar_nodes']:>9}")
+
+
+if __name__ == "__main__":
+    main()
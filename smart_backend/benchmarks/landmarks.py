@@ -0,0 +1,87 @@
+"""
+Landmarks (ALT) Benchmark
+Compara A* con cotas de landmarks contra A* con Manhattan en consultas punto a punto repetidas
+
+Para cada tamano se genera un mapa, se mide el preprocesamiento de la tabla
+de landmarks (una vez por mapa) y luego, para los mismos pares aleatorios de
+celdas, la mediana de tiempo y los nodos expandidos de cada heuristica.
+
+Uso (desde smart_backend/):
+    python -m benchmarks.landmarks [--sizes 64 256] [--queries 20] [--landmarks 8] [--seed 0]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.maps import generate_map
+from core.landmarks import get_landmark_table
+from core.map_cache import map_cache
+from core.routing import find_route
+
+
+def run(size: int, queries: int, landmarks: int, seed: int) -> dict:
+    """
+    Ejecuta el benchmark sobre un mapa generado
+
+    Args:
+        size: Filas y columnas del mapa
+        queries: Cantidad de pares inicio/objetivo aleatorios
+        landmarks: Cantidad de landmarks
+        seed: Semilla del mapa y de las consultas
+
+    Returns:
+        Diccionario con build_ms, manhattan_ms, alt_ms, manhattan_nodes y alt_nodes
+    """
+    grid = generate_map(seed, size=size, obstacle_density=0.2)
+    rng = random.Random(seed)
+    free = [(i, j) for i in range(size) for j in range(size) if grid[i][j] != 1]
+
+    map_cache.clear()
+    start_time = time.perf_counter()
+    get_landmark_table(grid, landmarks, "terrain")
+    build = time.perf_counter() - start_time
+
+    times = {"manhattan": [], "alt": []}
+    nodes = {"manhattan": 0, "alt": 0}
+    for _ in range(queries):
+        start, goal = rng.sample(free, 2)
+        for heuristic in times:
+            start_time = time.perf_counter()
+            result = find_route(grid, start, goal, heuristic=heuristic, landmarks=landmarks)
+            times[heuristic].append(time.perf_counter() - start_time)
+            nodes[heuristic] += result["nodes_expanded"]
+
+    return {
+        "build_ms": build * 1000,
+        "manhattan_ms": statistics.median(times["manhattan"]) * 1000,
+        "alt_ms": statistics.median(times["alt"]) * 1000,
+        "manhattan_nodes": nodes["manhattan"],
+        "alt_nodes": nodes["alt"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256],
+                        help="Tamanos de mapa a generar")
+    parser.add_argument("--queries", type=int, default=20,
+                        help="Consultas por mapa")
+    parser.add_argument("--landmarks", type=int, default=8,
+                        help="Cantidad de landmarks")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla de los mapas y las consultas")
+    args = parser.parse_args()
+
+    print(f"{'tamano':>6} {'preproc ms':>10} {'manhattan ms':>12} {'alt ms':>8} {'aceleracion':>11} "
+          f"{'nodos manhattan':>15} {'nodos alt':>10}")
+    for size in args.sizes:
+        stats = run(size, args.queries, args.landmarks, args.seed)
+        speedup = stats["manhattan_ms"] / stats["alt_ms"]
+        print(f"{size:>6} {stats['build_ms']:>10.1f} {stats['manhattan_ms']:>12.2f} {stats['alt_ms']:>8.2f} "
+              f"{speedup:>10.2f}x {stats['manhattan_nodes']:>15} {stats['alt_nodes']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark Maps
+Mapas para benchmarks: los mapas incluidos en el repositorio y mapas
+generados con semilla (reproducibles entre ejecuciones)
+"""
+
+import random
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from core.map_loader import load_map
+
+
+# Los mapas mapa.txt ... mapa8.txt viven en la raiz del repositorio
+BUNDLED_MAPS_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def find_start(grid: List[List[int]]) -> List[int]:
+    """
+    Encuentra la posicion del astronauta (valor 2)
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        Lista [fila, columna] o [0, 0] si no hay astronauta
+    """
+    for i, row in enumerate(grid):
+        for j, cell in enumerate(row):
+            if cell == 2:
+                return [i, j]
+    return [0, 0]
+
+
+def load_bundled_maps() -> Dict[str, List[List[int]]]:
+    """
+    Carga todos los mapas mapa*.txt incluidos en el repositorio
+
+    Returns:
+        Diccionario nombre de archivo -> matriz del mapa
+    """
+    maps = {}
+    for path in sorted(BUNDLED_MAPS_DIR.glob("mapa*.txt")):
+        maps[path.name] = load_map(path.read_text())
+    return maps
+
+
+def _reachable(grid: List[List[int]], start: Tuple[int, int]) -> set:
+    """Celdas alcanzables desde start sin atravesar obstaculos"""
+    rows, cols = len(grid), len(grid[0])
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != 1 and (nr, nc) not in seen:
+                seen.add((nr, nc))
+                queue.append((nr, nc))
+    return seen
+
+
+def generate_map(seed: int, size: int = 10, obstacle_density: float = 0.2) -> List[List[int]]:
+    """
+    Genera un mapa valido y resoluble, determinista para cada semilla
+
+    El mapa tiene un astronauta, una nave y 3 muestras, todas alcanzables
+    desde el astronauta. El resto de celdas se reparte entre obstaculos,
+    terreno rocoso, volcanico y libre.
+
+    Args:
+        seed: Semilla del generador aleatorio
+        size: Numero de filas y columnas
+        obstacle_density: Proporcion aproximada de obstaculos
+
+    Returns:
+        Matriz size x size con valores 0-6
+    """
+    rng = random.Random(seed)
+    cells = [(i, j) for i in range(size) for j in range(size)]
+
+    while True:
+        grid = []
+        for _ in range(size):
+            row = []
+            for _ in range(size):
+                x = rng.random()
+                if x < obstacle_density:
+                    row.append(1)
+                elif x < obstacle_density + 0.1:
+                    row.append(3)
+                elif x < obstacle_density + 0.15:
+                    row.append(4)
+                else:
+                    row.append(0)
+            grid.append(row)
+
+        start, ship, *samples = rng.sample(cells, 5)
+        grid[start[0]][start[1]] = 2
+        grid[ship[0]][ship[1]] = 5
+        for r, c in samples:
+            grid[r][c] = 6
+
+        reachable = _reachable(grid, start)
+        if ship in reachable and all(sample in reachable for sample in samples):
+            return grid
@@ -0,0 +1,264 @@
+"""
+Benchmark Suite
+Ejecuta todos los algoritmos registrados sobre los mapas incluidos y mapas generados, con salida JSON
+
+Cada combinacion algoritmo x mapa se ejecuta primero unas veces sin medir
+(calentamiento: importaciones) y luego varias veces midiendo el tiempo con
+perf_counter. La memoria pico se mide en una ejecucion aparte con
+tracemalloc, que agrega sobrecosto al tiempo. Antes de cada ejecucion se
+vacia la cache por mapa (core/map_cache.py), asi que todas las medidas son
+en frio e incluyen la construccion de las tablas del mapa.
+
+El resultado es un JSON con el entorno (commit, Python, plataforma) y una
+fila por combinacion con la mediana y el p95 del tiempo, nodos por segundo,
+memoria pico y nodos expandidos. Con --compare se imprime la razon de
+tiempos y nodos contra un JSON anterior (por ejemplo, de otro commit).
+
+Uso (desde smart_backend/):
+    python -m benchmarks.suite [--algorithms astar bfs] [--generated 5] [--topology maze] [--repeats 5] [--output run.json]
+    python -m benchmarks.suite --output nuevo.json --compare base.json
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.maps import find_start, load_bundled_maps
+from core.map_cache import map_cache
+from core.map_generator import TOPOLOGIES, generate
+
+ALGORITHMS_DIR = Path(__file__).resolve().parent.parent / "algorithms"
+
+
+def registered_algorithms() -> List[str]:
+    """
+    Nombres de los algoritmos de algorithms/ (los mismos que lista /api/algorithms)
+
+    Returns:
+        Lista ordenada de nombres de modulo
+    """
+    return sorted(path.stem for path in ALGORITHMS_DIR.glob("*.py") if path.name != "__init__.py")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Percentil por interpolacion lineal entre las muestras ordenadas
+
+    Args:
+        values: Muestras
+        fraction: Percentil entre 0 y 1
+
+    Returns:
+        Valor del percentil
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def measure(solve: Callable[[dict], dict], params: dict, warmup: int, repeats: int) -> dict:
+    """
+    Mide un solver con calentamiento, repeticiones y memoria pico, vaciando
+    la cache por mapa antes de cada ejecucion (medidas en frio)
+
+    Args:
+        solve: Funcion solve(params) del algoritmo
+        params: Parametros del problema
+        warmup: Ejecuciones sin medir
+        repeats: Ejecuciones medidas
+
+    Returns:
+        Diccionario con median_ms, p95_ms, min_ms, nodes_expanded,
+        nodes_per_sec, peak_kib, cost y found
+    """
+    for _ in range(warmup):
+        map_cache.clear()
+        solve(params)
+
+    times = []
+    for _ in range(repeats):
+        map_cache.clear()
+        start_time = time.perf_counter()
+        result = solve(params)
+        times.append(time.perf_counter() - start_time)
+
+    map_cache.clear()
+    tracemalloc.start()
+    solve(params)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(times)
+    nodes = result.get("nodes_expanded", 0)
+    return {
+        "median_ms": median * 1000,
+        "p95_ms": percentile(times, 0.95) * 1000,
+        "min_ms": min(times) * 1000,
+        "nodes_expanded": nodes,
+        "nodes_per_sec": nodes / median if median > 0 else None,
+        "peak_kib": peak / 1024,
+        "cost": result.get("cost"),
+        "found": bool(result.get("path")),
+    }
+
+
+def benchmark_maps(generated: int, seed: int, size: int, density: float,
+                   topology: str = "open") -> Dict[str, List[List[int]]]:
+    """
+    Mapas del benchmark: mapa*.txt y mapas generados con semilla
+    (core/map_generator.py)
+
+    Args:
+        generated: Cantidad de mapas generados
+        seed: Semilla del primer mapa generado
+        size: Lado de los mapas generados
+        density: Proporcion de obstaculos de los mapas generados
+        topology: "open" o "maze"
+
+    Returns:
+        Diccionario nombre -> matriz del mapa
+    """
+    maps = load_bundled_maps()
+    for map_seed in range(seed, seed + generated):
+        grid = generate(size, seed=map_seed, obstacle_density=density, topology=topology)
+        maps[f"{topology}-{size}-{map_seed}"] = grid.tolist()
+    return maps
+
+
+def _git_commit() -> Optional[str]:
+    """Commit actual del repositorio, si git esta disponible"""
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=ALGORITHMS_DIR, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def run_suite(algorithms: List[str], maps: Dict[str, List[List[int]]], warmup: int = 1,
+              repeats: int = 5) -> dict:
+    """
+    Ejecuta cada algoritmo sobre cada mapa
+
+    Args:
+        algorithms: Nombres de los algoritmos
+        maps: Diccionario nombre -> matriz del mapa
+        warmup: Ejecuciones sin medir por combinacion
+        repeats: Ejecuciones medidas por combinacion
+
+    Returns:
+        Diccionario con environment y results (una fila por algoritmo x mapa;
+        error en vez de las medidas si el algoritmo fallo)
+    """
+    results = []
+    for name in algorithms:
+        solve = importlib.import_module(f"algorithms.{name}").solve
+        for map_name, grid in maps.items():
+            row = {"algorithm": name, "map": map_name}
+            try:
+                row.update(measure(solve, {"map": grid, "start": find_start(grid)}, warmup, repeats))
+            except Exception as e:
+                row["error"] = str(e)
+            results.append(row)
+
+    return {
+        "environment": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "warmup": warmup,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> List[dict]:
+    """
+    Compara dos ejecuciones de la suite fila por fila
+
+    Args:
+        current: Resultado de run_suite
+        baseline: Resultado anterior de run_suite
+
+    Returns:
+        Lista con algorithm, map, time_ratio (actual / base) y nodes_ratio
+        de las combinaciones medidas en ambas
+    """
+    base = {(row["algorithm"], row["map"]): row for row in baseline["results"] if "error" not in row}
+    rows = []
+    for row in current["results"]:
+        old = base.get((row["algorithm"], row["map"]))
+        if old is None or "error" in row:
+            continue
+        rows.append({
+            "algorithm": row["algorithm"],
+            "map": row["map"],
+            "time_ratio": row["median_ms"] / old["median_ms"] if old["median_ms"] else None,
+            "nodes_ratio": row["nodes_expanded"] / old["nodes_expanded"] if old["nodes_expanded"] else None,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--algorithms", nargs="+", default=None,
+                        help="Algoritmos a medir (por defecto todos los registrados)")
+    parser.add_argument("--generated", type=int, default=5,
+                        help="Cantidad de mapas generados ademas de mapa*.txt")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla del primer mapa generado")
+    parser.add_argument("--size", type=int, default=10,
+                        help="Lado de los mapas generados")
+    parser.add_argument("--density", type=float, default=0.2,
+                        help="Proporcion de obstaculos de los mapas generados")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="open",
+                        help="Topologia de los mapas generados")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="Ejecuciones sin medir por combinacion")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Ejecuciones medidas por combinacion")
+    parser.add_argument("--output", default=None,
+                        help="Archivo JSON de salida (por defecto la salida estandar)")
+    parser.add_argument("--compare", default=None,
+                        help="JSON de una ejecucion anterior para comparar")
+    args = parser.parse_args()
+
+    unknown = set(args.algorithms or []) - set(registered_algorithms())
+    if unknown:
+        parser.error(f"algoritmos desconocidos: {', '.join(sorted(unknown))}")
+
+    maps = benchmark_maps(args.generated, args.seed, args.size, args.density, args.topology)
+    report = run_suite(args.algorithms or registered_algorithms(), maps, args.warmup, args.repeats)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        # La tabla va a stderr para no mezclarse con el JSON en la salida estandar
+        out = sys.stderr if args.output is None else sys.stdout
+        print(f"{'algoritmo':<15} {'mapa':<12} {'tiempo':>8} {'nodos':>8}", file=out)
+        for row in compare(report, baseline):
+            time_ratio = f"{row['time_ratio']:.2f}x" if row["time_ratio"] is not None else "-"
+            nodes_ratio = f"{row['nodes_ratio']:.2f}x" if row["nodes_ratio"] is not None else "-"
+            print(f"{row['algorithm']:<15} {row['map']:<12} {time_ratio:>8} {nodes_ratio:>8}", file=out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Cost-To-Go Module
+Tabla de costo hasta la meta para todas las posiciones iniciales
+
+Una sola busqueda de Dijkstra hacia atras, desde todos los estados meta
+(3 muestras recolectadas), calcula el costo optimo restante de cada estado
+(posicion, muestras, combustible, nave_usada) con las mismas reglas que los
+algoritmos: moverse con combustible cuesta 0.5; sin combustible cuesta el
+terreno de la celda destino; la nave recarga 20 movimientos una sola vez.
+
+Despues, el costo optimo desde cualquier celda inicial es una consulta O(1)
+y el camino se reconstruye en O(largo del camino) siguiendo los sucesores.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from core.routing import DIRECTIONS, terrain_cost
+
+Cell = Tuple[int, int]
+# Estado: (fila, columna, mascara_muestras, combustible, nave_usada)
+State = Tuple[int, int, int, int, bool]
+
+FUEL_CAPACITY = 20
+FUEL_MOVE_COST = 0.5
+
+
+class CostToGoTable:
+    """
+    Resultado de la busqueda inversa sobre un mapa
+
+    Attributes:
+        grid: Matriz del mapa
+        samples: Celdas con muestra, en el orden de los bits de la mascara
+        nodes_expanded: Estados asentados durante la construccion
+        max_frontier: Tamano maximo del heap durante la construccion
+        visited_states: Estados con costo en la tabla
+    """
+
+    def __init__(self, grid: List[List[int]], samples: List[Cell],
+                 dist: Dict[State, float], successor: Dict[State, State],
+                 nodes_expanded: int, max_frontier: int = 0):
+        self.grid = grid
+        self.samples = samples
+        self._sample_bit = {cell: 1 << i for i, cell in enumerate(samples)}
+        self._full = (1 << len(samples)) - 1
+        self._dist = dist
+        self._successor = successor
+        self.nodes_expanded = nodes_expanded
+        self.max_frontier = max_frontier
+        self.visited_states = len(dist)
+
+    def initial_state(self, start: Cell) -> State:
+        """Estado inicial de una celda: sin combustible y con la muestra de la celda"""
+        r, c = start
+        return (r, c, self._sample_bit.get((r, c), 0), 0, False)
+
+    def cost(self, start: Cell) -> Optional[float]:
+        """
+        Costo optimo para recolectar todas las muestras desde start
+
+        Returns:
+            Costo, o None si la celda es un obstaculo o no hay solucion
+        """
+        return self._dist.get(self.initial_state(start))
+
+    def path(self, start: Cell) -> List[Cell]:
+        """
+        Camino optimo desde start siguiendo los sucesores de la tabla
+
+        Returns:
+            Lista de celdas, vacia si no hay solucion
+        """
+        state = self.initial_state(start)
+        if state not in self._dist:
+            return []
+        path = [(state[0], state[1])]
+        while state[2] != self._full:
+            state = self._successor[state]
+            path.append((state[0], state[1]))
+        return path
+
+    def states(self):
+        """Pares (estado, costo restante) de todos los estados calculados"""
+        return self._dist.items()
+
+    def table(self) -> List[List[Optional[float]]]:
+        """Matriz con el costo optimo desde cada celda (None si no hay)"""
+        return [
+            [self.cost((r, c)) for c in range(len(self.grid[0]))]
+            for r in range(len(self.grid))
+        ]
+
+
+def build_cost_to_go(grid: List[List[int]]) -> CostToGoTable:
+    """
+    Ejecuta la busqueda inversa desde todos los estados meta
+
+    Para cada estado X asentado se generan sus predecesores P (estados desde
+    los que un movimiento lleva a X) y se relaja dist[P] = costo(P -> X) + dist[X],
+    guardando X como sucesor de P. Solo se generan estados consistentes: sin
+    nave usada el combustible es 0.
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano)
+
+    Returns:
+        CostToGoTable con el costo restante de cada estado alcanzable hacia atras
+    """
+    rows, cols = len(grid), len(grid[0])
+    samples = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == 6]
+    sample_bit = {cell: 1 << i for i, cell in enumerate(samples)}
+    full = (1 << len(samples)) - 1
+
+    dist: Dict[State, float] = {}
+    successor: Dict[State, State] = {}
+    heap = []
+
+    # Estados meta: cualquier celda libre con todas las muestras
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r][c] == 1:
+                continue
+            goals = [(r, c, full, 0, False)]
+            goals += [(r, c, full, fuel, True) for fuel in range(FUEL_CAPACITY + 1)]
+            for state in goals:
+                dist[state] = 0
+                heap.append((0, state))
+    heapq.heapify(heap)
+
+    def predecessors(state):
+        """Estados previos de state con el costo del movimiento hacia state"""
+        r, c, mask, fuel, used = state
+        bit = sample_bit.get((r, c), 0)
+        # Estar sobre una muestra sin tenerla es imposible (se recoge al llegar)
+        if bit and not mask & bit:
+            return []
+        masks = [mask, mask & ~bit] if bit else [mask]
+
+        # (combustible, nave_usada, costo) antes del movimiento
+        before = []
+        cell = grid[r][c]
+        if cell == 5 and not used:
+            # Llegar a la nave sin usarla siempre la toma
+            return []
+        if cell == 5 and fuel == FUEL_CAPACITY:
+            before.append((0, False, terrain_cost(cell)))
+        if fuel > 0:
+            if fuel < FUEL_CAPACITY:
+                before.append((fuel + 1, used, FUEL_MOVE_COST))
+        else:
+            before.append((0, used, terrain_cost(cell)))
+            if used:
+                before.append((1, used, FUEL_MOVE_COST))
+
+        result = []
+        for dr, dc in DIRECTIONS:
+            pr, pc = r - dr, c - dc
+            if not (0 <= pr < rows and 0 <= pc < cols) or grid[pr][pc] == 1:
+                continue
+            pred_bit = sample_bit.get((pr, pc), 0)
+            for pred_mask in masks:
+                if pred_bit and not pred_mask & pred_bit:
+                    continue
+                for pred_fuel, pred_used, step in before:
+                    # Con el tanque lleno solo se puede estar sobre la nave
+                    if pred_fuel == FUEL_CAPACITY and grid[pr][pc] != 5:
+                        continue
+                    result.append(((pr, pc, pred_mask, pred_fuel, pred_used), step))
+        return result
+
+    settled = set()
+    max_frontier = 0
+    while heap:
+        max_frontier = max(max_frontier, len(heap))
+        d, state = heapq.heappop(heap)
+        if state in settled:
+            continue
+        settled.add(state)
+        for pred, step in predecessors(state):
+            nd = d + step
+            if pred[2] != full and nd < dist.get(pred, float('inf')):
+                dist[pred] = nd
+                successor[pred] = state
+                heapq.heappush(heap, (nd, pred))
+
+    return CostToGoTable(grid, samples, dist, successor, len(settled), max_frontier)
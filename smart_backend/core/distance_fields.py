@@ -0,0 +1,151 @@
+"""
+Distance Fields Module
+Campos de distancia exacta (en movimientos, evitando obstaculos) desde las
+muestras y la nave hacia todas las celdas del mapa
+
+Cada campo se calcula con propagacion de frente de onda vectorizada con
+NumPy: en cada paso la frontera se desplaza a las 4 direcciones a la vez y
+se filtra con la mascara de celdas libres no visitadas. Se calculan una vez
+por mapa (ver core/map_cache.py) y las heuristicas los consultan en O(1).
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from core.map_cache import LAYOUT_VALUES, map_cache
+
+Cell = Tuple[int, int]
+
+# Valor de las celdas inalcanzables (u obstaculos) en un campo
+UNREACHABLE = -1
+
+
+def _wavefront(free: np.ndarray, source: Cell) -> np.ndarray:
+    """
+    Propaga el frente de onda desde source sobre la mascara de celdas libres
+
+    Args:
+        free: Matriz booleana, True en celdas transitables
+        source: Celda origen (fila, columna)
+
+    Returns:
+        Matriz int32 con la distancia en movimientos o UNREACHABLE
+    """
+    dist = np.full(free.shape, UNREACHABLE, dtype=np.int32)
+    if not free[source]:
+        return dist
+
+    frontier = np.zeros(free.shape, dtype=bool)
+    frontier[source] = True
+    visited = frontier.copy()
+    dist[source] = 0
+    step = 0
+
+    while frontier.any():
+        step += 1
+        reached = np.zeros_like(frontier)
+        reached[1:, :] |= frontier[:-1, :]
+        reached[:-1, :] |= frontier[1:, :]
+        reached[:, 1:] |= frontier[:, :-1]
+        reached[:, :-1] |= frontier[:, 1:]
+        reached &= free
+        reached &= ~visited
+        dist[reached] = step
+        visited |= reached
+        frontier = reached
+
+    return dist
+
+
+def bfs_distance_field(grid: List[List[int]], source: Cell) -> np.ndarray:
+    """
+    Distancia en movimientos desde source a cada celda
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano)
+        source: Celda origen (fila, columna)
+
+    Returns:
+        Matriz NumPy con la distancia de cada celda, UNREACHABLE si es inalcanzable
+    """
+    return _wavefront(np.asarray(grid) != 1, tuple(source))
+
+
+class DistanceFields:
+    """
+    Campos de distancia de un mapa
+
+    Attributes:
+        samples: Celdas con muestra (valor 6), en orden de lectura
+        sample_fields: Campo de distancia desde cada muestra
+        ship: Celda de la nave (valor 5) o None
+        ship_field: Campo de distancia desde la nave o None
+        pairwise: pairwise[i][j] = movimientos entre las muestras i y j
+                  (inf si no se conectan)
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        cells = np.asarray(grid)
+        free = cells != 1
+
+        self.samples: List[Cell] = [tuple(int(v) for v in cell) for cell in np.argwhere(cells == 6)]
+        self.sample_fields: List[np.ndarray] = [_wavefront(free, s) for s in self.samples]
+
+        ships = np.argwhere(cells == 5)
+        self.ship: Optional[Cell] = tuple(int(v) for v in ships[0]) if len(ships) else None
+        self.ship_field: Optional[np.ndarray] = (
+            _wavefront(free, self.ship) if self.ship is not None else None
+        )
+
+        self.pairwise = [
+            [float('inf') if field[s] == UNREACHABLE else int(field[s]) for s in self.samples]
+            for field in self.sample_fields
+        ]
+        self._nearest: Dict[FrozenSet[Cell], List[List[float]]] = {}
+
+    def nearest_sample_field(self, collected: FrozenSet[Cell]) -> List[List[float]]:
+        """
+        Distancia de cada celda a la muestra no recolectada mas cercana
+
+        Se calcula una vez por conjunto de muestras recolectadas (minimo
+        elemento a elemento de los campos de las muestras restantes) y se
+        retorna como listas para que cada consulta sea una indexacion O(1).
+
+        Args:
+            collected: Muestras ya recolectadas
+
+        Returns:
+            Matriz de distancias (inf si no hay muestra alcanzable, 0 si ya
+            se recolectaron todas)
+        """
+        field = self._nearest.get(collected)
+        if field is None:
+            remaining = [
+                f for s, f in zip(self.samples, self.sample_fields) if s not in collected
+            ]
+            if not remaining:
+                shape = self.sample_fields[0].shape if self.sample_fields else (0, 0)
+                nearest = np.zeros(shape)
+            else:
+                stacked = np.stack(remaining).astype(float)
+                stacked[stacked == UNREACHABLE] = np.inf
+                nearest = stacked.min(axis=0)
+            field = nearest.tolist()
+            self._nearest[collected] = field
+        return field
+
+
+def get_distance_fields(grid: List[List[int]]) -> DistanceFields:
+    """
+    Campos de distancia del mapa, calculados una vez y guardados en la cache
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        DistanceFields del mapa
+    """
+    fields, _ = map_cache.get(grid, "distance_fields", lambda: DistanceFields(grid),
+                              depends_on=LAYOUT_VALUES)
+    return fields
@@ -0,0 +1,40 @@
+"""
+ETag Module
+Respuestas condicionales (ETag / If-None-Match) para endpoints de lectura
+
+Si el cliente ya tiene la version actual de un recurso se responde 304 sin
+cuerpo y sin serializar nada. Las respuestas llevan Cache-Control: no-cache
+para que el navegador revalide siempre con If-None-Match en vez de reutilizar
+una copia vieja.
+"""
+
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse, Response
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Verifica si el ETag esta en la cabecera If-None-Match (comparacion debil)
+
+    Args:
+        etag: ETag actual del recurso (entre comillas)
+        if_none_match: Valor de la cabecera If-None-Match o None
+
+    Returns:
+        True si el cliente ya tiene esa version
+    """
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+
+def not_modified(etag: str) -> Response:
+    """Respuesta 304 sin cuerpo"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def json_with_etag(content: Any, etag: str) -> JSONResponse:
+    """Respuesta JSON con su ETag"""
+    return JSONResponse(content=content, headers={"ETag": etag, "Cache-Control": "no-cache"})
@@ -3,18 +3,87 @@ Executor Module
 Carga y ejecuta algoritmos de busqueda de forma dinamica
 """
 
+import cProfile
 import importlib
+import os
+import pstats
 import time
-from typing import Dict, Any
+import uuid
+from typing import Dict, Any, List
 
+# Directorio donde se guardan los .pstats de las ejecuciones perfiladas
+DEFAULT_PROFILE_DIR = "profiles"
 
-def run_algorithm(name: str, params: dict) -> Dict[str, Any]:
+
+def _top_functions(stats: pstats.Stats, key: int, top: int) -> List[Dict[str, Any]]:
+    """
+    Funciones con mayor tiempo segun una columna de pstats
+    
+    Args:
+        stats: Estadisticas de cProfile
+        key: Indice en la tupla de pstats (2 = tiempo propio, 3 = acumulado)
+        top: Cantidad de funciones
+    
+    Returns:
+        Lista de funciones con llamadas, tiempo propio y acumulado (segundos)
+    """
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][key], reverse=True)[:top]
+    return [
+        {
+            "function": f"{func} ({os.path.basename(filename)}:{line})",
+            "calls": calls,
+            "primitive_calls": primitive,
+            "total_time": round(total, 6),
+            "cumulative_time": round(cumulative, 6)
+        }
+        for (filename, line, func), (primitive, calls, total, cumulative, _) in entries
+    ]
+
+
+def _profile_solve(module, name: str, params: dict, top: int, profile_dir: str):
+    """
+    Ejecuta module.solve dentro de cProfile y guarda el .pstats completo
+    
+    Args:
+        module: Modulo del algoritmo
+        name: Nombre del algoritmo (prefijo del archivo)
+        params: Parametros para el algoritmo
+        top: Cantidad de funciones de cada ranking
+        profile_dir: Directorio de los .pstats
+    
+    Returns:
+        Tupla (resultado de solve, resumen del perfil)
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(module.solve, params)
+    
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.pstats")
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(path)
+    
+    return result, {
+        "file": path,
+        "total_calls": stats.total_calls,
+        "total_time": round(stats.total_tt, 6),
+        "top_cumulative": _top_functions(stats, 3, top),
+        "top_total": _top_functions(stats, 2, top)
+    }
+
+
+def run_algorithm(name: str, params: dict, profile: bool = False, profile_top: int = 20,
+                  profile_dir: str = None) -> Dict[str, Any]:
     """
     Ejecuta un algoritmo de busqueda de forma dinamica
     
     Args:
         name: Nombre del algoritmo a ejecutar (ej: 'bfs', 'astar')
         params: Parametros para el algoritmo
+        profile: Ejecutar solve dentro de cProfile; agrega "profile" con las
+                 funciones de mayor tiempo acumulado y propio, y guarda el
+                 .pstats completo (el tiempo medido incluye el sobrecosto)
+        profile_top: Cantidad de funciones de cada ranking
+        profile_dir: Directorio de los .pstats (por defecto PROFILE_DIR o "profiles")
     
     Returns:
         Diccionario con el resultado de la ejecucion
@@ -30,17 +99,27 @@ def run_algorithm(name: str, params: dict) -> Dict[str, Any]:
             }
         
         # Ejecutar el algoritmo y medir tiempo
+        profile_info = None
         start_time = time.time()
-        result = module.solve(params)
+        if profile:
+            result, profile_info = _profile_solve(
+                module, name, params, profile_top,
+                profile_dir or os.getenv("PROFILE_DIR", DEFAULT_PROFILE_DIR)
+            )
+        else:
+            result = module.solve(params)
         execution_time = time.time() - start_time
         
         # Agregar metadata
-        return {
+        response = {
             "algorithm": name,
             "status": "success",
             "execution_time": round(execution_time, 4),
             "result": result
         }
+        if profile_info is not None:
+            response["profile"] = profile_info
+        return response
         
     except ModuleNotFoundError:
         return {
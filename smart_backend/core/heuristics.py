@@ -0,0 +1,247 @@
+"""
+Heuristics Module
+Tablas heuristicas precalculadas por mapa para los algoritmos informados
+
+- subset_dp: movimientos minimos (evitando obstaculos) para recoger todas las
+  muestras que faltan, exacto para cada celda y cada subconjunto de muestras
+  recolectadas. Se combina una DP sobre subconjuntos (orden optimo de visita
+  entre muestras) con los campos de distancia de core/distance_fields.py.
+- mst: distancia a la muestra restante mas cercana mas el arbol de expansion
+  minima entre las muestras restantes. Mas barata de construir que subset_dp
+  y tambien admisible: cualquier recorrido que las visite empieza yendo a
+  alguna muestra y luego forma un camino (un arbol) entre ellas.
+- fuel_aware: cota de costo (no de movimientos) que usa el estado de
+  combustible sobre los movimientos exactos de subset_dp; ver FuelAwareHeuristic.
+"""
+
+from typing import Dict, FrozenSet, List, Tuple
+
+import numpy as np
+
+from core.distance_fields import UNREACHABLE, get_distance_fields
+from core.map_cache import LAYOUT_VALUES, map_cache
+
+Cell = Tuple[int, int]
+
+INF = float('inf')
+
+FUEL_CAPACITY = 20
+FUEL_MOVE_COST = 0.5
+
+
+class SubsetTable:
+    """
+    Movimientos minimos para terminar desde cada celda y cada conjunto de
+    muestras recolectadas
+
+    Attributes:
+        samples: Celdas con muestra, en el orden de los bits
+        moves_by_collected: {frozenset(recolectadas): matriz de movimientos}
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        fields = get_distance_fields(grid)
+        self.samples: List[Cell] = fields.samples
+        n = len(self.samples)
+        full = (1 << n) - 1
+        pairwise = fields.pairwise
+
+        # best[i][R]: movimientos minimos empezando en la muestra i y visitando
+        # todas las muestras de R (i no esta en R)
+        best = [[INF] * (1 << n) for _ in range(n)]
+        for i in range(n):
+            best[i][0] = 0
+        for mask in sorted(range(1, 1 << n), key=lambda m: bin(m).count("1")):
+            for i in range(n):
+                if mask & (1 << i):
+                    continue
+                best[i][mask] = min(
+                    pairwise[i][j] + best[j][mask & ~(1 << j)]
+                    for j in range(n) if mask & (1 << j)
+                )
+
+        # Campos como float con inf en lo inalcanzable para combinarlos en bloque
+        sample_fields = []
+        for field in fields.sample_fields:
+            field = field.astype(float)
+            field[field == UNREACHABLE] = INF
+            sample_fields.append(field)
+
+        self.moves_by_collected: Dict[FrozenSet[Cell], List[List[float]]] = {}
+        for collected in range(1 << n):
+            remaining = full & ~collected
+            key = frozenset(self.samples[i] for i in range(n) if collected & (1 << i))
+            if remaining == 0:
+                self.moves_by_collected[key] = np.zeros(np.shape(grid)).tolist()
+                continue
+            # Para cada celda: ir a la primera muestra j y seguir en orden optimo
+            table = np.minimum.reduce([
+                sample_fields[j] + best[j][remaining & ~(1 << j)]
+                for j in range(n) if remaining & (1 << j)
+            ])
+            self.moves_by_collected[key] = table.tolist()
+
+    def moves(self, pos: Cell, collected: FrozenSet[Cell]) -> float:
+        """
+        Movimientos minimos para recoger las muestras que faltan
+
+        Args:
+            pos: Celda actual
+            collected: Muestras ya recolectadas
+
+        Returns:
+            Numero de movimientos (inf si alguna muestra es inalcanzable)
+        """
+        return self.moves_by_collected[collected][pos[0]][pos[1]]
+
+
+class MstTable:
+    """
+    Cota inferior de movimientos: muestra mas cercana + MST de las restantes
+
+    Attributes:
+        samples: Celdas con muestra, en el orden de los bits
+        mst_by_collected: {frozenset(recolectadas): peso del MST de las restantes}
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        fields = get_distance_fields(grid)
+        self.samples: List[Cell] = fields.samples
+        self._fields = fields
+        n = len(self.samples)
+
+        self.mst_by_collected: Dict[FrozenSet[Cell], float] = {}
+        for collected in range(1 << n):
+            key = frozenset(self.samples[i] for i in range(n) if collected & (1 << i))
+            remaining = [i for i in range(n) if not collected & (1 << i)]
+            self.mst_by_collected[key] = self._mst_weight(remaining, fields.pairwise)
+
+    @staticmethod
+    def _mst_weight(nodes: List[int], pairwise: List[List[float]]) -> float:
+        """Peso del arbol de expansion minima sobre nodes (Prim)"""
+        if not nodes:
+            return 0
+        best = {j: pairwise[nodes[0]][j] for j in nodes[1:]}
+        total = 0
+        while best:
+            j = min(best, key=best.get)
+            total += best.pop(j)
+            for k in best:
+                best[k] = min(best[k], pairwise[j][k])
+        return total
+
+    def moves(self, pos: Cell, collected: FrozenSet[Cell]) -> float:
+        """
+        Cota inferior de movimientos para recoger las muestras que faltan
+
+        Args:
+            pos: Celda actual
+            collected: Muestras ya recolectadas
+
+        Returns:
+            Numero de movimientos (inf si alguna muestra es inalcanzable)
+        """
+        nearest = self._fields.nearest_sample_field(collected)[pos[0]][pos[1]]
+        return nearest + self.mst_by_collected[collected]
+
+
+class FuelAwareHeuristic:
+    """
+    Cota inferior del costo restante segun el combustible y el uso de la nave
+
+    Con M movimientos minimos para terminar (tabla subset_dp) y sabiendo que
+    sin combustible cada movimiento cuesta al menos 1:
+
+    - Nave ya usada con f de combustible: solo min(f, M) movimientos pueden
+      costar 0.5, el resto cuesta al menos 1.
+    - Nave sin usar: el minimo entre caminar todo (M) y pasar por la nave:
+      llegar a ella cuesta al menos d_nave (sin combustible) y despues quedan
+      al menos max(M - d_nave, 0) movimientos, de los cuales 20 a 0.5.
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        self._subset = get_subset_table(grid)
+        ship_field = get_distance_fields(grid).ship_field
+        # Como listas (None = inalcanzable) para consultas O(1) sin NumPy
+        self._ship_field = None
+        if ship_field is not None:
+            self._ship_field = [
+                [None if d == UNREACHABLE else d for d in row]
+                for row in ship_field.tolist()
+            ]
+
+    @staticmethod
+    def _with_fuel(moves: float, fuel: int) -> float:
+        """Costo minimo de moves movimientos si los primeros fuel cuestan 0.5"""
+        discounted = min(fuel, moves)
+        return discounted * FUEL_MOVE_COST + (moves - discounted)
+
+    def cost(self, pos: Cell, collected: FrozenSet[Cell], fuel: int, ship_used: bool) -> float:
+        """
+        Cota inferior admisible del costo para recoger las muestras que faltan
+
+        Args:
+            pos: Celda actual
+            collected: Muestras ya recolectadas
+            fuel: Combustible restante
+            ship_used: Si la nave ya se uso
+
+        Returns:
+            Costo minimo posible (inf si alguna muestra es inalcanzable)
+        """
+        moves = self._subset.moves(pos, collected)
+        if moves == 0 or moves == INF:
+            return moves
+        if ship_used:
+            return self._with_fuel(moves, fuel)
+
+        walking = moves
+        ship_moves = self._ship_field[pos[0]][pos[1]] if self._ship_field else None
+        if ship_moves is None:
+            return walking
+        through_ship = ship_moves + self._with_fuel(max(moves - ship_moves, 0), FUEL_CAPACITY)
+        return min(walking, through_ship)
+
+
+def get_subset_table(grid: List[List[int]]) -> SubsetTable:
+    """
+    Tabla subset_dp del mapa, calculada una vez y guardada en la cache
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        SubsetTable del mapa
+    """
+    table, _ = map_cache.get(grid, "subset_dp", lambda: SubsetTable(grid),
+                             depends_on=LAYOUT_VALUES)
+    return table
+
+
+def get_mst_table(grid: List[List[int]]) -> MstTable:
+    """
+    Tabla mst del mapa, calculada una vez y guardada en la cache
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        MstTable del mapa
+    """
+    table, _ = map_cache.get(grid, "mst", lambda: MstTable(grid), depends_on=LAYOUT_VALUES)
+    return table
+
+
+def get_fuel_aware_heuristic(grid: List[List[int]]) -> FuelAwareHeuristic:
+    """
+    Heuristica fuel_aware del mapa, guardada en la cache
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        FuelAwareHeuristic del mapa
+    """
+    heuristic, _ = map_cache.get(grid, "fuel_aware", lambda: FuelAwareHeuristic(grid),
+                                 depends_on=LAYOUT_VALUES)
+    return heuristic
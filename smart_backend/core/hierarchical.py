@@ -0,0 +1,429 @@
+"""
+Hierarchical Routing Module (HPA*)
+Rutas punto a punto en mapas grandes con una abstraccion por clusters
+
+El mapa se divide en clusters cuadrados. En cada tramo de borde libre entre
+dos clusters vecinos se ubican una o dos transiciones (celdas de entrada) y,
+dentro de cada cluster, se precalcula el costo de terreno minimo entre todas
+sus entradas. Ese grafo abstracto se calcula una vez por mapa (ver
+core/map_cache.py); cada consulta conecta el inicio y el objetivo a las
+entradas de su cluster, busca con A* sobre el grafo abstracto y refina cada
+arco con una busqueda local dentro de un solo cluster.
+
+El costo es el mismo modelo de terreno que core/routing.py (modo "terrain").
+La ruta no siempre es la optima: solo puede cruzar los bordes por las
+transiciones elegidas. Si el grafo abstracto no conecta las celdas se recurre
+a la busqueda plana.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.map_cache import map_cache
+from core.routing import find_route
+
+Cell = Tuple[int, int]
+
+INF = float('inf')
+
+DEFAULT_CLUSTER_SIZE = 16
+
+# Tramos de borde de este largo o mas tienen una transicion en cada extremo
+LONG_ENTRANCE = 6
+
+
+class ClusterAbstraction:
+    """
+    Grafo abstracto de entradas entre clusters de un mapa
+
+    Las celdas se identifican por su indice plano (fila * columnas + columna).
+
+    Attributes:
+        rows: Filas del mapa
+        cols: Columnas del mapa
+        cluster_size: Lado de cada cluster
+        edges: edges[u] = lista de (v, costo) del grafo abstracto (dirigido:
+               el costo es el terreno de las celdas en las que se entra)
+    """
+
+    def __init__(self, grid: List[List[int]], cluster_size: int = DEFAULT_CLUSTER_SIZE):
+        cells = np.asarray(grid)
+        self.rows, self.cols = cells.shape
+        self.cluster_size = cluster_size
+
+        # Costo de entrar a cada celda, 0 en obstaculos (intransitables)
+        entry = np.ones(cells.shape, dtype=np.int64)
+        entry[cells == 3] = 3
+        entry[cells == 4] = 5
+        entry[cells == 1] = 0
+        self._entry: List[int] = entry.ravel().tolist()
+
+        self.edges: Dict[int, List[Tuple[int, int]]] = {}
+        self._cluster_nodes: Dict[int, List[int]] = {}
+        self._refined: Dict[Tuple[int, int], List[int]] = {}
+
+        self._build_entrances()
+        self._build_intra_edges()
+
+    @property
+    def node_count(self) -> int:
+        """Cantidad de entradas del grafo abstracto"""
+        return len(self.edges)
+
+    @property
+    def edge_count(self) -> int:
+        """Cantidad de arcos del grafo abstracto"""
+        return sum(len(arcs) for arcs in self.edges.values())
+
+    def cluster_of(self, index: int) -> int:
+        """Cluster que contiene la celda index"""
+        r, c = divmod(index, self.cols)
+        clusters_per_row = -(-self.cols // self.cluster_size)
+        return (r // self.cluster_size) * clusters_per_row + c // self.cluster_size
+
+    def _bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Limites (fila_min, fila_max, col_min, col_max) de un cluster, exclusivos al final"""
+        clusters_per_row = -(-self.cols // self.cluster_size)
+        cr, cc = divmod(cluster, clusters_per_row)
+        r0, c0 = cr * self.cluster_size, cc * self.cluster_size
+        return r0, min(r0 + self.cluster_size, self.rows), c0, min(c0 + self.cluster_size, self.cols)
+
+    def _add_node(self, index: int):
+        """Registra una entrada en su cluster"""
+        if index not in self.edges:
+            self.edges[index] = []
+            self._cluster_nodes.setdefault(self.cluster_of(index), []).append(index)
+
+    def _add_transition(self, a: int, b: int):
+        """Transicion entre dos celdas vecinas de clusters distintos (ambos sentidos)"""
+        self._add_node(a)
+        self._add_node(b)
+        self.edges[a].append((b, self._entry[b]))
+        self.edges[b].append((a, self._entry[a]))
+
+    def _add_run(self, pairs: List[Tuple[int, int]]):
+        """Ubica las transiciones de un tramo de borde libre"""
+        if len(pairs) >= LONG_ENTRANCE:
+            self._add_transition(*pairs[0])
+            self._add_transition(*pairs[-1])
+        else:
+            self._add_transition(*pairs[len(pairs) // 2])
+
+    def _build_entrances(self):
+        """Recorre los bordes entre clusters y crea las transiciones"""
+        size, cols, entry = self.cluster_size, self.cols, self._entry
+
+        # Bordes verticales: columna c (izquierda) y c + 1 (derecha)
+        for c in range(size - 1, cols - 1, size):
+            for r0 in range(0, self.rows, size):
+                run = []
+                for r in range(r0, min(r0 + size, self.rows)):
+                    a, b = r * cols + c, r * cols + c + 1
+                    if entry[a] and entry[b]:
+                        run.append((a, b))
+                    elif run:
+                        self._add_run(run)
+                        run = []
+                if run:
+                    self._add_run(run)
+
+        # Bordes horizontales: fila r (arriba) y r + 1 (abajo)
+        for r in range(size - 1, self.rows - 1, size):
+            for c0 in range(0, cols, size):
+                run = []
+                for c in range(c0, min(c0 + size, cols)):
+                    a, b = r * cols + c, (r + 1) * cols + c
+                    if entry[a] and entry[b]:
+                        run.append((a, b))
+                    elif run:
+                        self._add_run(run)
+                        run = []
+                if run:
+                    self._add_run(run)
+
+    def _build_intra_edges(self):
+        """Costo minimo dentro de cada cluster entre cada par de sus entradas"""
+        for cluster, nodes in self._cluster_nodes.items():
+            cells, adjacency = self._cluster_graph(self._bounds(cluster))
+            local = {cell: i for i, cell in enumerate(cells)}
+            node_ids = [local[node] for node in nodes]
+
+            # Dijkstra desde cada entrada sobre el grafo local del cluster,
+            # hasta fijar todas las demas entradas
+            for source, source_id in zip(nodes, node_ids):
+                dist = [INF] * len(cells)
+                dist[source_id] = 0
+                done = [False] * len(cells)
+                pending = set(node_ids)
+                pending.discard(source_id)
+                heap = [(0, source_id)]
+                while heap and pending:
+                    d, i = heapq.heappop(heap)
+                    if done[i]:
+                        continue
+                    done[i] = True
+                    pending.discard(i)
+                    for j, cost in adjacency[i]:
+                        nd = d + cost
+                        if nd < dist[j]:
+                            dist[j] = nd
+                            heapq.heappush(heap, (nd, j))
+                for target, target_id in zip(nodes, node_ids):
+                    if target != source and done[target_id]:
+                        self.edges[source].append((target, dist[target_id]))
+
+    def _cluster_graph(self, bounds: Tuple[int, int, int, int]) -> Tuple[List[int], List[List[Tuple[int, int]]]]:
+        """
+        Grafo local de un cluster
+
+        Returns:
+            Tupla (celdas, adyacencia): celdas transitables del cluster y, para
+            cada una, la lista de (indice local del vecino, costo de entrar)
+        """
+        r_min, r_max, c_min, c_max = bounds
+        cols, entry = self.cols, self._entry
+        cells = [r * cols + c for r in range(r_min, r_max) for c in range(c_min, c_max)
+                 if entry[r * cols + c]]
+        local = {cell: i for i, cell in enumerate(cells)}
+        adjacency = []
+        for cell in cells:
+            r, c = divmod(cell, cols)
+            arcs = []
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if r_min <= nr < r_max and c_min <= nc < c_max:
+                    j = local.get(nr * cols + nc)
+                    if j is not None:
+                        arcs.append((j, entry[nr * cols + nc]))
+            adjacency.append(arcs)
+        return cells, adjacency
+
+    def _local_search(self, source: int, bounds: Tuple[int, int, int, int],
+                      targets: Optional[set] = None,
+                      reverse: bool = False) -> Tuple[Dict[int, int], Dict[int, Optional[int]], int]:
+        """
+        Dijkstra limitado a un cluster
+
+        Args:
+            source: Celda de origen (o de destino si reverse)
+            bounds: Limites del cluster
+            targets: Si se indica, se detiene al fijar todas estas celdas
+            reverse: Calcular el costo desde cada celda hasta source
+
+        Returns:
+            Tupla (costos, padres, expandidos) con las celdas fijadas
+        """
+        r_min, r_max, c_min, c_max = bounds
+        cols, entry = self.cols, self._entry
+        dist = {source: 0}
+        parents: Dict[int, Optional[int]] = {source: None}
+        settled: Dict[int, int] = {}
+        pending = len(targets) if targets else 0
+        heap = [(0, source)]
+
+        while heap:
+            d, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            settled[node] = d
+            if targets and node in targets:
+                pending -= 1
+                if pending == 0:
+                    break
+            r, c = divmod(node, cols)
+            step = entry[node] if reverse else 0
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if r_min <= nr < r_max and c_min <= nc < c_max:
+                    nxt = nr * cols + nc
+                    if not entry[nxt]:
+                        continue
+                    nd = d + (step if reverse else entry[nxt])
+                    if nd < dist.get(nxt, INF):
+                        dist[nxt] = nd
+                        parents[nxt] = node
+                        heapq.heappush(heap, (nd, nxt))
+
+        return settled, parents, len(settled)
+
+    def _local_path(self, a: int, b: int) -> Tuple[List[int], int]:
+        """Camino minimo de a hasta b dentro del cluster de a (y cantidad expandida)"""
+        cached = self._refined.get((a, b))
+        if cached is not None:
+            return cached, 0
+        _, parents, expanded = self._local_search(a, self._bounds(self.cluster_of(a)), {b})
+        path = [b]
+        while path[-1] != a:
+            path.append(parents[path[-1]])
+        path.reverse()
+        if a in self.edges and b in self.edges:
+            self._refined[(a, b)] = path
+        return path, expanded
+
+    def find_path(self, start: Cell, goal: Cell) -> Dict:
+        """
+        Busca sobre el grafo abstracto y refina el camino encontrado
+
+        Args:
+            start: Celda inicial transitable
+            goal: Celda objetivo transitable
+
+        Returns:
+            Diccionario con path (celdas, vacio si el grafo abstracto no las
+            conecta), cost, abstract_nodes_expanded y nodes_expanded (abstracto
+            mas las busquedas locales)
+        """
+        cols = self.cols
+        s, g = start[0] * cols + start[1], goal[0] * cols + goal[1]
+        if s == g:
+            return {"path": [start], "cost": 0, "abstract_nodes_expanded": 0, "nodes_expanded": 0}
+
+        s_cluster, g_cluster = self.cluster_of(s), self.cluster_of(g)
+        expanded = 0
+
+        # Conectar el inicio y el objetivo a las entradas de su cluster
+        s_dist, _, n = self._local_search(s, self._bounds(s_cluster))
+        expanded += n
+        g_dist, _, n = self._local_search(g, self._bounds(g_cluster), reverse=True)
+        expanded += n
+
+        start_arcs = [(v, s_dist[v]) for v in self._cluster_nodes.get(s_cluster, []) if v in s_dist]
+        if s_cluster == g_cluster and g in s_dist:
+            start_arcs.append((g, s_dist[g]))
+        goal_arcs = {v: g_dist[v] for v in self._cluster_nodes.get(g_cluster, []) if v in g_dist}
+
+        # A* sobre el grafo abstracto (cada movimiento cuesta al menos 1)
+        gr, gc = goal
+
+        def h(index):
+            r, c = divmod(index, cols)
+            return abs(r - gr) + abs(c - gc)
+
+        best = {s: 0}
+        parents: Dict[int, Optional[int]] = {s: None}
+        closed = set()
+        heap = [(h(s), 0, s)]
+        abstract_expanded = 0
+        found = False
+
+        while heap:
+            _, d, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            if node == g:
+                found = True
+                break
+            closed.add(node)
+            abstract_expanded += 1
+
+            arcs = self.edges.get(node, [])
+            if node == s:
+                arcs = start_arcs + arcs
+            if node in goal_arcs:
+                arcs = arcs + [(g, goal_arcs[node])]
+            for nxt, cost in arcs:
+                nd = d + cost
+                if nd < best.get(nxt, INF):
+                    best[nxt] = nd
+                    parents[nxt] = node
+                    heapq.heappush(heap, (nd + h(nxt), nd, nxt))
+
+        expanded += abstract_expanded
+        if not found:
+            return {"path": [], "cost": 0, "abstract_nodes_expanded": abstract_expanded,
+                    "nodes_expanded": expanded}
+
+        abstract = [g]
+        while abstract[-1] != s:
+            abstract.append(parents[abstract[-1]])
+        abstract.reverse()
+
+        # Refinar: las transiciones son celdas vecinas, el resto son tramos internos
+        path = [s]
+        for a, b in zip(abstract, abstract[1:]):
+            ar, ac = divmod(a, cols)
+            br, bc = divmod(b, cols)
+            if abs(ar - br) + abs(ac - bc) == 1:
+                path.append(b)
+            else:
+                local, n = self._local_path(a, b)
+                expanded += n
+                path += local[1:]
+
+        return {
+            "path": [divmod(index, cols) for index in path],
+            "cost": best[g],
+            "abstract_nodes_expanded": abstract_expanded,
+            "nodes_expanded": expanded
+        }
+
+
+def get_cluster_abstraction(grid: List[List[int]],
+                            cluster_size: int = DEFAULT_CLUSTER_SIZE) -> Tuple[ClusterAbstraction, bool]:
+    """
+    Abstraccion por clusters del mapa, calculada una vez y guardada en la cache
+
+    Args:
+        grid: Matriz del mapa
+        cluster_size: Lado de cada cluster
+
+    Returns:
+        Tupla (ClusterAbstraction, hit) donde hit indica si vino de la cache
+    """
+    return map_cache.get(grid, ("hpa", cluster_size),
+                         lambda: ClusterAbstraction(grid, cluster_size))
+
+
+def find_route_hierarchical(grid: List[List[int]], start: Cell, goal: Cell,
+                            cluster_size: int = DEFAULT_CLUSTER_SIZE) -> Dict:
+    """
+    Ruta de terreno entre dos celdas con HPA*
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano)
+        start: Celda inicial (fila, columna)
+        goal: Celda objetivo (fila, columna)
+        cluster_size: Lado de cada cluster
+
+    Returns:
+        Diccionario con path, cost, moves, nodes_expanded, abstract_nodes_expanded,
+        cache_hit, fallback (si se uso la busqueda plana) y message
+
+    Raises:
+        ValueError: Si cluster_size no es positivo o las celdas no son validas
+    """
+    if cluster_size < 2:
+        raise ValueError("El tamano de cluster debe ser al menos 2")
+
+    start, goal = tuple(start), tuple(goal)
+    rows, cols = len(grid), len(grid[0])
+    for name, (r, c) in (("inicio", start), ("objetivo", goal)):
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError(f"La celda de {name} {[r, c]} esta fuera del mapa")
+        if grid[r][c] == 1:
+            raise ValueError(f"La celda de {name} {[r, c]} es un obstaculo")
+
+    abstraction, cache_hit = get_cluster_abstraction(grid, cluster_size)
+    result = abstraction.find_path(start, goal)
+
+    if not result["path"]:
+        # El grafo abstracto no conecta las celdas: busqueda plana completa
+        flat = find_route(grid, start, goal, mode="terrain")
+        return {
+            **flat,
+            "nodes_expanded": result["nodes_expanded"] + flat["nodes_expanded"],
+            "abstract_nodes_expanded": result["abstract_nodes_expanded"],
+            "cache_hit": cache_hit,
+            "fallback": True
+        }
+
+    return {
+        "path": [list(cell) for cell in result["path"]],
+        "cost": result["cost"],
+        "moves": len(result["path"]) - 1,
+        "nodes_expanded": result["nodes_expanded"],
+        "abstract_nodes_expanded": result["abstract_nodes_expanded"],
+        "cache_hit": cache_hit,
+        "fallback": False,
+        "message": "Ruta encontrada"
+    }
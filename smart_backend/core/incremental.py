@@ -0,0 +1,316 @@
+"""
+Incremental Routing Module (D* Lite)
+Replanificacion incremental de rutas punto a punto cuando cambian celdas
+
+D* Lite busca desde el objetivo hacia el inicio y guarda, para cada celda,
+g (costo conocido hasta el objetivo) y rhs (costo segun sus vecinos). Cuando
+cambia una celda solo se actualizan ella y sus vecinos; la siguiente
+consulta repara las celdas inconsistentes en vez de buscar desde cero, asi
+que el trabajo es proporcional a la zona afectada. Tambien admite mover el
+inicio (el astronauta avanza) sin perder el estado.
+
+El modelo de costos es el de core/routing.py: entrar a una celda cuesta su
+terreno en modo "terrain" o 1 en modo "unit"; los obstaculos no se pueden pisar.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.routing import DIRECTIONS, terrain_cost
+
+Cell = Tuple[int, int]
+Key = Tuple[float, float]
+
+INF = float('inf')
+
+
+class DStarLite:
+    """
+    Planificador D* Lite para un par inicio/objetivo sobre una copia del mapa
+
+    Attributes:
+        start: Celda inicial actual
+        goal: Celda objetivo
+        mode: "terrain" o "unit"
+        nodes_expanded: Celdas expandidas en la ultima llamada a compute()
+    """
+
+    def __init__(self, grid: List[List[int]], start: Cell, goal: Cell, mode: str = "terrain"):
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.mode = mode
+        self.start = tuple(start)
+        self.goal = tuple(goal)
+        self._grid = [list(row) for row in grid]
+
+        self._g: Dict[Cell, float] = {}
+        self._rhs: Dict[Cell, float] = {self.goal: 0}
+        self._km = 0
+        self._last = self.start
+        # Cola con borrado perezoso: _queued guarda la clave vigente de cada celda
+        self._heap: List[Tuple[Key, Cell]] = []
+        self._queued: Dict[Cell, Key] = {}
+        self._push(self.goal)
+        self.nodes_expanded = 0
+
+    def _entry(self, cell: Cell) -> float:
+        """Costo de entrar a cell (inf si es obstaculo)"""
+        value = self._grid[cell[0]][cell[1]]
+        if value == 1:
+            return INF
+        return terrain_cost(value) if self.mode == "terrain" else 1
+
+    def _neighbors(self, cell: Cell) -> Iterable[Cell]:
+        """Celdas vecinas dentro del mapa (incluidos obstaculos)"""
+        r, c = cell
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                yield (nr, nc)
+
+    def _cost(self, a: Cell, b: Cell) -> float:
+        """Costo del arco a -> b entre celdas vecinas"""
+        if self._grid[a[0]][a[1]] == 1:
+            return INF
+        return self._entry(b)
+
+    def _h(self, cell: Cell) -> int:
+        """Distancia Manhattan desde el inicio (cada movimiento cuesta al menos 1)"""
+        return abs(cell[0] - self.start[0]) + abs(cell[1] - self.start[1])
+
+    def _key(self, cell: Cell) -> Key:
+        """Clave de prioridad de una celda"""
+        best = min(self._g.get(cell, INF), self._rhs.get(cell, INF))
+        return (best + self._h(cell) + self._km, best)
+
+    def _push(self, cell: Cell):
+        """Encola (o reencola) una celda con su clave actual"""
+        key = self._key(cell)
+        self._queued[cell] = key
+        heapq.heappush(self._heap, (key, cell))
+
+    def _top(self) -> Tuple[Key, Optional[Cell]]:
+        """Menor clave vigente de la cola, descartando entradas obsoletas"""
+        while self._heap:
+            key, cell = self._heap[0]
+            if self._queued.get(cell) == key:
+                return key, cell
+            heapq.heappop(self._heap)
+        return (INF, INF), None
+
+    def _update_vertex(self, cell: Cell):
+        """Recalcula rhs de una celda y la encola si quedo inconsistente"""
+        if cell != self.goal:
+            self._rhs[cell] = min(
+                (self._cost(cell, nxt) + self._g.get(nxt, INF) for nxt in self._neighbors(cell)),
+                default=INF
+            )
+        self._queued.pop(cell, None)
+        if self._g.get(cell, INF) != self._rhs.get(cell, INF):
+            self._push(cell)
+
+    def compute(self) -> int:
+        """
+        Repara las celdas inconsistentes hasta conocer el costo desde el inicio
+
+        Returns:
+            Cantidad de celdas expandidas
+        """
+        expanded = 0
+        while True:
+            key, cell = self._top()
+            start_g, start_rhs = self._g.get(self.start, INF), self._rhs.get(self.start, INF)
+            if cell is None or (key >= self._key(self.start) and start_rhs == start_g):
+                break
+
+            heapq.heappop(self._heap)
+            del self._queued[cell]
+            expanded += 1
+            new_key = self._key(cell)
+            g, rhs = self._g.get(cell, INF), self._rhs.get(cell, INF)
+            if key < new_key:
+                self._push(cell)
+            elif g > rhs:
+                self._g[cell] = rhs
+                for prev in self._neighbors(cell):
+                    self._update_vertex(prev)
+            else:
+                self._g[cell] = INF
+                self._update_vertex(cell)
+                for prev in self._neighbors(cell):
+                    self._update_vertex(prev)
+
+        self.nodes_expanded = expanded
+        return expanded
+
+    def move_start(self, start: Cell):
+        """
+        Cambia la celda inicial conservando el estado de la busqueda
+
+        Args:
+            start: Nueva celda inicial
+        """
+        start = tuple(start)
+        if start != self.start:
+            self.start = start
+            self._km += abs(self._last[0] - start[0]) + abs(self._last[1] - start[1])
+            self._last = start
+
+    def update_cells(self, changes: Iterable[Tuple[int, int, int]]):
+        """
+        Aplica cambios de celdas y marca como inconsistentes las afectadas
+
+        Args:
+            changes: Tuplas (fila, columna, valor nuevo)
+        """
+        touched = set()
+        for r, c, value in changes:
+            if self._grid[r][c] == value:
+                continue
+            self._grid[r][c] = value
+            # Cambian los arcos que entran a la celda y los que salen de ella
+            touched.add((r, c))
+            touched.update(self._neighbors((r, c)))
+        for cell in touched:
+            self._update_vertex(cell)
+
+    def cost(self) -> float:
+        """Costo minimo conocido desde el inicio hasta el objetivo (inf si no hay ruta)"""
+        return self._g.get(self.start, INF) if self.start != self.goal else 0
+
+    def path(self) -> List[Cell]:
+        """
+        Ruta desde el inicio siguiendo el vecino con menor costo restante
+
+        Returns:
+            Lista de celdas del inicio al objetivo, vacia si no hay ruta
+        """
+        if self.cost() == INF:
+            return []
+        path = [self.start]
+        cell = self.start
+        while cell != self.goal:
+            cell = min(self._neighbors(cell), key=lambda nxt: self._cost(cell, nxt) + self._g.get(nxt, INF))
+            path.append(cell)
+            if len(path) > self.rows * self.cols:
+                return []
+        return path
+
+
+class IncrementalPlanners:
+    """
+    Planificadores D* Lite del mundo cargado, uno por (objetivo, modo)
+
+    Se sincronizan con la revision del mundo: los cambios de celdas se les
+    pasan con cells_changed; cualquier otro cambio de revision (otro mapa,
+    reset) los descarta y se reconstruyen en la siguiente consulta.
+    """
+
+    def __init__(self):
+        self._planners: Dict[Tuple[Cell, str], DStarLite] = {}
+        self._revision: Optional[int] = None
+
+    def get(self, grid: List[List[int]], revision: int, start: Cell, goal: Cell,
+            mode: str = "terrain") -> Tuple[DStarLite, bool]:
+        """
+        Planificador para el objetivo y modo dados, con el inicio actualizado
+
+        Args:
+            grid: Mapa actual del mundo
+            revision: Revision actual del mundo
+            start: Celda inicial
+            goal: Celda objetivo
+            mode: "terrain" o "unit"
+
+        Returns:
+            Tupla (planificador, reutilizado)
+        """
+        if revision != self._revision:
+            self.clear()
+            self._revision = revision
+        key = (tuple(goal), mode)
+        planner = self._planners.get(key)
+        if planner is None:
+            planner = DStarLite(grid, start, goal, mode)
+            self._planners[key] = planner
+            return planner, False
+        planner.move_start(start)
+        return planner, True
+
+    def cells_changed(self, changes: List[Tuple[int, int, int]], old_revision: int, new_revision: int):
+        """
+        Propaga cambios de celdas a los planificadores sincronizados
+
+        Args:
+            changes: Tuplas (fila, columna, valor nuevo)
+            old_revision: Revision del mundo antes del cambio
+            new_revision: Revision del mundo despues del cambio
+        """
+        if self._revision != old_revision:
+            self.clear()
+            return
+        for planner in self._planners.values():
+            planner.update_cells(changes)
+        self._revision = new_revision
+
+    def clear(self):
+        """Descarta todos los planificadores"""
+        self._planners.clear()
+        self._revision = None
+
+
+# Instancia global asociada a mars_world
+incremental_planners = IncrementalPlanners()
+
+
+def find_route_incremental(grid: List[List[int]], revision: int, start: Cell, goal: Cell,
+                           mode: str = "terrain") -> Dict:
+    """
+    Ruta entre dos celdas reutilizando el estado de D* Lite del mundo
+
+    Args:
+        grid: Mapa actual del mundo
+        revision: Revision actual del mundo
+        start: Celda inicial (fila, columna)
+        goal: Celda objetivo (fila, columna)
+        mode: "unit" o "terrain"
+
+    Returns:
+        Diccionario con path, cost, moves, nodes_expanded (de esta consulta),
+        reused (si se reparo un estado previo) y message
+
+    Raises:
+        ValueError: Si el modo no existe o las celdas no son validas
+    """
+    if mode not in ("unit", "terrain"):
+        raise ValueError(f"Modo de ruta desconocido: '{mode}'. Use 'unit' o 'terrain'")
+
+    start, goal = tuple(start), tuple(goal)
+    rows, cols = len(grid), len(grid[0])
+    for name, (r, c) in (("inicio", start), ("objetivo", goal)):
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError(f"La celda de {name} {[r, c]} esta fuera del mapa")
+        if grid[r][c] == 1:
+            raise ValueError(f"La celda de {name} {[r, c]} es un obstaculo")
+
+    planner, reused = incremental_planners.get(grid, revision, start, goal, mode)
+    expanded = planner.compute()
+    path = planner.path()
+
+    if not path:
+        return {
+            "path": [],
+            "cost": 0,
+            "moves": 0,
+            "nodes_expanded": expanded,
+            "reused": reused,
+            "message": "No existe ruta entre las celdas"
+        }
+
+    return {
+        "path": [list(cell) for cell in path],
+        "cost": planner.cost(),
+        "moves": len(path) - 1,
+        "nodes_expanded": expanded,
+        "reused": reused,
+        "message": "Ruta encontrada"
+    }
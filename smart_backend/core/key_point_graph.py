@@ -0,0 +1,255 @@
+"""
+Key Point Graph Module
+Distancias entre los puntos clave del mapa (inicio, muestras y nave) con el
+modelo de combustible, para resolver el problema buscando solo sobre el
+orden de visita en lugar del espacio de estados completo
+
+Antes de usar la nave cada tramo cuesta su ruta de terreno minima que no
+atraviesa la nave (entrar a ella la usa y recarga el combustible; eso lo
+cubren los ordenes que visitan la nave como parada). Despues de
+usarla, con f de combustible, un tramo A -> B de d movimientos minimos:
+- si d <= f, cuesta 0.5 * d y deja f - d de combustible (ninguna otra ruta
+  es mas barata ni deja mas combustible);
+- si d > f, gasta los f movimientos a 0.5 llegando a alguna celda X a
+  exactamente f movimientos de A y sigue por la ruta de terreno minima de X a
+  B: cuesta 0.5 * f + terreno(X -> B) y deja 0 de combustible.
+"""
+
+from itertools import permutations
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.distance_fields import UNREACHABLE, get_distance_fields
+from core.map_cache import map_cache
+from core.routing import DIRECTIONS, terrain_cost, terrain_field_to
+
+Cell = Tuple[int, int]
+
+INF = float('inf')
+
+FUEL_CAPACITY = 20
+FUEL_MOVE_COST = 0.5
+
+
+class KeyPointGraph:
+    """
+    Tramos entre puntos clave de un mapa (independiente de la posicion inicial)
+
+    Attributes:
+        grid: Matriz del mapa
+        samples: Celdas con muestra
+        ship: Celda de la nave o None
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        fields = get_distance_fields(grid)
+        self.grid = grid
+        self.samples: List[Cell] = fields.samples
+        self.ship: Optional[Cell] = fields.ship
+
+        # Campos de movimientos desde cada punto clave (origen de tramos con combustible)
+        self._moves: Dict[Cell, np.ndarray] = dict(zip(self.samples, fields.sample_fields))
+        if self.ship is not None:
+            self._moves[self.ship] = fields.ship_field
+
+        # Costo de terreno hacia cada punto clave (destino de cualquier tramo)
+        self._terrain_to: Dict[Cell, Tuple[np.ndarray, List[List[Optional[Cell]]]]] = {}
+        # Lo mismo sin atravesar la nave (tramos antes de usarla)
+        self._walk_to: Dict[Cell, Tuple[np.ndarray, List[List[Optional[Cell]]]]] = {}
+        for target in self._moves:
+            dist, following = terrain_field_to(grid, target)
+            self._terrain_to[target] = (np.array(dist), following)
+            if self.ship is None or target == self.ship:
+                self._walk_to[target] = self._terrain_to[target]
+            else:
+                dist, following = terrain_field_to(grid, target, avoid=self.ship)
+                self._walk_to[target] = (np.array(dist), following)
+
+        self._fuel_legs: Dict[Tuple[Cell, Cell, int], Tuple[float, int, Optional[Cell]]] = {}
+
+    def walk_cost(self, a: Cell, b: Cell) -> float:
+        """Costo de terreno minimo de a hasta b sin atravesar la nave (antes de usarla)"""
+        return float(self._walk_to[b][0][a])
+
+    def walk_path(self, a: Cell, b: Cell) -> List[Cell]:
+        """Ruta de walk_cost(a, b), ambos extremos incluidos"""
+        return self._follow(self._walk_to[b][1], a, b)
+
+    @staticmethod
+    def _follow(following: List[List[Optional[Cell]]], a: Cell, b: Cell) -> List[Cell]:
+        """Ruta de a hasta b siguiendo la tabla siguiente de un campo de terreno"""
+        path = [a]
+        while path[-1] != b:
+            r, c = path[-1]
+            path.append(following[r][c])
+        return path
+
+    def fuel_leg(self, a: Cell, b: Cell, fuel: int) -> Tuple[float, int, Optional[Cell]]:
+        """
+        Tramo de a hasta b empezando con fuel de combustible
+
+        Returns:
+            Tupla (costo, combustible_final, X) donde X es la celda en la que se
+            acaba el combustible, o None si el tramo entero va con combustible
+        """
+        key = (a, b, fuel)
+        leg = self._fuel_legs.get(key)
+        if leg is None:
+            moves = self._moves[a]
+            d = moves[b]
+            if d != UNREACHABLE and d <= fuel:
+                leg = (FUEL_MOVE_COST * int(d), fuel - int(d), None)
+            else:
+                # Celdas a exactamente fuel movimientos de a (rebotando si sobran
+                # movimientos pares) y el mejor terreno restante desde ellas
+                reachable = (moves != UNREACHABLE) & (moves <= fuel) & ((fuel - moves) % 2 == 0)
+                remaining = np.where(reachable, self._terrain_to[b][0], INF)
+                index = np.unravel_index(int(np.argmin(remaining)), remaining.shape)
+                best = float(remaining[index])
+                if best == INF:
+                    leg = (INF, 0, None)
+                else:
+                    leg = (FUEL_MOVE_COST * fuel + best, 0, (int(index[0]), int(index[1])))
+            self._fuel_legs[key] = leg
+        return leg
+
+    def fuel_leg_path(self, a: Cell, b: Cell, fuel: int) -> List[Cell]:
+        """Ruta del tramo fuel_leg(a, b, fuel), ambos extremos incluidos"""
+        _, _, handoff = self.fuel_leg(a, b, fuel)
+        if handoff is None:
+            return self._move_path(a, b)
+        path = self._move_path(a, handoff)
+        spare = fuel - (len(path) - 1)
+        if spare > 0:
+            bounce = path[-2] if len(path) > 1 else self._any_neighbor(handoff)
+            path += [bounce, handoff] * (spare // 2)
+        return path + self._follow(self._terrain_to[b][1], handoff, b)[1:]
+
+    def _move_path(self, a: Cell, b: Cell) -> List[Cell]:
+        """Ruta con menos movimientos de a hasta b, bajando por el campo de a"""
+        moves = self._moves[a]
+        path = [b]
+        while path[-1] != a:
+            r, c = path[-1]
+            d = moves[r, c]
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < moves.shape[0] and 0 <= nc < moves.shape[1] and moves[nr, nc] == d - 1:
+                    path.append((nr, nc))
+                    break
+        path.reverse()
+        return path
+
+    def _any_neighbor(self, cell: Cell) -> Cell:
+        """Algun vecino transitable de cell"""
+        rows, cols = len(self.grid), len(self.grid[0])
+        for dr, dc in DIRECTIONS:
+            r, c = cell[0] + dr, cell[1] + dc
+            if 0 <= r < rows and 0 <= c < cols and self.grid[r][c] != 1:
+                return (r, c)
+        return cell
+
+    def _ship_round_trip(self, start: Cell) -> Tuple[float, List[Cell]]:
+        """Salir de la nave y volver (cuando se empieza sobre ella sin usarla)"""
+        best_cost, best_path = INF, []
+        rows, cols = len(self.grid), len(self.grid[0])
+        for dr, dc in DIRECTIONS:
+            r, c = start[0] + dr, start[1] + dc
+            if 0 <= r < rows and 0 <= c < cols and self.grid[r][c] != 1:
+                cost = terrain_cost(self.grid[r][c]) + terrain_cost(self.grid[start[0]][start[1]])
+                if cost < best_cost:
+                    best_cost, best_path = cost, [start, (r, c), start]
+        return best_cost, best_path
+
+    def solve(self, start: Cell) -> Dict:
+        """
+        Busca exhaustivamente el mejor orden de visita desde start
+
+        Se prueban todas las permutaciones de las muestras pendientes, sin
+        nave o usandola justo antes de cada una de ellas.
+
+        Args:
+            start: Celda inicial
+
+        Returns:
+            Diccionario con cost (inf si no hay solucion), path, order (puntos
+            clave en orden) y orderings (cantidad de ordenes evaluados)
+        """
+        start = tuple(start)
+        pending = [s for s in self.samples if s != start]
+        ship_options: List[Optional[int]] = [None]
+        if self.ship is not None and pending:
+            ship_options += list(range(len(pending)))
+
+        best_cost, best_order = INF, None
+        orderings = 0
+        for order in permutations(pending):
+            for ship_index in ship_options:
+                orderings += 1
+                stops = list(order)
+                if ship_index is not None:
+                    stops.insert(ship_index, self.ship)
+                cost = self._sequence_cost(start, stops)
+                if cost < best_cost:
+                    best_cost, best_order = cost, stops
+
+        if best_order is None:
+            return {"cost": INF, "path": [], "order": [], "orderings": orderings}
+        return {
+            "cost": best_cost,
+            "path": self._sequence_path(start, best_order),
+            "order": [start] + best_order,
+            "orderings": orderings
+        }
+
+    def _sequence_cost(self, start: Cell, stops: List[Cell]) -> float:
+        """Costo de visitar stops en orden desde start"""
+        cost, fuel, ship_used = 0.0, 0, False
+        current = start
+        for stop in stops:
+            if ship_used:
+                leg_cost, fuel, _ = self.fuel_leg(current, stop, fuel)
+            elif stop == self.ship and current == self.ship:
+                leg_cost, _ = self._ship_round_trip(current)
+            else:
+                leg_cost = self.walk_cost(current, stop)
+            if leg_cost == INF:
+                return INF
+            cost += leg_cost
+            if stop == self.ship:
+                fuel, ship_used = FUEL_CAPACITY, True
+            current = stop
+        return cost
+
+    def _sequence_path(self, start: Cell, stops: List[Cell]) -> List[Cell]:
+        """Ruta completa de visitar stops en orden desde start"""
+        path = [start]
+        fuel, ship_used = 0, False
+        current = start
+        for stop in stops:
+            if ship_used:
+                leg = self.fuel_leg_path(current, stop, fuel)
+                _, fuel, _ = self.fuel_leg(current, stop, fuel)
+            elif stop == self.ship and current == self.ship:
+                _, leg = self._ship_round_trip(current)
+            else:
+                leg = self.walk_path(current, stop)
+            path += leg[1:]
+            if stop == self.ship:
+                fuel, ship_used = FUEL_CAPACITY, True
+            current = stop
+        return path
+
+
+def get_key_point_graph(grid: List[List[int]]) -> Tuple[KeyPointGraph, bool]:
+    """
+    Grafo de puntos clave del mapa, calculado una vez y guardado en la cache
+
+    Args:
+        grid: Matriz del mapa
+
+    Returns:
+        Tupla (KeyPointGraph, hit) donde hit indica si vino de la cache
+    """
+    return map_cache.get(grid, "key_points", lambda: KeyPointGraph(grid))
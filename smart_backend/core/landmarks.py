@@ -0,0 +1,199 @@
+"""
+Landmarks Module (ALT)
+Cotas inferiores por desigualdad triangular con puntos de referencia
+
+Se eligen K celdas de referencia (landmarks) por seleccion del punto mas
+lejano y se guarda, para cada una, la distancia minima hasta todas las
+celdas en un arreglo int32 (costo de terreno o movimientos segun el modo).
+Para cualquier par de celdas v, t y cada landmark L:
+
+    d(v, t) >= d(L, t) - d(L, v)
+    d(v, t) >= d(v, L) - d(t, L)
+
+El costo de un arco es el de la celda en la que se entra, asi que el camino
+de v a L cuesta lo mismo que el de L a v cambiando la celda v por L:
+d(v, L) = d(L, v) - costo(v) + costo(L). Con eso alcanza un solo campo por
+landmark. Las tablas se calculan una vez por mapa (ver core/map_cache.py).
+"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from core.map_cache import map_cache
+
+Cell = Tuple[int, int]
+
+# Valor de las celdas inalcanzables (u obstaculos) en un campo
+UNREACHABLE = -1
+
+DEFAULT_LANDMARKS = 8
+
+
+def _entry_costs(grid: List[List[int]], mode: str) -> np.ndarray:
+    """Costo de entrar a cada celda (0 en obstaculos)"""
+    cells = np.asarray(grid)
+    entry = np.ones(cells.shape, dtype=np.int32)
+    if mode == "terrain":
+        entry[cells == 3] = 3
+        entry[cells == 4] = 5
+    entry[cells == 1] = 0
+    return entry
+
+
+def _dijkstra_field(entry: List[int], rows: int, cols: int, source: int) -> List[int]:
+    """
+    Costo minimo desde source a cada celda (indices planos)
+
+    Args:
+        entry: Costo de entrar a cada celda, 0 en obstaculos
+        rows: Filas del mapa
+        cols: Columnas del mapa
+        source: Celda de origen
+
+    Returns:
+        Lista con el costo de cada celda, UNREACHABLE si es inalcanzable
+    """
+    size = rows * cols
+    best = [None] * size
+    best[source] = 0
+    done = [False] * size
+    heap = [(0, source)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        c = node % cols
+        for nxt in (node - cols, node + cols, node - 1 if c > 0 else -1, node + 1 if c < cols - 1 else -1):
+            if 0 <= nxt < size and entry[nxt] and not done[nxt]:
+                nd = d + entry[nxt]
+                if best[nxt] is None or nd < best[nxt]:
+                    best[nxt] = nd
+                    heapq.heappush(heap, (nd, nxt))
+    return [UNREACHABLE if d is None else d for d in best]
+
+
+class LandmarkTable:
+    """
+    Distancias desde los landmarks de un mapa
+
+    Attributes:
+        mode: "terrain" (costo de terreno) o "unit" (movimientos)
+        landmarks: Celdas elegidas como landmarks
+        fields: Arreglo int32 (K, filas * columnas) con la distancia desde cada
+                landmark, UNREACHABLE si es inalcanzable
+    """
+
+    def __init__(self, grid: List[List[int]], count: int = DEFAULT_LANDMARKS, mode: str = "terrain"):
+        entry = _entry_costs(grid, mode)
+        self.mode = mode
+        self.rows, self.cols = entry.shape
+        self._entry = entry.ravel()
+        entry_list = self._entry.tolist()
+
+        free = np.flatnonzero(self._entry)
+        self.landmarks: List[Cell] = []
+        fields = []
+        if len(free):
+            # Seleccion del punto mas lejano: la primera landmark es la celda mas
+            # lejana a una celda libre cualquiera y cada siguiente la mas lejana
+            # a las ya elegidas (las inalcanzables no cuentan)
+            nearest = np.asarray(_dijkstra_field(entry_list, self.rows, self.cols, int(free[0])))
+            for _ in range(min(count, len(free))):
+                landmark = int(np.argmax(nearest))
+                if nearest[landmark] <= 0 and fields:
+                    break
+                field = np.asarray(_dijkstra_field(entry_list, self.rows, self.cols, landmark),
+                                   dtype=np.int32)
+                if not fields:
+                    # La celda inicial no es landmark: solo cuentan las elegidas
+                    nearest = field
+                else:
+                    nearest = np.where(field == UNREACHABLE, nearest, np.minimum(nearest, field))
+                fields.append(field)
+                self.landmarks.append(divmod(landmark, self.cols))
+
+        self.fields = np.stack(fields) if fields else np.empty((0, self.rows * self.cols), dtype=np.int32)
+
+    def lower_bounds_to(self, goal: Cell) -> "LowerBounds":
+        """
+        Cotas inferiores de la distancia de cada celda hasta goal
+
+        Args:
+            goal: Celda destino
+
+        Returns:
+            LowerBounds que calcula las cotas por bloques a medida que se consultan
+        """
+        return LowerBounds(self, goal)
+
+
+class LowerBounds:
+    """
+    Cotas ALT hasta un destino fijo
+
+    Calcular las cotas de todo el mapa en cada consulta costaria mas que la
+    busqueda en mapas grandes; se calculan de forma vectorizada por bloques de
+    TILE x TILE celdas la primera vez que A* toca el bloque y se guardan como
+    listas para que cada consulta siguiente sea una indexacion O(1).
+    """
+
+    TILE = 16
+
+    def __init__(self, table: LandmarkTable, goal: Cell):
+        t = goal[0] * table.cols + goal[1]
+        count = len(table.fields)
+        self._fields = table.fields.reshape(count, table.rows, table.cols)
+        self._entry = table._entry.reshape(table.rows, table.cols)
+        to_goal = table.fields[:, t].astype(np.int64)
+        # Las landmarks que no alcanzan el destino no dan cota
+        useful = to_goal != UNREACHABLE
+        self._fields = self._fields[useful]
+        self._to_goal = to_goal[useful].reshape(-1, 1, 1)
+        self._entry_goal = int(table._entry[t])
+        self._tiles: Dict[Tuple[int, int], List[List[int]]] = {}
+
+    def get(self, r: int, c: int) -> int:
+        """Cota inferior de la distancia de (r, c) hasta el destino"""
+        tile = self._tiles.get((r // self.TILE, c // self.TILE))
+        if tile is None:
+            tile = self._compute(r // self.TILE, c // self.TILE)
+        return tile[r % self.TILE][c % self.TILE]
+
+    def _compute(self, tr: int, tc: int) -> List[List[int]]:
+        """Calcula las cotas de un bloque"""
+        rows = slice(tr * self.TILE, (tr + 1) * self.TILE)
+        cols = slice(tc * self.TILE, (tc + 1) * self.TILE)
+        fields = self._fields[:, rows, cols].astype(np.int64)
+        if len(fields) == 0:
+            bounds = np.zeros(self._entry[rows, cols].shape, dtype=np.int64)
+        else:
+            # d(L, t) - d(L, v)
+            forward = self._to_goal - fields
+            # d(v, L) - d(t, L) = (d(L, v) - costo(v)) - (d(L, t) - costo(t))
+            backward = (fields - self._entry[rows, cols]) - (self._to_goal - self._entry_goal)
+            bounds = np.where(fields != UNREACHABLE, np.maximum(forward, backward), 0).max(axis=0)
+        tile = np.maximum(bounds, 0).tolist()
+        self._tiles[(tr, tc)] = tile
+        return tile
+
+
+def get_landmark_table(grid: List[List[int]], count: int = DEFAULT_LANDMARKS,
+                       mode: str = "terrain") -> Tuple[LandmarkTable, bool]:
+    """
+    Tabla de landmarks del mapa, calculada una vez y guardada en la cache
+
+    Args:
+        grid: Matriz del mapa
+        count: Cantidad de landmarks
+        mode: "terrain" o "unit"
+
+    Returns:
+        Tupla (LandmarkTable, hit) donde hit indica si vino de la cache
+    """
+    # En modo "unit" la tabla solo depende de donde estan los obstaculos
+    return map_cache.get(grid, ("landmarks", mode, count),
+                         lambda: LandmarkTable(grid, count, mode),
+                         depends_on=frozenset({1}) if mode == "unit" else None)
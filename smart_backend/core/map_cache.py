@@ -0,0 +1,158 @@
+"""
+Map Cache Module
+Cache por mapa de estructuras precalculadas (tablas, campos de distancia...)
+
+Cada entrada se identifica por la huella del mapa (hash de su contenido) y
+un tipo ("cost_to_go", ...). Asi, varias llamadas a /api/run sobre el mismo
+mapa reutilizan el trabajo aunque cambie la posicion inicial.
+
+Cada tipo puede declarar de que valores de celda depende (depends_on). Al
+editar celdas (apply_edits) los tipos que no dependen de los valores
+cambiados pasan a la huella del mapa editado y solo se descartan los demas.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+# Estructuras que solo dependen de donde estan los obstaculos, la nave y las
+# muestras (campos de distancia en movimientos y tablas derivadas)
+LAYOUT_VALUES = frozenset({1, 5, 6})
+
+
+def map_fingerprint(grid: List[List[int]]) -> str:
+    """
+    Calcula una huella estable del contenido del mapa
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano, valores 0-255)
+
+    Returns:
+        Hash hexadecimal que cambia si cambia cualquier celda o la forma del mapa
+    """
+    digest = hashlib.sha1()
+    for row in grid:
+        digest.update(bytes(row))
+        # Separador de fila: distingue mapas con las mismas celdas y otra forma
+        digest.update(b'\xff')
+    return digest.hexdigest()
+
+
+class MapCache:
+    """
+    Cache LRU de resultados precalculados por mapa
+
+    Attributes:
+        max_maps: Numero maximo de mapas distintos que se mantienen
+        hits: Consultas resueltas desde la cache
+        misses: Consultas que tuvieron que construir el valor
+        invalidated: Entradas descartadas por ediciones de celdas
+    """
+
+    def __init__(self, max_maps: int = 16):
+        """Inicializa una cache vacia"""
+        self.max_maps = max_maps
+        self._entries: "OrderedDict[str, Dict[Hashable, Any]]" = OrderedDict()
+        self._depends: Dict[Hashable, Optional[FrozenSet[int]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def get(self, grid: List[List[int]], kind: Hashable,
+            builder: Callable[[], Any],
+            depends_on: Optional[FrozenSet[int]] = None) -> Tuple[Any, bool]:
+        """
+        Obtiene un valor de la cache o lo construye
+
+        Args:
+            grid: Matriz del mapa
+            kind: Tipo de estructura (ej: "cost_to_go")
+            builder: Funcion sin argumentos que construye el valor si no esta
+            depends_on: Valores de celda de los que depende la estructura; si
+                        una edicion no involucra ninguno, la entrada sigue
+                        valida. None = depende de todos
+
+        Returns:
+            Tupla (valor, hit) donde hit indica si vino de la cache
+        """
+        self._depends[kind] = depends_on
+        key = map_fingerprint(grid)
+        entries = self._entries.get(key)
+        if entries is not None:
+            self._entries.move_to_end(key)
+            if kind in entries:
+                self.hits += 1
+                return entries[kind], True
+
+        self.misses += 1
+        value = builder()
+
+        if entries is None:
+            entries = {}
+            self._entries[key] = entries
+            while len(self._entries) > self.max_maps:
+                self._entries.popitem(last=False)
+        entries[kind] = value
+        return value, False
+
+    def apply_edits(self, old_key: str, new_grid: List[List[int]],
+                    changes: List[Tuple[int, int, int, int]]) -> Dict:
+        """
+        Traslada las entradas de un mapa a su version editada
+
+        Args:
+            old_key: Huella del mapa antes de editarlo
+            new_grid: Mapa ya editado
+            changes: Tuplas (fila, columna, valor anterior, valor nuevo)
+
+        Returns:
+            Diccionario con los tipos conservados (kept) y la cantidad de
+            entradas descartadas (invalidated)
+        """
+        entries = self._entries.pop(old_key, None)
+        if not entries:
+            return {"kept": [], "invalidated": 0}
+
+        touched = {value for _, _, old, new in changes for value in (old, new)}
+        kept = {
+            kind: value for kind, value in entries.items()
+            if self._depends.get(kind) is not None and not (touched & self._depends[kind])
+        }
+        self.invalidated += len(entries) - len(kept)
+
+        if kept:
+            new_key = map_fingerprint(new_grid)
+            target = self._entries.setdefault(new_key, {})
+            for kind, value in kept.items():
+                target.setdefault(kind, value)
+            self._entries.move_to_end(new_key)
+            while len(self._entries) > self.max_maps:
+                self._entries.popitem(last=False)
+
+        return {"kept": list(kept), "invalidated": len(entries) - len(kept)}
+
+    def clear(self):
+        """Vacia la cache y reinicia las estadisticas"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def stats(self) -> Dict:
+        """
+        Estadisticas de uso de la cache
+
+        Returns:
+            Diccionario con mapas guardados, entradas, hits, misses e invalidadas
+        """
+        return {
+            "maps": len(self._entries),
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated
+        }
+
+
+# Instancia global de la cache
+map_cache = MapCache()
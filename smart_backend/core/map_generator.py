@@ -0,0 +1,269 @@
+"""
+Map Generator Module
+Genera mapas validos de cualquier tamano, deterministas por semilla
+
+Topologias:
+    open: obstaculos repartidos al azar con la densidad pedida
+    maze: laberinto perfecto (arbol binario) con pasillos de una celda; braid
+          abre una fraccion de las paredes internas para crear ciclos
+
+Las celdas libres se reparten entre terreno rocoso y volcanico segun su
+proporcion. Con solvable=True el astronauta alcanza la nave y todas las
+muestras: en "open" se abre un pasillo en L (solo se quitan obstaculos)
+desde el astronauta hasta cada punto; en "maze" todos los pasillos ya estan
+conectados. Todo se calcula con numpy, asi que 1000x1000 toma milisegundos.
+
+Formatos de salida: texto (el mismo de mapa*.txt) y binario compacto con
+dos celdas por byte (cabecera MARS + version + filas + columnas).
+
+Uso (desde smart_backend/):
+    python -m core.map_generator --rows 1000 [--cols 1000] [--seed 0] [--topology maze] \
+        [--format binary] [--output mapa.bin]
+"""
+
+import argparse
+import struct
+import sys
+from typing import Optional
+
+import numpy as np
+
+TOPOLOGIES = ("open", "maze")
+SHIP_PLACEMENTS = ("random", "near", "far", "none")
+
+BINARY_MAGIC = b"MARS"
+BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sBII")
+
+
+def _maze(rng: np.random.Generator, rows: int, cols: int, braid: float) -> np.ndarray:
+    """
+    Laberinto perfecto por arbol binario: cada celda de pasillo (coordenadas
+    pares) abre la pared norte o la oeste
+
+    Args:
+        rng: Generador aleatorio
+        rows: Filas del mapa
+        cols: Columnas del mapa
+        braid: Probabilidad de abrir cada pared interna restante
+
+    Returns:
+        Arreglo uint8 con 0 en pasillos y 1 en paredes
+    """
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    grid[0::2, 0::2] = 0
+    height, width = grid[0::2, 0::2].shape
+
+    north = rng.random((height, width)) < 0.5
+    # La primera fila solo puede abrir hacia el oeste y la primera columna hacia el norte
+    north[0, :] = False
+    north[:, 0] = True
+    north[0, 0] = False
+    west = ~north
+    west[0, 0] = False
+    west[:, 0] = False
+
+    r, c = np.nonzero(north)
+    grid[2 * r - 1, 2 * c] = 0
+    r, c = np.nonzero(west)
+    grid[2 * r, 2 * c - 1] = 0
+
+    if braid > 0:
+        # Paredes entre dos celdas de pasillo (fila impar y columna par, o al reves)
+        walls = np.zeros((rows, cols), dtype=bool)
+        walls[1:rows - 1:2, 0::2] = True
+        walls[0::2, 1:cols - 1:2] = True
+        grid[walls & (rng.random((rows, cols)) < braid)] = 0
+    return grid
+
+
+def _carve(grid: np.ndarray, origin: tuple, target: tuple):
+    """Quita los obstaculos de un pasillo en L de origin a target (vertical y luego horizontal)"""
+    (r0, c0), (r1, c1) = origin, target
+    column = grid[min(r0, r1):max(r0, r1) + 1, c0]
+    column[column == 1] = 0
+    row = grid[r1, min(c0, c1):max(c0, c1) + 1]
+    row[row == 1] = 0
+
+
+def generate(rows: int, cols: Optional[int] = None, seed: int = 0, obstacle_density: float = 0.2,
+             rocky: float = 0.1, volcanic: float = 0.05, samples: int = 3, ship: str = "random",
+             topology: str = "open", solvable: bool = True, braid: float = 0.05) -> np.ndarray:
+    """
+    Genera un mapa con astronauta, nave y muestras
+
+    Args:
+        rows: Filas del mapa
+        cols: Columnas (por defecto igual a rows)
+        seed: Semilla; la misma semilla y parametros dan el mismo mapa
+        obstacle_density: Proporcion de obstaculos (solo topologia "open")
+        rocky: Proporcion de celdas libres con terreno rocoso
+        volcanic: Proporcion de celdas libres con terreno volcanico
+        samples: Cantidad de muestras cientificas
+        ship: "random", "near" (la celda libre mas cercana al astronauta),
+              "far" (la mas lejana) o "none" (sin nave)
+        topology: "open" o "maze"
+        solvable: Garantizar que la nave y las muestras sean alcanzables
+        braid: Fraccion de paredes internas que se abren (solo "maze")
+
+    Returns:
+        Arreglo uint8 (rows, cols) con valores 0-6
+
+    Raises:
+        ValueError: Si algun parametro no es valido o no caben los puntos
+    """
+    cols = rows if cols is None else cols
+    if rows < 1 or cols < 1:
+        raise ValueError("El mapa debe tener al menos una fila y una columna")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Topologia desconocida: '{topology}'. Use {', '.join(TOPOLOGIES)}")
+    if ship not in SHIP_PLACEMENTS:
+        raise ValueError(f"Ubicacion de nave desconocida: '{ship}'. Use {', '.join(SHIP_PLACEMENTS)}")
+    if not 0 <= obstacle_density < 1:
+        raise ValueError("obstacle_density debe estar en [0, 1)")
+    if rocky < 0 or volcanic < 0 or rocky + volcanic > 1:
+        raise ValueError("rocky y volcanic deben ser no negativos y sumar como maximo 1")
+    if samples < 0:
+        raise ValueError("samples no puede ser negativo")
+
+    rng = np.random.default_rng(seed)
+    if topology == "maze":
+        grid = _maze(rng, rows, cols, braid)
+    else:
+        grid = (rng.random((rows, cols)) < obstacle_density).astype(np.uint8)
+
+    # Terreno de las celdas libres
+    free = grid == 0
+    x = rng.random((rows, cols))
+    grid[free & (x < rocky)] = 3
+    grid[free & (x >= rocky) & (x < rocky + volcanic)] = 4
+
+    free_cells = np.flatnonzero(grid != 1)
+    points = 1 + samples + (ship != "none")
+    if len(free_cells) < points:
+        raise ValueError(f"No caben {points} puntos en {len(free_cells)} celdas libres")
+
+    chosen = rng.choice(free_cells, size=1 + samples + (ship == "random"), replace=False)
+    astronaut = divmod(int(chosen[0]), cols)
+    sample_cells = [divmod(int(cell), cols) for cell in chosen[1:1 + samples]]
+    ship_cell = None
+    if ship == "random":
+        ship_cell = divmod(int(chosen[-1]), cols)
+    elif ship != "none":
+        # La celda libre mas cercana o mas lejana (Manhattan) que no sea otro punto
+        candidates = np.setdiff1d(free_cells, chosen, assume_unique=True)
+        r, c = np.divmod(candidates, cols)
+        distance = np.abs(r - astronaut[0]) + np.abs(c - astronaut[1])
+        pick = np.argmin(distance) if ship == "near" else np.argmax(distance)
+        ship_cell = divmod(int(candidates[pick]), cols)
+
+    targets = sample_cells + ([ship_cell] if ship_cell else [])
+    if solvable and topology == "open":
+        for target in targets:
+            _carve(grid, astronaut, target)
+
+    grid[astronaut] = 2
+    for cell in sample_cells:
+        grid[cell] = 6
+    if ship_cell:
+        grid[ship_cell] = 5
+    return grid
+
+
+def to_text(grid: np.ndarray) -> str:
+    """
+    Mapa en el formato de texto de mapa*.txt (celdas separadas por espacios)
+
+    Args:
+        grid: Arreglo (filas, columnas) con valores 0-6
+
+    Returns:
+        Texto con una linea por fila
+    """
+    rows, cols = grid.shape
+    chars = np.full((rows, 2 * cols), ord(" "), dtype=np.uint8)
+    chars[:, 0::2] = grid + ord("0")
+    chars[:, -1] = ord("\n")
+    return chars.tobytes().decode("ascii")
+
+
+def to_binary(grid: np.ndarray) -> bytes:
+    """
+    Mapa en formato binario compacto: cabecera y dos celdas por byte
+
+    Args:
+        grid: Arreglo (filas, columnas) con valores 0-6
+
+    Returns:
+        Bytes del mapa
+    """
+    rows, cols = grid.shape
+    flat = grid.astype(np.uint8).ravel()
+    if len(flat) % 2:
+        flat = np.append(flat, np.uint8(0))
+    packed = (flat[0::2] << 4) | flat[1::2]
+    return _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, rows, cols) + packed.tobytes()
+
+
+def from_binary(data: bytes) -> np.ndarray:
+    """
+    Lee un mapa en formato binario compacto
+
+    Args:
+        data: Bytes producidos por to_binary
+
+    Returns:
+        Arreglo uint8 (filas, columnas)
+
+    Raises:
+        ValueError: Si los datos no tienen el formato esperado
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Datos demasiado cortos para un mapa binario")
+    magic, version, rows, cols = _HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("Los datos no son un mapa binario valido")
+    packed = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size)
+    if len(packed) != (rows * cols + 1) // 2:
+        raise ValueError(f"Se esperaban {(rows * cols + 1) // 2} bytes de celdas, hay {len(packed)}")
+    flat = np.empty(len(packed) * 2, dtype=np.uint8)
+    flat[0::2] = packed >> 4
+    flat[1::2] = packed & 0x0F
+    return flat[:rows * cols].reshape(rows, cols)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10, help="Filas del mapa")
+    parser.add_argument("--cols", type=int, default=None, help="Columnas (por defecto igual a filas)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del generador")
+    parser.add_argument("--density", type=float, default=0.2, help="Proporcion de obstaculos (open)")
+    parser.add_argument("--rocky", type=float, default=0.1, help="Proporcion de terreno rocoso")
+    parser.add_argument("--volcanic", type=float, default=0.05, help="Proporcion de terreno volcanico")
+    parser.add_argument("--samples", type=int, default=3, help="Cantidad de muestras")
+    parser.add_argument("--ship", choices=SHIP_PLACEMENTS, default="random", help="Ubicacion de la nave")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="open", help="Topologia del mapa")
+    parser.add_argument("--braid", type=float, default=0.05, help="Paredes abiertas del laberinto")
+    parser.add_argument("--allow-unsolvable", action="store_true",
+                        help="No garantizar que los puntos sean alcanzables")
+    parser.add_argument("--format", choices=("text", "binary"), default="text", help="Formato de salida")
+    parser.add_argument("--output", default=None, help="Archivo de salida (por defecto la salida estandar)")
+    args = parser.parse_args()
+
+    try:
+        grid = generate(args.rows, args.cols, seed=args.seed, obstacle_density=args.density,
+                        rocky=args.rocky, volcanic=args.volcanic, samples=args.samples, ship=args.ship,
+                        topology=args.topology, solvable=not args.allow_unsolvable, braid=args.braid)
+    except ValueError as e:
+        parser.error(str(e))
+
+    data = to_binary(grid) if args.format == "binary" else to_text(grid).encode("ascii")
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+Routing Module
+Rutas punto a punto entre dos celdas del mapa (por ejemplo, hasta el
+objetivo fijado con POST /api/map/goal)
+
+- Modo "unit": cada movimiento cuesta 1 -> BFS bidireccional
+- Modo "terrain": cada movimiento cuesta el terreno de la celda destino
+  (libre 1, rocoso 3, volcanico 5) -> Dijkstra bidireccional
+- Con heuristic="manhattan" o "alt" se usa A* unidireccional; "alt" toma las
+  cotas de los landmarks del mapa (core/landmarks.py)
+
+El combustible de la nave no se modela aqui: la ruta solo depende del terreno.
+"""
+
+import heapq
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.landmarks import DEFAULT_LANDMARKS, get_landmark_table
+
+Cell = Tuple[int, int]
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def terrain_cost(cell_value: int) -> int:
+    """
+    Costo de entrar a una celda segun su terreno
+
+    Args:
+        cell_value: Valor de la celda (0-6)
+
+    Returns:
+        3 para rocoso, 5 para volcanico y 1 para el resto
+    """
+    if cell_value == 3:
+        return 3
+    if cell_value == 4:
+        return 5
+    return 1
+
+
+def _neighbors(grid: List[List[int]], cell: Cell) -> List[Cell]:
+    """Vecinos transitables (no obstaculo) de una celda"""
+    rows, cols = len(grid), len(grid[0])
+    r, c = cell
+    result = []
+    for dr, dc in DIRECTIONS:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != 1:
+            result.append((nr, nc))
+    return result
+
+
+def _join(parents_fwd: Dict, parents_bwd: Dict, last_fwd: Cell, first_bwd: Optional[Cell]) -> List[Cell]:
+    """
+    Une el camino inicio -> last_fwd (arbol hacia adelante) con el camino
+    first_bwd -> objetivo (arbol hacia atras); first_bwd puede ser None
+    """
+    path = []
+    node = last_fwd
+    while node is not None:
+        path.append(node)
+        node = parents_fwd[node]
+    path.reverse()
+    node = first_bwd
+    while node is not None:
+        path.append(node)
+        node = parents_bwd[node]
+    return path
+
+
+def _bfs(grid, start, goal):
+    """BFS unidireccional (referencia para comparar expansiones)"""
+    parents = {start: None}
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            return _join(parents, {}, goal, None), expanded
+        expanded += 1
+        for nxt in _neighbors(grid, node):
+            if nxt not in parents:
+                parents[nxt] = node
+                queue.append(nxt)
+    return None, expanded
+
+
+def _bidirectional_bfs(grid, start, goal):
+    """
+    BFS bidireccional: expande por capas el lado con la frontera mas chica
+    y, al encontrarse, termina la capa para quedarse con el encuentro mas corto
+    """
+    if start == goal:
+        return [start], 0
+
+    parents = ({start: None}, {goal: None})
+    dist = ({start: 0}, {goal: 0})
+    frontiers = ([start], [goal])
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        best = None
+        next_frontier = []
+
+        for node in frontiers[side]:
+            expanded += 1
+            for nxt in _neighbors(grid, node):
+                if nxt in dist[other]:
+                    total = dist[side][node] + 1 + dist[other][nxt]
+                    if best is None or total < best[0]:
+                        best = (total, node, nxt)
+                if nxt not in dist[side]:
+                    dist[side][nxt] = dist[side][node] + 1
+                    parents[side][nxt] = node
+                    next_frontier.append(nxt)
+
+        if best is not None:
+            _, node, nxt = best
+            if side == 0:
+                return _join(parents[0], parents[1], node, nxt), expanded
+            return _join(parents[0], parents[1], nxt, node), expanded
+
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+    return None, expanded
+
+
+def _dijkstra(grid, start, goal):
+    """Dijkstra unidireccional (referencia para comparar expansiones)"""
+    dist = {start: 0}
+    parents = {start: None}
+    heap = [(0, start)]
+    settled = set()
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        if node == goal:
+            return _join(parents, {}, goal, None), len(settled) - 1
+        for nxt in _neighbors(grid, node):
+            nd = d + terrain_cost(grid[nxt[0]][nxt[1]])
+            if nd < dist.get(nxt, float('inf')):
+                dist[nxt] = nd
+                parents[nxt] = node
+                heapq.heappush(heap, (nd, nxt))
+    return None, len(settled)
+
+
+def _bidirectional_dijkstra(grid, start, goal):
+    """
+    Dijkstra bidireccional sobre costos de entrada a la celda
+
+    El arco u -> v cuesta terrain_cost(v). La busqueda hacia atras recorre
+    los arcos invertidos: desde v relaja a su vecino u con costo terrain_cost(v).
+    Se detiene cuando la suma de los minimos de ambos heaps alcanza el mejor
+    encuentro conocido (mu).
+    """
+    if start == goal:
+        return [start], 0
+
+    dist = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    heaps = ([(0, start)], [(0, goal)])
+    settled = (set(), set())
+    best_cost = float('inf')
+    meeting = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best_cost:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+        d, node = heapq.heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+
+        for nxt in _neighbors(grid, node):
+            if side == 0:
+                step = terrain_cost(grid[nxt[0]][nxt[1]])
+            else:
+                step = terrain_cost(grid[node[0]][node[1]])
+            nd = d + step
+            if nd < dist[side].get(nxt, float('inf')):
+                dist[side][nxt] = nd
+                parents[side][nxt] = node
+                heapq.heappush(heaps[side], (nd, nxt))
+            if nxt in dist[other] and nd + dist[other][nxt] < best_cost:
+                # Solo cuenta si nxt quedo enlazado por este lado con nd
+                if dist[side][nxt] == nd:
+                    best_cost = nd + dist[other][nxt]
+                    meeting = nxt
+
+    expanded = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return None, expanded
+    return _join(parents[0], parents[1], meeting, parents[1][meeting]), expanded
+
+
+def _astar(grid, start, goal, step_cost: Callable[[int], int], h: Callable[[Cell], int]):
+    """
+    A* unidireccional con una cota inferior admisible h
+
+    Args:
+        step_cost: Costo de entrar a una celda segun su valor
+        h: Cota inferior del costo de una celda hasta goal
+    """
+    dist = {start: 0}
+    parents = {start: None}
+    heap = [(h(start), 0, start)]
+    closed = set()
+    while heap:
+        _, d, node = heapq.heappop(heap)
+        if node in closed:
+            continue
+        if node == goal:
+            return _join(parents, {}, goal, None), len(closed)
+        closed.add(node)
+        for nxt in _neighbors(grid, node):
+            nd = d + step_cost(grid[nxt[0]][nxt[1]])
+            if nd < dist.get(nxt, float('inf')):
+                dist[nxt] = nd
+                parents[nxt] = node
+                heapq.heappush(heap, (nd + h(nxt), nd, nxt))
+    return None, len(closed)
+
+
+def terrain_field_to(grid: List[List[int]], goal: Cell,
+                     avoid: Optional[Cell] = None) -> Tuple[List[List[float]], List[List[Optional[Cell]]]]:
+    """
+    Costo de terreno desde cada celda hasta goal (Dijkstra sobre arcos invertidos)
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano)
+        goal: Celda destino
+        avoid: Celda que las rutas no pueden atravesar; solo puede ser su
+               origen (por ejemplo, la nave antes de usarla)
+
+    Returns:
+        Tupla (costos, siguiente): costos[r][c] es el costo minimo de ir de
+        (r, c) a goal (inf si no hay ruta) y siguiente[r][c] la celda que
+        sigue en esa ruta (None en goal y en celdas sin ruta)
+    """
+    rows, cols = len(grid), len(grid[0])
+    dist = [[float('inf')] * cols for _ in range(rows)]
+    following: List[List[Optional[Cell]]] = [[None] * cols for _ in range(rows)]
+    goal = tuple(goal)
+    if grid[goal[0]][goal[1]] == 1:
+        return dist, following
+
+    dist[goal[0]][goal[1]] = 0
+    heap = [(0, goal)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if d > dist[node[0]][node[1]] or node == avoid:
+            continue
+        # Entrar a node cuesta su terreno, sin importar desde que vecino
+        step = terrain_cost(grid[node[0]][node[1]])
+        for prev in _neighbors(grid, node):
+            nd = d + step
+            if nd < dist[prev[0]][prev[1]]:
+                dist[prev[0]][prev[1]] = nd
+                following[prev[0]][prev[1]] = node
+                heapq.heappush(heap, (nd, prev))
+    return dist, following
+
+
+def path_cost(grid: List[List[int]], path: List[Cell]) -> int:
+    """
+    Costo de terreno de un camino (sin contar la celda inicial)
+
+    Args:
+        grid: Matriz del mapa
+        path: Lista de celdas consecutivas
+
+    Returns:
+        Suma de terrain_cost de cada celda destino
+    """
+    return sum(terrain_cost(grid[r][c]) for r, c in path[1:])
+
+
+def find_route(grid: List[List[int]], start: Cell, goal: Cell,
+               mode: str = "terrain", bidirectional: bool = True,
+               heuristic: Optional[str] = None, landmarks: int = DEFAULT_LANDMARKS) -> Dict:
+    """
+    Calcula la ruta mas corta entre dos celdas
+
+    Args:
+        grid: Matriz del mapa (cualquier tamano)
+        start: Celda inicial (fila, columna)
+        goal: Celda objetivo (fila, columna)
+        mode: "unit" (minimiza movimientos) o "terrain" (minimiza costo de terreno)
+        bidirectional: Buscar desde ambos extremos (True) o solo desde el inicio
+        heuristic: None (busqueda no informada), "manhattan" o "alt" (A*)
+        landmarks: Cantidad de landmarks para heuristic="alt"
+
+    Returns:
+        Diccionario con path, cost, moves, nodes_expanded y message (y
+        cache_hit de la tabla de landmarks con heuristic="alt")
+
+    Raises:
+        ValueError: Si el modo o la heuristica no existen o las celdas no son validas
+    """
+    if mode not in ("unit", "terrain"):
+        raise ValueError(f"Modo de ruta desconocido: '{mode}'. Use 'unit' o 'terrain'")
+    if heuristic not in (None, "manhattan", "alt"):
+        raise ValueError(f"Heuristica desconocida: '{heuristic}'. Use 'manhattan' o 'alt'")
+
+    start, goal = tuple(start), tuple(goal)
+    rows, cols = len(grid), len(grid[0])
+    for name, (r, c) in (("inicio", start), ("objetivo", goal)):
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError(f"La celda de {name} {[r, c]} esta fuera del mapa")
+        if grid[r][c] == 1:
+            raise ValueError(f"La celda de {name} {[r, c]} es un obstaculo")
+
+    extra = {}
+    if heuristic is not None:
+        # Cada movimiento cuesta al menos 1: Manhattan es admisible en ambos modos
+        gr, gc = goal
+
+        def h(cell):
+            return abs(cell[0] - gr) + abs(cell[1] - gc)
+
+        if heuristic == "alt":
+            table, extra["cache_hit"] = get_landmark_table(grid, landmarks, mode)
+            bounds = table.lower_bounds_to(goal)
+
+            def h(cell, manhattan=h):
+                return max(bounds.get(cell[0], cell[1]), manhattan(cell))
+
+        step_cost = terrain_cost if mode == "terrain" else (lambda _: 1)
+        path, expanded = _astar(grid, start, goal, step_cost, h)
+    else:
+        if mode == "unit":
+            search = _bidirectional_bfs if bidirectional else _bfs
+        else:
+            search = _bidirectional_dijkstra if bidirectional else _dijkstra
+        path, expanded = search(grid, start, goal)
+
+    if path is None:
+        return {
+            "path": [],
+            "cost": 0,
+            "moves": 0,
+            "nodes_expanded": expanded,
+            **extra,
+            "message": "No existe ruta entre las celdas"
+        }
+
+    return {
+        "path": [list(cell) for cell in path],
+        "cost": path_cost(grid, path),
+        "moves": len(path) - 1,
+        "nodes_expanded": expanded,
+        **extra,
+        "message": "Ruta encontrada"
+    }
@@ -1,29 +1,200 @@
 """
 World State Module
 Gestiona el estado del mundo marciano (mapa) para el Smart Astronaut
+
+El estado se guarda en instantaneas (WorldSnapshot) que no se modifican una
+vez publicadas. Cada escritura arma una instantanea nueva (copiando solo lo
+que cambia) y la publica reemplazando una referencia, asi que un lector que
+toma mars_world.snapshot() ve siempre un mapa y metadatos coherentes entre si,
+sin locks. Las escrituras se serializan entre ellas con un lock.
 """
 
-from typing import List, Dict, Tuple, Optional
+import threading
+import uuid
+from typing import List, Dict, Set, Tuple, Optional
+from core.incremental import incremental_planners
+from core.map_cache import map_cache, map_fingerprint
 from core.map_loader import load_map, validate_map
 
 
+# Contador de metadata de cada valor de celda
+CELL_COUNTERS = {
+    1: 'obstacles',
+    3: 'rocky_terrain',
+    4: 'volcanic_terrain',
+    5: 'spacecraft',
+    6: 'scientific_samples'
+}
+
+# Posicion de metadata de cada valor de celda (la primera en orden de lectura)
+CELL_POSITIONS = {
+    2: 'astronaut_position',
+    5: 'spacecraft_position'
+}
+
+
+# Distinto en cada proceso: tras reiniciar el servidor ningun ETag viejo coincide
+_INSTANCE = uuid.uuid4().hex[:8]
+
+
+class WorldSnapshot:
+    """
+    Estado del mundo en un instante. No se modifica despues de publicarse:
+    grid, metadata y las posiciones pueden compartirse entre instantaneas
+    
+    Atributos:
+        grid: Matriz con el mapa o None
+        metadata: Informacion adicional del mapa
+        revision: Contador que aumenta cada vez que cambia el mapa
+        version: Contador que aumenta con cualquier cambio visible (mapa,
+                 metadatos u objetivo); de el sale el ETag
+    """
+    
+    __slots__ = ('grid', 'metadata', 'revision', 'version', 'positions')
+    
+    def __init__(self, grid: Optional[List[List[int]]], metadata: Dict, revision: int, version: int,
+                 positions: Dict[int, Set[Tuple[int, int]]]):
+        self.grid = grid
+        self.metadata = metadata
+        self.revision = revision
+        self.version = version
+        # Celdas con astronauta y con nave, para mantener las posiciones al editar
+        self.positions = positions
+    
+    def is_loaded(self) -> bool:
+        """
+        Verifica si hay un mapa cargado y valido
+        
+        Returns:
+            True si el mapa esta cargado y es valido
+        """
+        return self.grid is not None and self.metadata['valid']
+    
+    def get_cell(self, row: int, col: int) -> Optional[int]:
+        """
+        Obtiene el valor de una celda especifica
+        
+        Args:
+            row: Fila (0-9)
+            col: Columna (0-9)
+            
+        Returns:
+            Valor de la celda o None si no esta cargado
+        """
+        if not self.is_loaded():
+            return None
+        
+        if 0 <= row < len(self.grid) and 0 <= col < len(self.grid[0]):
+            return self.grid[row][col]
+        
+        return None
+    
+    def to_dict(self) -> Dict:
+        """
+        Convierte la instantanea a un diccionario serializable
+        
+        Returns:
+            Diccionario con el estado completo del mundo
+        """
+        return {
+            'grid': self.grid,
+            'rows': len(self.grid) if self.grid else 10,
+            'cols': len(self.grid[0]) if self.grid else 10,
+            'metadata': self.metadata,
+            'loaded': self.is_loaded()
+        }
+    
+    def etag(self, representation: str = "map") -> str:
+        """
+        ETag de esta version del mundo
+        
+        Args:
+            representation: Nombre de la vista ("map", "metadata"), para que
+                            cada endpoint tenga su propio ETag
+            
+        Returns:
+            ETag entre comillas
+        """
+        return f'"{representation}-{_INSTANCE}-{self.version}"'
+
+
+def _analyze_map(grid: List[List[int]], metadata: Dict) -> Tuple[Dict, Dict[int, Set[Tuple[int, int]]]]:
+    """
+    Analiza el mapa y arma los metadatos
+    Valores según especificación oficial:
+    0 = casilla libre
+    1 = obstaculo
+    2 = astronauta (posicion inicial)
+    3 = terreno rocoso (costo 3)
+    4 = terreno volcanico (costo 5)
+    5 = nave auxiliar (con combustible interno)
+    6 = muestra cientifica
+    
+    Args:
+        grid: Matriz del mapa
+        metadata: Metadatos anteriores (se conservan las claves que no se recalculan)
+        
+    Returns:
+        Tupla (metadatos nuevos, posiciones de astronauta y nave)
+    """
+    # Resetear contadores
+    metadata = dict(metadata)
+    metadata['obstacles'] = 0
+    metadata['rocky_terrain'] = 0
+    metadata['volcanic_terrain'] = 0
+    metadata['spacecraft'] = 0
+    metadata['scientific_samples'] = 0
+    metadata['astronaut_position'] = None
+    metadata['spacecraft_position'] = None
+    positions = {value: set() for value in CELL_POSITIONS}
+    
+    # Contar elementos
+    for i, row in enumerate(grid):
+        for j, cell in enumerate(row):
+            if cell in positions:
+                positions[cell].add((i, j))
+            if cell == 1:
+                metadata['obstacles'] += 1
+            elif cell == 2:
+                # Astronauta - posicion inicial
+                if metadata['astronaut_position'] is None:
+                    metadata['astronaut_position'] = [i, j]
+            elif cell == 3:
+                metadata['rocky_terrain'] += 1
+            elif cell == 4:
+                metadata['volcanic_terrain'] += 1
+            elif cell == 5:
+                # Nave auxiliar
+                metadata['spacecraft'] += 1
+                if metadata['spacecraft_position'] is None:
+                    metadata['spacecraft_position'] = [i, j]
+            elif cell == 6:
+                # Muestra cientifica
+                metadata['scientific_samples'] += 1
+    
+    # Marcar como valido
+    metadata['valid'] = True
+    return metadata, positions
+
+
 class MarsWorld:
     """
     Representa el estado del mundo marciano
     
+    grid, metadata, revision y version leen la instantanea actual; quien
+    necesite varios de ellos coherentes entre si debe usar snapshot().
+    
     Atributos:
-        grid: Matriz 10x10 con el mapa actual
         rows: Numero de filas (siempre 10)
         cols: Numero de columnas (siempre 10)
-        metadata: Informacion adicional del mapa
     """
     
     def __init__(self):
         """Inicializa un mundo vacio"""
-        self.grid: Optional[List[List[int]]] = None
         self.rows: int = 10
         self.cols: int = 10
-        self.metadata: Dict = {
+        self._write_lock = threading.Lock()
+        self._snapshot = WorldSnapshot(None, {
             'valid': False,
             'start': None,
             'goal': None,
@@ -32,7 +203,32 @@ class MarsWorld:
             'rocky_terrain': 0,
             'volcanic_terrain': 0,
             'spacecraft_fuel': 0
-        }
+        }, 0, 0, {value: set() for value in CELL_POSITIONS})
+    
+    def snapshot(self) -> WorldSnapshot:
+        """
+        Instantanea actual del mundo (no cambia aunque luego se publique otra)
+        
+        Returns:
+            WorldSnapshot vigente
+        """
+        return self._snapshot
+    
+    @property
+    def grid(self) -> Optional[List[List[int]]]:
+        return self._snapshot.grid
+    
+    @property
+    def metadata(self) -> Dict:
+        return self._snapshot.metadata
+    
+    @property
+    def revision(self) -> int:
+        return self._snapshot.revision
+    
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
     
     def load_from_text(self, text: str) -> Dict:
         """
@@ -47,80 +243,35 @@ class MarsWorld:
         Raises:
             ValueError: Si el mapa no es valido
         """
-        try:
-            # Cargar y validar el mapa
-            grid = load_map(text)
-            validate_map(grid)
+        with self._write_lock:
+            world = self._snapshot
+            try:
+                # Cargar y validar el mapa
+                grid = load_map(text)
+                validate_map(grid)
+            except ValueError as e:
+                self._snapshot = self._empty(world)
+                raise ValueError(f"Error al cargar el mapa: {str(e)}")
             
-            # Almacenar el mapa
-            self.grid = grid
-            
-            # Analizar el mapa y actualizar metadata
-            self._analyze_map()
+            # Analizar el mapa y publicarlo junto con su metadata
+            metadata, positions = _analyze_map(grid, world.metadata)
+            self._snapshot = WorldSnapshot(grid, metadata, world.revision + 1, world.version + 1, positions)
             
             return {
                 'status': 'ok',
                 'message': 'Mapa cargado exitosamente',
-                'metadata': self.metadata
+                'metadata': metadata
             }
-            
-        except ValueError as e:
-            self.reset()
-            raise ValueError(f"Error al cargar el mapa: {str(e)}")
-    
-    def _analyze_map(self):
-        """
-        Analiza el mapa y actualiza los metadatos
-        Valores según especificación oficial:
-        0 = casilla libre
-        1 = obstaculo
-        2 = astronauta (posicion inicial)
-        3 = terreno rocoso (costo 3)
-        4 = terreno volcanico (costo 5)
-        5 = nave auxiliar (con combustible interno)
-        6 = muestra cientifica
-        """
-        if not self.grid:
-            return
-        
-        # Resetear contadores
-        self.metadata['obstacles'] = 0
-        self.metadata['rocky_terrain'] = 0
-        self.metadata['volcanic_terrain'] = 0
-        self.metadata['spacecraft'] = 0
-        self.metadata['scientific_samples'] = 0
-        self.metadata['astronaut_position'] = None
-        self.metadata['spacecraft_position'] = None
-        
-        # Contar elementos
-        for i, row in enumerate(self.grid):
-            for j, cell in enumerate(row):
-                if cell == 1:
-                    self.metadata['obstacles'] += 1
-                elif cell == 2:
-                    # Astronauta - posicion inicial
-                    if self.metadata['astronaut_position'] is None:
-                        self.metadata['astronaut_position'] = [i, j]
-                elif cell == 3:
-                    self.metadata['rocky_terrain'] += 1
-                elif cell == 4:
-                    self.metadata['volcanic_terrain'] += 1
-                elif cell == 5:
-                    # Nave auxiliar
-                    self.metadata['spacecraft'] += 1
-                    if self.metadata['spacecraft_position'] is None:
-                        self.metadata['spacecraft_position'] = [i, j]
-                elif cell == 6:
-                    # Muestra cientifica
-                    self.metadata['scientific_samples'] += 1
-        
-        # Marcar como valido
-        self.metadata['valid'] = True
     
     def reset(self):
         """Limpia el estado del mundo"""
-        self.grid = None
-        self.metadata = {
+        with self._write_lock:
+            self._snapshot = self._empty(self._snapshot)
+    
+    @staticmethod
+    def _empty(world: WorldSnapshot) -> WorldSnapshot:
+        """Instantanea sin mapa que sucede a world"""
+        return WorldSnapshot(None, {
             'valid': False,
             'astronaut_position': None,
             'spacecraft_position': None,
@@ -129,22 +280,19 @@ class MarsWorld:
             'rocky_terrain': 0,
             'volcanic_terrain': 0,
             'spacecraft': 0
-        }
+        }, world.revision + 1, world.version + 1, {value: set() for value in CELL_POSITIONS})
     
     def to_dict(self) -> Dict:
         """
-        Convierte el mundo a un diccionario serializable
-        
-        Returns:
-            Diccionario con el estado completo del mundo
+        Convierte el mundo a un diccionario serializable (ver WorldSnapshot.to_dict)
         """
-        return {
-            'grid': self.grid,
-            'rows': self.rows,
-            'cols': self.cols,
-            'metadata': self.metadata,
-            'loaded': self.is_loaded()
-        }
+        return self._snapshot.to_dict()
+    
+    def etag(self, representation: str = "map") -> str:
+        """
+        ETag de la version actual del mundo (ver WorldSnapshot.etag)
+        """
+        return self._snapshot.etag(representation)
     
     def is_loaded(self) -> bool:
         """
@@ -153,28 +301,72 @@ class MarsWorld:
         Returns:
             True si el mapa esta cargado y es valido
         """
-        return self.grid is not None and self.metadata['valid']
+        return self._snapshot.is_loaded()
     
     def get_cell(self, row: int, col: int) -> Optional[int]:
         """
-        Obtiene el valor de una celda especifica
+        Obtiene el valor de una celda especifica (ver WorldSnapshot.get_cell)
+        """
+        return self._snapshot.get_cell(row, col)
+    
+    def set_cells(self, edits: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        """
+        Cambia el valor de varias celdas (todas o ninguna)
+        
+        Se copian solo las filas editadas; las demas se comparten con la
+        instantanea anterior. La cache por mapa y los planificadores
+        incrementales se actualizan antes de publicar, con las revisiones
+        exactas de este cambio.
         
         Args:
-            row: Fila (0-9)
-            col: Columna (0-9)
+            edits: Tuplas (fila, columna, valor nuevo)
             
         Returns:
-            Valor de la celda o None si no esta cargado
+            Tuplas (fila, columna, valor nuevo) de las celdas que cambiaron
+            
+        Raises:
+            ValueError: Si no hay mapa cargado o alguna edicion no es valida
         """
-        if not self.is_loaded():
-            return None
-        
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.grid[row][col]
-        
-        return None
+        with self._write_lock:
+            world = self._snapshot
+            if not world.is_loaded():
+                raise ValueError("No hay mapa cargado")
+            
+            # Validar todo antes de modificar
+            for row, col, value in edits:
+                if not (0 <= row < self.rows and 0 <= col < self.cols):
+                    raise ValueError(f"La celda {[row, col]} esta fuera del mapa")
+                if value not in range(7):
+                    raise ValueError(f"Valor invalido {value} en la celda {[row, col]}: debe estar entre 0 y 6")
+            
+            grid = list(world.grid)
+            metadata = dict(world.metadata)
+            positions = dict(world.positions)
+            copied = set()
+            changes = []
+            cache_changes = []
+            for row, col, value in edits:
+                old = grid[row][col]
+                if old != value:
+                    if row not in copied:
+                        grid[row] = list(grid[row])
+                        copied.add(row)
+                    grid[row][col] = value
+                    _update_metadata(metadata, positions, row, col, old, value)
+                    changes.append((row, col, value))
+                    cache_changes.append((row, col, old, value))
+            
+            if changes:
+                new = WorldSnapshot(grid, metadata, world.revision + 1, world.version + 1, positions)
+                # Las estructuras cacheadas que no dependen de los valores cambiados se conservan
+                map_cache.apply_edits(map_fingerprint(world.grid), grid, cache_changes)
+                # Los planificadores incrementales reparan su estado en vez de descartarlo
+                incremental_planners.cells_changed(changes, world.revision, new.revision)
+                self._snapshot = new
+            
+            return changes
     
-    def set_goal(self, row: int, col: int) -> bool:
+    def set_goal(self, row: int, col: int) -> Optional[WorldSnapshot]:
         """
         Establece la posicion objetivo (meta)
         
@@ -183,16 +375,53 @@ class MarsWorld:
             col: Columna (0-9)
             
         Returns:
-            True si se establecio correctamente
+            La instantanea publicada con el objetivo, o None si no se
+            pudo establecer
         """
-        if not self.is_loaded():
-            return False
-        
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.metadata['goal'] = (row, col)
-            return True
-        
-        return False
+        with self._write_lock:
+            world = self._snapshot
+            if not world.is_loaded():
+                return None
+            
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                metadata = dict(world.metadata)
+                metadata['goal'] = (row, col)
+                self._snapshot = WorldSnapshot(world.grid, metadata, world.revision, world.version + 1,
+                                               world.positions)
+                return self._snapshot
+            
+            return None
+
+
+def _update_metadata(metadata: Dict, positions: Dict[int, Set[Tuple[int, int]]],
+                     row: int, col: int, old: int, new: int):
+    """
+    Actualiza contadores y posiciones por el cambio de una celda, sin
+    recorrer el mapa. metadata y positions deben ser copias de la instantanea
+    anterior; los conjuntos de posiciones se copian antes de modificarlos
+    
+    Args:
+        metadata: Metadatos de la nueva instantanea
+        positions: Posiciones de la nueva instantanea
+        row: Fila de la celda
+        col: Columna de la celda
+        old: Valor anterior
+        new: Valor nuevo
+    """
+    if old in CELL_COUNTERS:
+        metadata[CELL_COUNTERS[old]] -= 1
+    if new in CELL_COUNTERS:
+        metadata[CELL_COUNTERS[new]] += 1
+    
+    for value in (old, new):
+        if value in CELL_POSITIONS:
+            cells = set(positions[value])
+            if value == old:
+                cells.discard((row, col))
+            else:
+                cells.add((row, col))
+            positions[value] = cells
+            metadata[CELL_POSITIONS[value]] = list(min(cells)) if cells else None
 
 
 # Instancia global del mundo
@@ -3,11 +3,16 @@ Map Routes
 Endpoints para gestion de mapas del Smart Astronaut
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+import base64
+import hashlib
+
+import numpy as np
+from fastapi import APIRouter, UploadFile, File, Header, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
+from core.etag import etag_matches, json_with_etag, not_modified
 from core.world_state import mars_world
 
 
@@ -20,6 +25,18 @@ class GoalRequest(BaseModel):
     col: int
 
 
+class CellEdit(BaseModel):
+    """Nuevo valor de una celda"""
+    row: int
+    col: int
+    value: int
+
+
+class CellsRequest(BaseModel):
+    """Modelo para editar varias celdas a la vez"""
+    cells: List[CellEdit]
+
+
 @router.post("/upload")
 async def upload_map(file: UploadFile = File(...)):
     """
@@ -44,13 +61,14 @@ async def upload_map(file: UploadFile = File(...)):
         text = content.decode('utf-8')
         
         # Cargar el mapa en el mundo
-        result = mars_world.load_from_text(text)
+        mars_world.load_from_text(text)
+        world = mars_world.snapshot()
         
         return {
             "status": "ok",
             "message": "Mapa cargado exitosamente",
-            "metadata": mars_world.metadata,
-            "map": mars_world.grid
+            "metadata": world.metadata,
+            "map": world.grid
         }
         
     except ValueError as e:
@@ -66,20 +84,28 @@ async def upload_map(file: UploadFile = File(...)):
 
 
 @router.get("")
-async def get_map():
+async def get_map(if_none_match: Optional[str] = Header(None)):
     """
     Obtiene el mapa actual si esta cargado
     
+    Lleva un ETag con la version del mundo: si coincide con If-None-Match se
+    responde 304 sin volver a serializar el mapa.
+    
     Returns:
         Mapa y metadatos o error 404
     """
-    if not mars_world.is_loaded():
+    world = mars_world.snapshot()
+    if not world.is_loaded():
         raise HTTPException(
             status_code=404,
             detail="No map loaded"
         )
     
-    return mars_world.to_dict()
+    etag = world.etag("map")
+    if etag_matches(etag, if_none_match):
+        return not_modified(etag)
+    
+    return json_with_etag(world.to_dict(), etag)
 
 
 @router.post("/reset")
@@ -121,9 +147,11 @@ async def set_goal(goal: GoalRequest):
             detail="Goal position must be within 0-9 range"
         )
     
-    success = mars_world.set_goal(goal.row, goal.col)
+    # Responder con la instantanea que publico esta escritura (otra edicion
+    # concurrente puede publicar una nueva antes de armar la respuesta)
+    world = mars_world.set_goal(goal.row, goal.col)
     
-    if not success:
+    if world is None:
         raise HTTPException(
             status_code=500,
             detail="Failed to set goal"
@@ -133,7 +161,7 @@ async def set_goal(goal: GoalRequest):
         "status": "ok",
         "message": "Goal set successfully",
         "goal": (goal.row, goal.col),
-        "metadata": mars_world.metadata
+        "metadata": world.metadata
     }
 
 
@@ -149,7 +177,8 @@ async def get_cell(row: int, col: int):
     Returns:
         Valor de la celda
     """
-    if not mars_world.is_loaded():
+    world = mars_world.snapshot()
+    if not world.is_loaded():
         raise HTTPException(
             status_code=404,
             detail="No map loaded"
@@ -161,7 +190,7 @@ async def get_cell(row: int, col: int):
             detail="Position must be within 0-9 range"
         )
     
-    cell_value = mars_world.get_cell(row, col)
+    cell_value = world.get_cell(row, col)
     
     return {
         "row": row,
@@ -170,21 +199,159 @@ async def get_cell(row: int, col: int):
     }
 
 
+def _parse_cells(cells: str) -> List[List[int]]:
+    """
+    Convierte "fila,col;fila,col;..." en una lista de coordenadas
+    
+    Raises:
+        ValueError: Si el formato no es valido
+    """
+    coords = []
+    for item in cells.split(";"):
+        parts = item.split(",")
+        if len(parts) != 2:
+            raise ValueError(f"Coordenada invalida '{item}': use fila,columna")
+        coords.append([int(parts[0]), int(parts[1])])
+    return coords
+
+
+@router.get("/region")
+async def get_region(
+    row: int = 0,
+    col: int = 0,
+    height: Optional[int] = None,
+    width: Optional[int] = None,
+    cells: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Obtiene varias celdas en una sola peticion, empaquetadas como uint8
+    
+    Se puede pedir un rectangulo (row, col, height, width; por defecto el
+    mapa completo) o una lista de coordenadas (cells="fila,col;fila,col").
+    Los valores van en data como base64 de un arreglo uint8 en orden de
+    filas con la forma indicada en shape. La respuesta lleva un ETag del
+    contenido: si coincide con If-None-Match se responde 304 sin cuerpo.
+    
+    Args:
+        row: Fila de la esquina superior izquierda del rectangulo
+        col: Columna de la esquina superior izquierda del rectangulo
+        height: Filas del rectangulo
+        width: Columnas del rectangulo
+        cells: Lista de coordenadas (reemplaza al rectangulo)
+        
+    Returns:
+        shape, dtype y data (y origin o cells segun el tipo de consulta)
+    """
+    world = mars_world.snapshot()
+    if not world.is_loaded():
+        raise HTTPException(
+            status_code=404,
+            detail="No map loaded"
+        )
+    
+    grid = np.asarray(world.grid, dtype=np.uint8)
+    rows, cols = grid.shape
+    
+    if cells is not None:
+        try:
+            coords = _parse_cells(cells)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        for r, c in coords:
+            if not (0 <= r < rows and 0 <= c < cols):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"La celda {[r, c]} esta fuera del mapa"
+                )
+        indices = np.array(coords, dtype=np.intp).reshape(-1, 2)
+        values = grid[indices[:, 0], indices[:, 1]]
+        content = {"cells": coords}
+    else:
+        height = rows - row if height is None else height
+        width = cols - col if width is None else width
+        if height <= 0 or width <= 0 or not (0 <= row and row + height <= rows and 0 <= col and col + width <= cols):
+            raise HTTPException(
+                status_code=400,
+                detail="El rectangulo debe estar dentro del mapa"
+            )
+        values = grid[row:row + height, col:col + width]
+        content = {"origin": [row, col]}
+    
+    data = np.ascontiguousarray(values).tobytes()
+    digest = hashlib.sha1(data)
+    digest.update(repr(values.shape).encode())
+    etag = f'"{digest.hexdigest()[:20]}"'
+    
+    if etag_matches(etag, if_none_match):
+        return not_modified(etag)
+    
+    return json_with_etag({
+        "shape": list(values.shape),
+        "dtype": "uint8",
+        "data": base64.b64encode(data).decode("ascii"),
+        **content
+    }, etag)
+
+
+@router.patch("/cells")
+async def update_cells(request: CellsRequest):
+    """
+    Cambia el valor de varias celdas del mapa (por ejemplo, un derrumbe que
+    agrega un obstaculo o un camino despejado)
+    
+    Args:
+        request: Lista de celdas con su nuevo valor (0-6)
+        
+    Returns:
+        Celdas que cambiaron, revision del mapa y metadatos
+    """
+    if not mars_world.is_loaded():
+        raise HTTPException(
+            status_code=404,
+            detail="No map loaded"
+        )
+    
+    try:
+        # set_cells tambien actualiza la cache y los planificadores incrementales
+        changes = mars_world.set_cells([(cell.row, cell.col, cell.value) for cell in request.cells])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    world = mars_world.snapshot()
+    return {
+        "status": "ok",
+        "changed": [{"row": row, "col": col, "value": value} for row, col, value in changes],
+        "revision": world.revision,
+        "metadata": world.metadata
+    }
+
+
 @router.get("/metadata")
-async def get_metadata():
+async def get_metadata(if_none_match: Optional[str] = Header(None)):
     """
     Obtiene solo los metadatos del mapa sin el grid completo
     
+    Lleva un ETag con la version del mundo (304 si no cambio).
+    
     Returns:
         Metadatos del mapa
     """
-    if not mars_world.is_loaded():
+    world = mars_world.snapshot()
+    if not world.is_loaded():
         raise HTTPException(
             status_code=404,
             detail="No map loaded"
         )
     
-    return {
-        "metadata": mars_world.metadata,
+    etag = world.etag("metadata")
+    if etag_matches(etag, if_none_match):
+        return not_modified(etag)
+    
+    return json_with_etag({
+        "metadata": world.metadata,
         "loaded": True
-    }
+    }, etag)
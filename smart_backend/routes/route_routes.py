@@ -0,0 +1,101 @@
+"""
+Route Routes
+Endpoint de rutas punto a punto hasta el objetivo fijado en el mapa
+"""
+
+from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from core.hierarchical import DEFAULT_CLUSTER_SIZE, find_route_hierarchical
+from core.incremental import find_route_incremental
+from core.landmarks import DEFAULT_LANDMARKS
+from core.routing import find_route
+from core.world_state import mars_world
+
+
+router = APIRouter(tags=["route"])
+
+
+@router.get("")
+async def get_route(
+    mode: str = "terrain",
+    bidirectional: bool = True,
+    start_row: Optional[int] = None,
+    start_col: Optional[int] = None,
+    hierarchical: bool = False,
+    cluster_size: int = DEFAULT_CLUSTER_SIZE,
+    heuristic: Optional[str] = None,
+    landmarks: int = DEFAULT_LANDMARKS,
+    incremental: bool = False
+):
+    """
+    Calcula la ruta mas corta hasta el objetivo (POST /api/map/goal)
+
+    Args:
+        mode: "unit" (BFS, minimiza movimientos) o "terrain" (Dijkstra, costo de terreno)
+        bidirectional: Buscar desde ambos extremos (True por defecto)
+        start_row: Fila inicial (por defecto la posicion del astronauta)
+        start_col: Columna inicial (por defecto la posicion del astronauta)
+        hierarchical: Usar HPA* con la abstraccion por clusters cacheada
+                      (solo modo "terrain"; para mapas grandes, no siempre optima)
+        cluster_size: Lado de los clusters de HPA*
+        heuristic: "manhattan" o "alt" para usar A* (landmarks cacheados por mapa)
+        landmarks: Cantidad de landmarks para heuristic="alt"
+        incremental: Usar D* Lite conservando su estado entre consultas; tras
+                     editar celdas (PATCH /api/map/cells) solo repara la zona afectada
+
+    Returns:
+        Ruta, costo, movimientos y nodos expandidos
+    """
+    # Una sola instantanea para toda la consulta: aunque se editen celdas en
+    # paralelo, el mapa, la revision y los metadatos son coherentes
+    world = mars_world.snapshot()
+    if not world.is_loaded():
+        raise HTTPException(
+            status_code=404,
+            detail="No map loaded. Please upload a map first."
+        )
+
+    goal = world.metadata.get('goal')
+    if goal is None:
+        raise HTTPException(
+            status_code=400,
+            detail="No goal set. Use POST /api/map/goal first."
+        )
+
+    if start_row is not None and start_col is not None:
+        start = (start_row, start_col)
+    else:
+        start = world.metadata.get('astronaut_position')
+        if start is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Map has no astronaut position; provide start_row and start_col"
+            )
+
+    try:
+        if incremental:
+            if hierarchical or heuristic is not None:
+                raise ValueError("La busqueda incremental no se combina con hierarchical ni heuristic")
+            result = find_route_incremental(world.grid, world.revision, start, goal, mode=mode)
+        elif hierarchical:
+            if mode != "terrain":
+                raise ValueError("La busqueda jerarquica solo admite el modo 'terrain'")
+            result = find_route_hierarchical(world.grid, start, goal, cluster_size=cluster_size)
+        else:
+            result = find_route(world.grid, start, goal, mode=mode, bidirectional=bidirectional,
+                                heuristic=heuristic, landmarks=landmarks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "status": "ok",
+        "mode": mode,
+        "bidirectional": bidirectional,
+        "hierarchical": hierarchical,
+        "heuristic": heuristic,
+        "incremental": incremental,
+        "start": list(start),
+        "goal": list(goal),
+        **result
+    }
@@ -111,3 +111,27 @@ def invalid_map_non_numeric():
 0 0 0 0 0 0 0 0 0 0
 0 0 0 0 0 0 0 0 0 0
 0 0 0 0 0 0 0 0 0 0"""
+
+
+@pytest.fixture
+def bundled_maps():
+    """
+    Fixture que proporciona los mapas mapa*.txt incluidos en el repositorio
+    como diccionario nombre -> (grid, posicion inicial)
+    """
+    from benchmarks.maps import find_start, load_bundled_maps
+
+    return {
+        name: (grid, find_start(grid))
+        for name, grid in load_bundled_maps().items()
+    }
+
+
+def pytest_addoption(parser):
+    """Opciones de linea de comandos propias del proyecto"""
+    parser.addoption(
+        "--update-golden",
+        action="store_true",
+        default=False,
+        help="Regenerar los archivos golden de tests/golden en vez de compararlos"
+    )
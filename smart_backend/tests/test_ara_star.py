@@ -0,0 +1,99 @@
+"""
+Test suite para el algoritmo ARA* (Anytime Repairing A*)
+Verifica las soluciones mejoradas, sus cotas y el plazo
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import ara_star, astar
+from benchmarks.maps import find_start, generate_map
+
+
+class TestAraStar:
+    """Tests para algorithms/ara_star.py"""
+
+    def test_reaches_optimal_cost_without_deadline(self, bundled_maps):
+        """
+        Test: Sin plazo, ARA* debe terminar con el costo optimo de A*
+        """
+        for name, (grid, start) in bundled_maps.items():
+            expected = astar.solve({"map": grid, "start": start})
+            result = ara_star.solve({"map": grid, "start": start})
+
+            assert result["cost"] == expected["cost"], f"Costo distinto en {name}"
+            assert result["suboptimality_bound"] == 1.0
+
+    def test_solutions_improve_and_respect_bounds(self):
+        """
+        Test: Cada solucion reportada cuesta a lo sumo cota * optimo y los
+        costos nunca empeoran
+        """
+        for seed in range(20):
+            grid = generate_map(seed)
+            params = {"map": grid, "start": find_start(grid)}
+            optimal = astar.solve(params)["cost"]
+            solutions = ara_star.solve(params)["solutions"]
+
+            costs = [solution["cost"] for solution in solutions]
+            assert costs == sorted(costs, reverse=True)
+            for solution in solutions:
+                assert solution["cost"] <= solution["suboptimality_bound"] * optimal
+
+    def test_weights_decrease(self, bundled_maps):
+        """
+        Test: El peso de cada solucion reportada nunca sube
+        """
+        grid, start = bundled_maps["mapa4.txt"]
+        solutions = ara_star.solve({"map": grid, "start": start, "initial_weight": 4.0})["solutions"]
+
+        weights = [solution["weight"] for solution in solutions]
+        assert weights[0] == 4.0
+        assert weights == sorted(weights, reverse=True)
+
+    def test_expired_deadline_stops_search(self, bundled_maps):
+        """
+        Test: Con plazo cero la busqueda se detiene sin expandir nodos
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = ara_star.solve({"map": grid, "start": start, "time_limit": 0})
+
+        assert result["nodes_expanded"] == 0
+        assert result["path"] == []
+
+    def test_interrupted_first_pass_bound_is_valid(self, bundled_maps, monkeypatch):
+        """
+        Test: Si el plazo corta la primera pasada despues de hallar una
+        solucion, la cota informada sigue cumpliendo costo <= cota * optimo
+        (el peso de una pasada interrumpida no esta garantizado)
+        """
+        class StepClock:
+            """Reloj que avanza un segundo en cada consulta (plazo = consultas)"""
+            def __init__(self):
+                self.now = 0.0
+
+            def __call__(self):
+                self.now += 1.0
+                return self.now
+
+        grid, start = bundled_maps["mapa3.txt"]
+        params = {"map": grid, "start": start, "initial_weight": 1.1}
+        optimal = astar.solve(params)["cost"]
+        first_pass = ara_star.solve(params)["solutions"][0]
+
+        interrupted = 0
+        for limit in range(150, 300):
+            monkeypatch.setattr(ara_star.time, "perf_counter", StepClock())
+            result = ara_star.solve({**params, "time_limit": limit})
+            monkeypatch.undo()
+            if not result["path"]:
+                continue
+            assert result["cost"] <= result["suboptimality_bound"] * optimal, f"plazo {limit}"
+            if result["solutions"][0]["nodes_expanded"] < first_pass["nodes_expanded"]:
+                interrupted += 1
+
+        assert interrupted > 0
@@ -0,0 +1,75 @@
+"""
+Test suite para la busqueda en haz (beam search)
+Verifica el ancho del haz, el reintento con ensanchamiento y los caminos
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar, beam_search
+
+
+class TestBeamSearch:
+    """Tests para algorithms/beam_search.py"""
+
+    def test_finds_valid_paths_on_bundled_maps(self, bundled_maps):
+        """
+        Test: Con el ancho por defecto encuentra un camino conexo en cada mapa
+        y nunca cuesta menos que el optimo
+        """
+        for name, (grid, start) in bundled_maps.items():
+            result = beam_search.solve({"map": grid, "start": start})
+            optimal = astar.solve({"map": grid, "start": start})["cost"]
+
+            path = result["path"]
+            assert path, f"Sin camino en {name}"
+            assert path[0] == start
+            for (r1, c1), (r2, c2) in zip(path, path[1:]):
+                assert abs(r1 - r2) + abs(c1 - c2) == 1
+            assert result["cost"] >= optimal
+
+    def test_narrow_beam_can_fail(self, bundled_maps):
+        """
+        Test: Un haz de ancho 1 sin ensanchamiento no resuelve mapa.txt
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = beam_search.solve({"map": grid, "start": start, "beam_width": 1})
+
+        assert result["path"] == []
+        assert len(result["attempts"]) == 1
+
+    def test_widening_retries_until_solution(self, bundled_maps):
+        """
+        Test: Con ensanchamiento el ancho se duplica hasta encontrar solucion
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = beam_search.solve({
+            "map": grid,
+            "start": start,
+            "beam_width": 1,
+            "beam_widening": True
+        })
+
+        widths = [attempt["beam_width"] for attempt in result["attempts"]]
+        assert result["path"]
+        assert widths[0] == 1
+        assert all(b == 2 * a for a, b in zip(widths, widths[1:]))
+
+    def test_widening_respects_max_width(self, bundled_maps):
+        """
+        Test: El ensanchamiento no supera max_beam_width
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = beam_search.solve({
+            "map": grid,
+            "start": start,
+            "beam_width": 1,
+            "beam_widening": True,
+            "max_beam_width": 1
+        })
+
+        assert [attempt["beam_width"] for attempt in result["attempts"]] == [1]
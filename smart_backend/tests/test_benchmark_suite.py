@@ -0,0 +1,71 @@
+"""
+Test suite para la suite de benchmarks (benchmarks/suite.py)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.maps import generate_map
+from benchmarks.suite import compare, percentile, registered_algorithms, run_suite
+
+
+class TestBenchmarkSuite:
+    """Tests de la suite de benchmarks"""
+
+    def test_registered_algorithms(self):
+        """
+        Test: Se descubren los algoritmos de algorithms/
+        """
+        names = registered_algorithms()
+        assert "bfs" in names and "astar" in names
+        assert "__init__" not in names
+
+    def test_report_is_json(self):
+        """
+        Test: Cada combinacion reporta tiempos, nodos y memoria, y el
+        resultado se puede serializar como JSON
+        """
+        maps = {"gen": generate_map(0)}
+        report = run_suite(["bfs", "astar"], maps, warmup=1, repeats=3)
+        assert report["environment"]["repeats"] == 3
+        assert len(report["results"]) == 2
+
+        for row in report["results"]:
+            assert row["found"] is True
+            assert row["nodes_expanded"] > 0
+            assert row["min_ms"] <= row["median_ms"] <= row["p95_ms"]
+            assert row["nodes_per_sec"] > 0
+            assert row["peak_kib"] > 0
+        json.dumps(report)
+
+    def test_percentile_and_compare(self):
+        """
+        Test: El percentil interpola entre muestras y la comparacion da
+        razones contra la ejecucion base
+        """
+        assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+        assert percentile([1, 2], 0.95) == 1.95
+
+        base = {"results": [{"algorithm": "bfs", "map": "m", "median_ms": 2.0, "nodes_expanded": 10}]}
+        current = {"results": [{"algorithm": "bfs", "map": "m", "median_ms": 1.0, "nodes_expanded": 10},
+                               {"algorithm": "dfs", "map": "m", "median_ms": 1.0, "nodes_expanded": 5}]}
+        assert compare(current, base) == [{"algorithm": "bfs", "map": "m", "time_ratio": 0.5, "nodes_ratio": 1.0}]
+
+    def test_measures_are_cold(self, bundled_maps):
+        """
+        Test: Cada repeticion vacia la cache por mapa, asi que los algoritmos
+        con tablas por mapa reportan la construccion (antes reverse_search
+        daba 0 nodos porque todas las repeticiones eran aciertos de cache)
+        """
+        grid, _ = bundled_maps["mapa4.txt"]
+        report = run_suite(["reverse_search"], {"mapa4.txt": grid}, warmup=1, repeats=2)
+        row = report["results"][0]
+
+        assert row["found"] is True
+        assert row["nodes_expanded"] > 0
+        assert row["nodes_per_sec"] > 0
+        assert row["peak_kib"] > 0
@@ -0,0 +1,85 @@
+"""
+Test suite para las respuestas condicionales (ETag / If-None-Match)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.world_state import mars_world
+from tests.test_route import ROUTE_MAP
+
+
+@pytest.fixture
+def loaded_world():
+    """Carga ROUTE_MAP en el mundo global y lo limpia al terminar"""
+    mars_world.load_from_text(ROUTE_MAP)
+    yield mars_world
+    mars_world.reset()
+
+
+class TestConditionalGet:
+    """Tests de ETag en /api/map, /api/map/metadata y /api/algorithms"""
+
+    @pytest.mark.parametrize("url", ["/api/map", "/api/map/metadata", "/api/algorithms"])
+    def test_not_modified(self, client, loaded_world, url):
+        """
+        Test: Con el ETag vigente en If-None-Match se responde 304 sin cuerpo
+        """
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+        weak = client.get(url, headers={"If-None-Match": f'"otro", W/{etag}'})
+        assert weak.status_code == 304
+
+    def test_map_and_metadata_have_distinct_etags(self, client, loaded_world):
+        """
+        Test: Cada vista del mundo tiene su propio ETag
+        """
+        assert client.get("/api/map").headers["etag"] != client.get("/api/map/metadata").headers["etag"]
+
+    def test_cell_edit_changes_etag(self, client, loaded_world):
+        """
+        Test: Editar celdas invalida el ETag del mapa y de los metadatos
+        """
+        etags = {url: client.get(url).headers["etag"] for url in ("/api/map", "/api/map/metadata")}
+        client.patch("/api/map/cells", json={"cells": [{"row": 0, "col": 0, "value": 1}]})
+
+        for url, etag in etags.items():
+            response = client.get(url, headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+        assert client.get("/api/map").json()["grid"][0][0] == 1
+
+    def test_noop_edit_keeps_etag(self, client, loaded_world):
+        """
+        Test: Una edicion que no cambia ninguna celda conserva el ETag
+        """
+        etag = client.get("/api/map").headers["etag"]
+        value = loaded_world.grid[0][0]
+        client.patch("/api/map/cells", json={"cells": [{"row": 0, "col": 0, "value": value}]})
+        assert client.get("/api/map", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_reload_changes_etag(self, client, loaded_world):
+        """
+        Test: Volver a cargar el mismo mapa cambia el ETag (puede haber cambiado el objetivo)
+        """
+        etag = client.get("/api/map").headers["etag"]
+        loaded_world.load_from_text(ROUTE_MAP)
+        assert client.get("/api/map", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_algorithms_etag_is_stable(self, client):
+        """
+        Test: El ETag de la lista de algoritmos no cambia entre solicitudes
+        """
+        first = client.get("/api/algorithms").headers["etag"]
+        assert client.get("/api/algorithms").headers["etag"] == first
@@ -0,0 +1,71 @@
+"""
+Test suite para la poda por dominancia de combustible de Costo Uniforme y A*
+(dominance_pruning) y la optimalidad de Costo Uniforme
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar, uniform_cost
+from benchmarks.maps import find_start, generate_map
+from core.cost_to_go import build_cost_to_go
+
+SOLVERS = {"uniform_cost": uniform_cost, "astar": astar}
+
+
+class TestDominancePruning:
+    """Tests de la opcion dominance_pruning"""
+
+    @pytest.mark.parametrize("name", sorted(SOLVERS))
+    def test_same_cost_with_and_without_pruning(self, bundled_maps, name):
+        """
+        Test: Con y sin poda el costo es el mismo y es el optimo de la busqueda inversa
+        """
+        for map_name, (grid, start) in bundled_maps.items():
+            pruned = SOLVERS[name].solve({"map": grid, "start": start})
+            plain = SOLVERS[name].solve({"map": grid, "start": start, "dominance_pruning": False})
+
+            assert pruned["cost"] == plain["cost"], map_name
+            assert pruned["cost"] == build_cost_to_go(grid).cost(tuple(start)), map_name
+
+    @pytest.mark.parametrize("name", sorted(SOLVERS))
+    def test_pruning_reduces_expansions(self, bundled_maps, name):
+        """
+        Test: La poda descarta estados y nunca expande mas nodos; en total
+        expande menos (mapa2.txt es tan pequeno que no hay estados dominados,
+        y con la heuristica por defecto A* a veces ya no expande los dominados)
+        """
+        pruned_total, plain_total = 0, 0
+        for map_name, (grid, start) in bundled_maps.items():
+            pruned = SOLVERS[name].solve({"map": grid, "start": start})
+            plain = SOLVERS[name].solve({"map": grid, "start": start, "dominance_pruning": False})
+
+            assert plain["dominance_pruned"] == 0, map_name
+            assert pruned["nodes_expanded"] <= plain["nodes_expanded"], map_name
+            if map_name != "mapa2.txt":
+                assert pruned["dominance_pruned"] > 0, map_name
+            pruned_total += pruned["nodes_expanded"]
+            plain_total += plain["nodes_expanded"]
+
+        assert pruned_total < plain_total
+
+
+class TestUniformCostOptimality:
+    """Tests de optimalidad de algorithms/uniform_cost.py"""
+
+    def test_cheaper_path_to_generated_state_is_kept(self):
+        """
+        Test: Un estado ya generado se actualiza si aparece un camino más
+        barato (en este mapa marcarlo al generarlo daba costo 23.0)
+        """
+        grid = generate_map(220)
+        start = find_start(grid)
+        optimum = build_cost_to_go(grid).cost(tuple(start))
+        assert optimum == 21.0
+        for pruning in (True, False):
+            result = uniform_cost.solve({"map": grid, "start": start, "dominance_pruning": pruning})
+            assert result["cost"] == optimum
@@ -0,0 +1,260 @@
+"""
+Test suite para los campos de distancia (core/distance_fields.py), las
+tablas heuristicas (core/heuristics.py) y su uso en A*
+"""
+
+import pytest
+import sys
+from collections import deque
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar, greedy
+from benchmarks.maps import find_start, generate_map
+from core.cost_to_go import build_cost_to_go
+from core.distance_fields import UNREACHABLE, bfs_distance_field, get_distance_fields
+from core.heuristics import get_fuel_aware_heuristic, get_mst_table, get_subset_table
+
+
+def min_moves_to_collect(grid, start, samples):
+    """BFS sobre (posicion, muestras) para los movimientos minimos exactos"""
+    samples = frozenset(samples)
+    initial = (start, frozenset({start}) & samples)
+    seen = {initial}
+    queue = deque([(initial, 0)])
+    while queue:
+        (pos, collected), moves = queue.popleft()
+        if collected == samples:
+            return moves
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = pos[0] + dr, pos[1] + dc
+            if 0 <= r < len(grid) and 0 <= c < len(grid[0]) and grid[r][c] != 1:
+                state = ((r, c), collected | ({(r, c)} & samples))
+                if state not in seen:
+                    seen.add(state)
+                    queue.append((state, moves + 1))
+    return float('inf')
+
+
+class TestDistanceFields:
+    """Tests para core/distance_fields.py"""
+
+    def test_bfs_field_goes_around_obstacles(self):
+        """
+        Test: La distancia rodea los obstaculos y marca UNREACHABLE lo inalcanzable
+        """
+        grid = [
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 0, 0],
+        ]
+        field = bfs_distance_field(grid, (0, 0))
+        assert field[0][2] == 6
+        assert field[0][1] == UNREACHABLE
+
+        grid[2][1] = 1
+        assert bfs_distance_field(grid, (0, 0))[0][2] == UNREACHABLE
+
+    def test_wavefront_matches_queue_bfs(self):
+        """
+        Test: El frente de onda vectorizado da las mismas distancias que un
+        BFS con cola en mapas generados de varios tamanos
+        """
+        for seed, size in ((0, 10), (1, 25), (2, 40)):
+            grid = generate_map(seed, size=size, obstacle_density=0.3)
+            source = find_start(grid)
+            field = bfs_distance_field(grid, source)
+            expected = {tuple(source): 0}
+            queue = deque([tuple(source)])
+            while queue:
+                r, c = queue.popleft()
+                for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < size and 0 <= nc < size and grid[nr][nc] != 1 \
+                            and (nr, nc) not in expected:
+                        expected[(nr, nc)] = expected[(r, c)] + 1
+                        queue.append((nr, nc))
+            for r in range(size):
+                for c in range(size):
+                    assert field[r][c] == expected.get((r, c), UNREACHABLE)
+
+    def test_nearest_sample_field(self, bundled_maps):
+        """
+        Test: El campo de la muestra mas cercana es el minimo de los campos
+        de las muestras restantes
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        fields = get_distance_fields(grid)
+        collected = frozenset(fields.samples[:1])
+        nearest = fields.nearest_sample_field(collected)
+        for r in range(10):
+            for c in range(10):
+                options = [
+                    int(field[r][c]) for field in fields.sample_fields[1:]
+                    if field[r][c] != UNREACHABLE
+                ]
+                assert nearest[r][c] == (min(options) if options else float('inf'))
+        assert fields.nearest_sample_field(frozenset(fields.samples))[0][0] == 0
+
+    def test_fields_for_samples_and_ship(self, bundled_maps):
+        """
+        Test: Hay un campo por muestra y uno para la nave
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        fields = get_distance_fields(grid)
+        assert len(fields.sample_fields) == 3
+        assert fields.ship is not None
+        assert fields.ship_field[fields.ship[0]][fields.ship[1]] == 0
+        for i, (r, c) in enumerate(fields.samples):
+            assert fields.pairwise[i][i] == 0
+            assert fields.sample_fields[i][r][c] == 0
+
+
+class TestHeuristicTables:
+    """Tests para las tablas subset_dp y mst y su uso en A*"""
+
+    def test_moves_are_exact(self, bundled_maps):
+        """
+        Test: La tabla da exactamente los movimientos minimos para recoger
+        las muestras restantes
+        """
+        for name, (grid, _) in bundled_maps.items():
+            table = get_subset_table(grid)
+            for r in range(10):
+                for c in range(10):
+                    if grid[r][c] == 1:
+                        continue
+                    collected = frozenset({(r, c)}) & frozenset(table.samples)
+                    expected = min_moves_to_collect(grid, (r, c), table.samples)
+                    assert table.moves((r, c), collected) == expected, f"{name} {(r, c)}"
+
+    def test_astar_keeps_optimal_cost(self):
+        """
+        Test: A* con subset_dp encuentra el mismo costo que con Manhattan
+        """
+        for seed in range(30):
+            grid = generate_map(seed)
+            start = find_start(grid)
+            manhattan = astar.solve({"map": grid, "start": start, "heuristic": "manhattan"})
+            subset = astar.solve({"map": grid, "start": start, "heuristic": "subset_dp"})
+            assert subset["cost"] == manhattan["cost"], f"seed {seed}"
+
+    def test_astar_expands_fewer_nodes(self, bundled_maps):
+        """
+        Test: subset_dp no expande más nodos que Manhattan en los mapas incluidos
+        """
+        total_manhattan = total_subset = 0
+        for grid, start in bundled_maps.values():
+            total_manhattan += astar.solve(
+                {"map": grid, "start": start, "heuristic": "manhattan"}
+            )["nodes_expanded"]
+            total_subset += astar.solve({"map": grid, "start": start})["nodes_expanded"]
+        assert total_subset < total_manhattan
+
+    def test_mst_never_exceeds_exact_moves(self, bundled_maps):
+        """
+        Test: La cota mst es admisible (nunca supera la tabla exacta) y
+        nunca es peor que la distancia a la muestra más cercana
+        """
+        for grid, _ in bundled_maps.values():
+            exact = get_subset_table(grid)
+            mst = get_mst_table(grid)
+            for collected in exact.moves_by_collected:
+                for r in range(10):
+                    for c in range(10):
+                        if grid[r][c] == 1:
+                            continue
+                        bound = mst.moves((r, c), collected)
+                        assert bound <= exact.moves((r, c), collected)
+                        remaining = set(mst.samples) - collected
+                        if remaining:
+                            nearest = min(abs(r - sr) + abs(c - sc) for sr, sc in remaining)
+                            assert bound >= nearest
+
+    def test_astar_mst_keeps_optimal_cost(self, bundled_maps):
+        """
+        Test: A* con mst encuentra el mismo costo con menos o igual expansiones
+        que Manhattan
+        """
+        for grid, start in bundled_maps.values():
+            manhattan = astar.solve({"map": grid, "start": start, "heuristic": "manhattan"})
+            mst = astar.solve({"map": grid, "start": start, "heuristic": "mst"})
+            assert mst["cost"] == manhattan["cost"]
+            assert mst["nodes_expanded"] <= manhattan["nodes_expanded"]
+
+    def test_fuel_aware_is_admissible(self, bundled_maps):
+        """
+        Test: fuel_aware nunca supera el costo optimo restante de ningun
+        estado (calculado con la busqueda inversa) y nunca es menor que subset_dp
+        """
+        for name, (grid, _) in bundled_maps.items():
+            exact = build_cost_to_go(grid)
+            heuristic = get_fuel_aware_heuristic(grid)
+            subset = get_subset_table(grid)
+            for (r, c, mask, fuel, used), remaining_cost in exact.states():
+                collected = frozenset(
+                    s for i, s in enumerate(exact.samples) if mask & (1 << i)
+                )
+                bound = heuristic.cost((r, c), collected, fuel, used)
+                assert bound <= remaining_cost, f"{name} {(r, c, mask, fuel, used)}"
+                assert bound >= subset.moves((r, c), collected) * 0.5
+
+    def test_fuel_aware_after_ship_counts_full_moves(self, bundled_maps):
+        """
+        Test: Con la nave usada y sin combustible cada movimiento cuenta como 1
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        heuristic = get_fuel_aware_heuristic(grid)
+        subset = get_subset_table(grid)
+        cell = next((r, c) for r in range(10) for c in range(10) if grid[r][c] == 0)
+        moves = subset.moves(cell, frozenset())
+        assert heuristic.cost(cell, frozenset(), 0, True) == moves
+        assert heuristic.cost(cell, frozenset(), 20, True) == 0.5 * min(20, moves) + max(0, moves - 20)
+
+    def test_astar_fuel_aware_expands_fewer_nodes(self, bundled_maps):
+        """
+        Test: fuel_aware mantiene el costo y expande menos nodos que subset_dp
+        """
+        total_subset = total_fuel = 0
+        for grid, start in bundled_maps.values():
+            subset = astar.solve({"map": grid, "start": start, "heuristic": "subset_dp"})
+            fuel = astar.solve({"map": grid, "start": start, "heuristic": "fuel_aware"})
+            assert fuel["cost"] == subset["cost"]
+            total_subset += subset["nodes_expanded"]
+            total_fuel += fuel["nodes_expanded"]
+        assert total_fuel < total_subset
+
+    def test_unknown_heuristic(self, bundled_maps):
+        """
+        Test: Una heuristica desconocida retorna un mensaje de error
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = astar.solve({"map": grid, "start": start, "heuristic": "euclidean"})
+        assert result["path"] == []
+        assert "euclidean" in result["message"]
+
+
+class TestGreedyGridDistance:
+    """Tests para la opcion grid_distance de algorithms/greedy.py"""
+
+    def test_grid_distance_expands_fewer_nodes(self, bundled_maps):
+        """
+        Test: grid_distance encuentra solucion en todos los mapas incluidos
+        expandiendo menos nodos que Manhattan
+        """
+        for name, (grid, start) in bundled_maps.items():
+            manhattan = greedy.solve({"map": grid, "start": start})
+            grid_distance = greedy.solve({"map": grid, "start": start, "heuristic": "grid_distance"})
+            assert grid_distance["path"], name
+            assert grid_distance["nodes_expanded"] <= manhattan["nodes_expanded"], name
+
+    def test_unknown_heuristic(self, bundled_maps):
+        """
+        Test: Una heuristica desconocida retorna un mensaje de error
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = greedy.solve({"map": grid, "start": start, "heuristic": "euclidean"})
+        assert result["path"] == []
+        assert "euclidean" in result["message"]
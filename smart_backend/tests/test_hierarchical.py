@@ -0,0 +1,134 @@
+"""
+Test suite para las rutas jerarquicas HPA* (core/hierarchical.py)
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.hierarchical import ClusterAbstraction, find_route_hierarchical
+from core.map_cache import map_cache
+from core.routing import find_route, path_cost
+from core.world_state import mars_world
+from benchmarks.maps import generate_map
+from tests.test_route import ROUTE_MAP, assert_valid_path
+
+
+@pytest.fixture
+def loaded_world():
+    """Carga ROUTE_MAP en el mundo global y lo limpia al terminar"""
+    mars_world.load_from_text(ROUTE_MAP)
+    mars_world.metadata.pop('goal', None)
+    yield mars_world
+    mars_world.reset()
+
+
+class TestHierarchicalRoute:
+    """Tests de la abstraccion por clusters y find_route_hierarchical"""
+
+    def test_valid_paths_on_random_maps(self):
+        """
+        Test: Las rutas son continuas, su costo es el informado y nunca es
+        menor que el optimo de la busqueda plana
+        """
+        for seed in range(30):
+            size = (20, 40, 64)[seed % 3]
+            grid = generate_map(seed, size=size, obstacle_density=0.25)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(size) for j in range(size) if grid[i][j] != 1]
+            for _ in range(3):
+                start, goal = rng.sample(free, 2)
+                route = find_route_hierarchical(grid, start, goal, cluster_size=8)
+                flat = find_route(grid, start, goal)
+
+                assert bool(route["path"]) == bool(flat["path"]), f"seed {seed}"
+                if route["path"]:
+                    assert_valid_path(grid, route["path"], start, goal)
+                    assert route["cost"] == path_cost(grid, route["path"])
+                    assert route["cost"] >= flat["cost"]
+
+    def test_open_map_is_optimal_and_cheaper(self):
+        """
+        Test: En un mapa abierto la ruta es optima y expande menos nodos que
+        la busqueda plana
+        """
+        grid = [[0] * 64 for _ in range(64)]
+        route = find_route_hierarchical(grid, (3, 3), (60, 58), cluster_size=8)
+        flat = find_route(grid, (3, 3), (60, 58), bidirectional=False)
+        assert route["cost"] == flat["cost"] == 112
+        assert route["nodes_expanded"] < flat["nodes_expanded"]
+
+    def test_abstraction_is_cached(self):
+        """
+        Test: La abstraccion se construye una vez por mapa y tamano de cluster
+        """
+        map_cache.clear()
+        grid = generate_map(3, size=32)
+        free = [(i, j) for i in range(32) for j in range(32) if grid[i][j] != 1]
+        first = find_route_hierarchical(grid, free[0], free[-1])
+        second = find_route_hierarchical(grid, free[-1], free[0])
+        assert first["cache_hit"] is False
+        assert second["cache_hit"] is True
+        assert find_route_hierarchical(grid, free[0], free[-1], cluster_size=8)["cache_hit"] is False
+
+    def test_entrances_follow_free_border_runs(self):
+        """
+        Test: Un borde libre corto tiene una transicion y uno largo dos
+        """
+        grid = [[0] * 8 for _ in range(4)]
+        abstraction = ClusterAbstraction(grid, cluster_size=4)
+        # Un solo borde vertical de 4 celdas libres -> una transicion (2 entradas)
+        assert abstraction.node_count == 2
+
+        grid = [[0] * 16 for _ in range(8)]
+        abstraction = ClusterAbstraction(grid, cluster_size=8)
+        assert abstraction.node_count == 4
+
+    def test_unreachable_goal_falls_back(self):
+        """
+        Test: Si el grafo abstracto no conecta las celdas se confirma con la
+        busqueda plana y se retorna camino vacio
+        """
+        grid = [[0, 0, 1, 0], [0, 0, 1, 0], [0, 0, 1, 0], [0, 0, 1, 0]]
+        route = find_route_hierarchical(grid, (0, 0), (3, 3), cluster_size=2)
+        assert route["path"] == []
+        assert route["fallback"] is True
+        assert route["message"] == "No existe ruta entre las celdas"
+
+    def test_invalid_arguments(self):
+        """
+        Test: Celdas invalidas o clusters demasiado chicos lanzan ValueError
+        """
+        grid = [[0, 1], [0, 0]]
+        with pytest.raises(ValueError):
+            find_route_hierarchical(grid, (0, 0), (0, 1))
+        with pytest.raises(ValueError):
+            find_route_hierarchical(grid, (0, 0), (1, 1), cluster_size=1)
+
+
+class TestHierarchicalRouteEndpoint:
+    """Tests de GET /api/route con hierarchical=true"""
+
+    def test_hierarchical_route_to_goal(self, client, loaded_world):
+        """
+        Test: El endpoint usa HPA* y la ruta llega al objetivo
+        """
+        client.post("/api/map/goal", json={"row": 9, "col": 9})
+        response = client.get("/api/route", params={"hierarchical": True, "cluster_size": 4})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["hierarchical"] is True
+        assert_valid_path(loaded_world.grid, data["path"], (0, 0), (9, 9))
+        assert data["cost"] == path_cost(loaded_world.grid, data["path"])
+
+    def test_hierarchical_requires_terrain_mode(self, client, loaded_world):
+        """
+        Test: El modo "unit" no admite busqueda jerarquica
+        """
+        client.post("/api/map/goal", json={"row": 9, "col": 9})
+        response = client.get("/api/route", params={"hierarchical": True, "mode": "unit"})
+        assert response.status_code == 400
@@ -0,0 +1,83 @@
+"""
+Test suite para el algoritmo IDA*
+Verifica que encuentra el mismo costo optimo que A*
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar, ida_star
+from benchmarks.maps import find_start, generate_map
+
+
+class TestIdaStar:
+    """Tests para algorithms/ida_star.py"""
+
+    def test_same_cost_as_astar_on_bundled_maps(self, bundled_maps):
+        """
+        Test: IDA* debe encontrar el costo optimo de A* en los mapas incluidos
+        """
+        for name, (grid, start) in bundled_maps.items():
+            expected = astar.solve({"map": grid, "start": start})
+            result = ida_star.solve({"map": grid, "start": start})
+
+            assert result["cost"] == expected["cost"], f"Costo distinto en {name}"
+            assert len(result["path"]) > 0, f"Sin camino en {name}"
+
+    def test_same_cost_as_astar_on_generated_maps(self):
+        """
+        Test: IDA* debe coincidir con A* en mapas generados con semilla
+        """
+        for seed in range(10):
+            grid = generate_map(seed)
+            params = {"map": grid, "start": find_start(grid)}
+
+            assert ida_star.solve(params)["cost"] == astar.solve(params)["cost"], \
+                f"Costo distinto con semilla {seed}"
+
+    def test_small_transposition_table_keeps_optimality(self, bundled_maps):
+        """
+        Test: Una tabla de transposicion pequena no debe cambiar el costo
+        """
+        grid, start = bundled_maps["mapa6.txt"]
+        expected = astar.solve({"map": grid, "start": start})
+        result = ida_star.solve({
+            "map": grid,
+            "start": start,
+            "transposition_table_size": 10
+        })
+
+        assert result["cost"] == expected["cost"]
+
+    def test_path_is_connected(self, bundled_maps):
+        """
+        Test: Cada paso del camino debe moverse a una celda adyacente
+        """
+        grid, start = bundled_maps["mapa3.txt"]
+        path = ida_star.solve({"map": grid, "start": start})["path"]
+
+        assert path[0] == start
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+    def test_reports_iterations(self, bundled_maps):
+        """
+        Test: El resultado incluye los nodos expandidos por iteracion
+        """
+        grid, start = bundled_maps["mapa2.txt"]
+        result = ida_star.solve({"map": grid, "start": start})
+
+        assert sum(it["nodes_expanded"] for it in result["iterations"]) == result["nodes_expanded"]
+
+    def test_invalid_map(self):
+        """
+        Test: Un mapa que no es 10x10 debe retornar mensaje de error
+        """
+        result = ida_star.solve({"map": [[0, 0], [0, 0]], "start": [0, 0]})
+
+        assert result["path"] == []
+        assert result["message"] == "Mapa inválido"
@@ -0,0 +1,87 @@
+"""
+Test suite para la busqueda en profundidad iterativa (IDDFS)
+Verifica la profundidad de la solucion y las estadisticas por iteracion
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import bfs, dfs, iddfs
+
+
+class TestIddfs:
+    """Tests para algorithms/iddfs.py"""
+
+    def test_same_depth_as_bfs(self, bundled_maps):
+        """
+        Test: IDDFS encuentra la solucion con la misma cantidad de movimientos que BFS
+        """
+        for name, (grid, start) in bundled_maps.items():
+            expected = bfs.solve({"map": grid, "start": start})
+            result = iddfs.solve({"map": grid, "start": start})
+
+            assert len(result["path"]) == len(expected["path"]), f"Profundidad distinta en {name}"
+
+    def test_iteration_statistics(self, bundled_maps):
+        """
+        Test: Las estadisticas por iteracion son consistentes con el total
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = iddfs.solve({"map": grid, "start": start})
+        iterations = result["iterations"]
+
+        limits = [it["depth_limit"] for it in iterations]
+        assert limits == list(range(limits[0], limits[0] + len(limits)))
+        assert sum(it["nodes_expanded"] for it in iterations) == result["nodes_expanded"]
+        for it in iterations:
+            assert it["max_depth"] <= it["depth_limit"]
+            # La pila solo guarda el camino actual
+            assert it["max_stack"] <= it["depth_limit"] + 1
+        assert iterations[-1]["depth_limit"] == len(result["path"]) - 1
+        assert result["max_depth"] == max(it["max_depth"] for it in iterations)
+        # La frontera cuenta ademas los hijos pendientes de cada marco
+        assert result["max_frontier"] > max(it["max_stack"] for it in iterations)
+
+    def test_reuse_ordering_keeps_solution_depth(self, bundled_maps):
+        """
+        Test: Reutilizar el orden de la iteracion anterior no cambia la profundidad
+        """
+        grid, start = bundled_maps["mapa5.txt"]
+        with_reuse = iddfs.solve({"map": grid, "start": start, "reuse_ordering": True})
+        without_reuse = iddfs.solve({"map": grid, "start": start, "reuse_ordering": False})
+
+        assert len(with_reuse["path"]) == len(without_reuse["path"])
+
+    def test_no_solution_stops_early(self):
+        """
+        Test: Si el astronauta esta encerrado la busqueda termina sin agotar el limite
+        """
+        grid = [[0] * 10 for _ in range(10)]
+        grid[0][0] = 2
+        grid[0][1] = 1
+        grid[1][0] = 1
+        grid[0][5] = 6
+        grid[5][5] = 6
+        grid[9][9] = 6
+
+        result = iddfs.solve({"map": grid, "start": [0, 0]})
+
+        assert result["path"] == []
+        assert len(result["iterations"]) < 100
+
+
+class TestDfsDepthAccounting:
+    """Tests para la profundidad maxima reportada por algorithms/dfs.py"""
+
+    def test_max_depth_covers_solution_path(self, bundled_maps):
+        """
+        Test: max_depth de DFS nunca es menor que los movimientos de su camino
+        """
+        for name, (grid, start) in bundled_maps.items():
+            result = dfs.solve({"map": grid, "start": start})
+
+            assert result["max_depth"] >= len(result["path"]) - 1, f"Profundidad inconsistente en {name}"
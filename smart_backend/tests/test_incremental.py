@@ -0,0 +1,305 @@
+"""
+Test suite para la replanificacion incremental D* Lite (core/incremental.py)
+y la edicion de celdas (PATCH /api/map/cells) con metadatos y cache incrementales
+"""
+
+import pytest
+import random
+import sys
+import threading
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.distance_fields import get_distance_fields
+from core.incremental import DStarLite
+from core.key_point_graph import get_key_point_graph
+from core.map_cache import map_cache
+from core.routing import find_route, path_cost
+from core.world_state import CELL_COUNTERS, CELL_POSITIONS, _analyze_map, mars_world
+from benchmarks.maps import generate_map
+from tests.test_route import ROUTE_MAP, assert_valid_path
+
+
+@pytest.fixture
+def loaded_world():
+    """Carga ROUTE_MAP en el mundo global y lo limpia al terminar"""
+    mars_world.load_from_text(ROUTE_MAP)
+    mars_world.metadata.pop('goal', None)
+    yield mars_world
+    mars_world.reset()
+
+
+class TestDStarLite:
+    """Tests del planificador D* Lite"""
+
+    def test_repairs_match_full_search(self):
+        """
+        Test: Tras cada lote de cambios (y movimientos del inicio) el costo
+        coincide con una busqueda completa sobre el mapa editado
+        """
+        for seed in range(20):
+            size = (16, 24)[seed % 2]
+            grid = generate_map(seed, size=size, obstacle_density=0.25)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(size) for j in range(size) if grid[i][j] != 1]
+            start, goal = rng.sample(free, 2)
+
+            for mode, key in (("terrain", "cost"), ("unit", "moves")):
+                edited = [row[:] for row in grid]
+                planner = DStarLite(edited, start, goal, mode)
+                planner.compute()
+                current = start
+                for step in range(10):
+                    changes = []
+                    for _ in range(2):
+                        r, c = rng.randrange(size), rng.randrange(size)
+                        if (r, c) not in (current, goal):
+                            value = rng.choice([0, 1, 1, 3, 4])
+                            edited[r][c] = value
+                            changes.append((r, c, value))
+                    planner.update_cells(changes)
+                    if step % 3 == 2 and len(planner.path()) > 2:
+                        current = planner.path()[1]
+                        planner.move_start(current)
+                    planner.compute()
+
+                    expected = find_route(edited, current, goal, mode=mode)
+                    path = planner.path()
+                    assert bool(path) == bool(expected["path"]), f"seed {seed} paso {step}"
+                    if path:
+                        assert_valid_path(edited, [list(cell) for cell in path], current, goal)
+                        assert planner.cost() == expected[key], f"seed {seed} {mode} paso {step}"
+
+    def test_change_near_start_expands_less(self):
+        """
+        Test: Bloquear una celda de la ruta cerca del inicio se repara con
+        menos expansiones que una busqueda nueva sobre el mapa editado
+        """
+        repaired_total, fresh_total = 0, 0
+        for seed in range(5):
+            grid = generate_map(seed, size=40, obstacle_density=0.25)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(40) for j in range(40) if grid[i][j] != 1]
+            start, goal = rng.sample(free, 2)
+
+            planner = DStarLite(grid, start, goal)
+            planner.compute()
+            r, c = planner.path()[2]
+            planner.update_cells([(r, c, 1)])
+            repaired_total += planner.compute()
+
+            edited = [row[:] for row in grid]
+            edited[r][c] = 1
+            fresh = DStarLite(edited, start, goal)
+            fresh_total += fresh.compute()
+            assert planner.cost() == fresh.cost()
+
+        assert repaired_total * 2 < fresh_total
+
+    def test_unreachable_after_edit(self):
+        """
+        Test: Si un cambio desconecta el objetivo no hay ruta, y al despejarlo vuelve
+        """
+        grid = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        planner = DStarLite(grid, (0, 0), (2, 2))
+        planner.compute()
+        planner.update_cells([(1, 2, 1), (2, 1, 1)])
+        planner.compute()
+        assert planner.path() == []
+        planner.update_cells([(2, 1, 0)])
+        planner.compute()
+        assert planner.cost() == 4
+
+
+class TestCellEdits:
+    """Tests de MarsWorld.set_cells, PATCH /api/map/cells y GET /api/route?incremental=true"""
+
+    def test_set_cells_updates_grid_and_metadata(self, loaded_world):
+        """
+        Test: Las ediciones cambian el mapa, los contadores y la revision
+        """
+        revision = loaded_world.revision
+        obstacles = loaded_world.metadata['obstacles']
+        changes = loaded_world.set_cells([(0, 1, 1), (0, 2, 0)])
+        assert changes == [(0, 1, 1)]
+        assert loaded_world.grid[0][1] == 1
+        assert loaded_world.metadata['obstacles'] == obstacles + 1
+        assert loaded_world.revision == revision + 1
+
+    def test_incremental_metadata_matches_full_analysis(self, loaded_world):
+        """
+        Test: Tras muchas ediciones aleatorias los metadatos mantenidos
+        incrementalmente coinciden con analizar el mapa completo
+        """
+        rng = random.Random(0)
+        for _ in range(200):
+            edits = [(rng.randrange(10), rng.randrange(10), rng.randrange(7)) for _ in range(3)]
+            loaded_world.set_cells(edits)
+
+            reference, _ = _analyze_map(loaded_world.grid, {})
+            for key in list(CELL_COUNTERS.values()) + list(CELL_POSITIONS.values()):
+                assert loaded_world.metadata[key] == reference[key], key
+
+    def test_edits_invalidate_only_affected_cache_entries(self, loaded_world):
+        """
+        Test: Cambiar terreno conserva las estructuras que solo dependen de
+        obstaculos, nave y muestras; agregar un obstaculo las descarta
+        """
+        map_cache.clear()
+        grid = loaded_world.grid
+        get_distance_fields(grid)
+        get_key_point_graph(grid)
+
+        loaded_world.set_cells([(0, 1, 3)])
+        hits = map_cache.hits
+        get_distance_fields(loaded_world.grid)
+        assert map_cache.hits == hits + 1
+        assert get_key_point_graph(loaded_world.grid)[1] is False
+        assert map_cache.invalidated == 1
+
+        loaded_world.set_cells([(0, 2, 1)])
+        misses = map_cache.misses
+        fields = get_distance_fields(loaded_world.grid)
+        assert map_cache.misses == misses + 1
+        assert fields.sample_fields[0][0, 2] == -1
+
+    def test_set_cells_is_atomic(self, loaded_world):
+        """
+        Test: Si alguna edicion es invalida no se aplica ninguna
+        """
+        with pytest.raises(ValueError):
+            loaded_world.set_cells([(0, 1, 1), (0, 2, 9)])
+        assert loaded_world.grid[0][1] == 0
+        with pytest.raises(ValueError):
+            loaded_world.set_cells([(10, 0, 1)])
+
+    def test_patch_cells_endpoint(self, client, loaded_world):
+        """
+        Test: PATCH /api/map/cells aplica las ediciones y valida los valores
+        """
+        response = client.patch("/api/map/cells", json={"cells": [{"row": 0, "col": 1, "value": 3}]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["changed"] == [{"row": 0, "col": 1, "value": 3}]
+        assert client.get("/api/map/cell/0/1").json()["value"] == 3
+
+        bad = client.patch("/api/map/cells", json={"cells": [{"row": 0, "col": 1, "value": 7}]})
+        assert bad.status_code == 400
+
+    def test_patch_cells_without_map(self, client):
+        """
+        Test: Sin mapa cargado debe retornar 404
+        """
+        mars_world.reset()
+        response = client.patch("/api/map/cells", json={"cells": []})
+        assert response.status_code == 404
+
+    def test_incremental_route_reuses_state(self, client, loaded_world):
+        """
+        Test: Tras editar celdas la ruta incremental reutiliza el estado y
+        coincide con la busqueda completa
+        """
+        client.post("/api/map/goal", json={"row": 9, "col": 9})
+        first = client.get("/api/route", params={"incremental": True}).json()
+        assert first["reused"] is False
+        assert first["cost"] == client.get("/api/route").json()["cost"]
+
+        # Bloquear una celda intermedia de la ruta
+        row, col = first["path"][len(first["path"]) // 2]
+        client.patch("/api/map/cells", json={"cells": [{"row": row, "col": col, "value": 1}]})
+
+        second = client.get("/api/route", params={"incremental": True}).json()
+        assert second["reused"] is True
+        assert [row, col] not in second["path"]
+        assert second["cost"] == client.get("/api/route").json()["cost"]
+        assert second["cost"] == path_cost(loaded_world.grid, second["path"])
+
+    def test_incremental_state_dropped_on_reload(self, client, loaded_world):
+        """
+        Test: Cargar otro mapa descarta el estado incremental
+        """
+        client.post("/api/map/goal", json={"row": 9, "col": 9})
+        client.get("/api/route", params={"incremental": True})
+        loaded_world.load_from_text(ROUTE_MAP)
+        loaded_world.set_goal(9, 9)
+        data = client.get("/api/route", params={"incremental": True}).json()
+        assert data["reused"] is False
+
+
+class TestWorldSnapshots:
+    """Tests de las instantaneas inmutables del mundo (copy-on-write)"""
+
+    def test_snapshot_unchanged_by_later_writes(self, loaded_world):
+        """
+        Test: Una instantanea tomada antes de editar conserva su mapa y metadatos
+        """
+        before = loaded_world.snapshot()
+        grid = [row[:] for row in before.grid]
+        metadata = dict(before.metadata)
+
+        loaded_world.set_cells([(0, 1, 1), (9, 9, 4)])
+        loaded_world.set_goal(5, 5)
+        assert before.grid == grid
+        assert before.metadata == metadata
+
+        after = loaded_world.snapshot()
+        assert after.grid[0][1] == 1 and after.metadata['goal'] == (5, 5)
+        # Las filas no editadas se comparten con la instantanea anterior
+        assert after.grid[4] is before.grid[4]
+        assert after.grid[0] is not before.grid[0]
+
+    def test_set_goal_returns_published_snapshot(self, client, loaded_world):
+        """
+        Test: set_goal retorna la instantanea que publico y POST /api/map/goal
+        responde con sus metadatos
+        """
+        world = loaded_world.set_goal(5, 5)
+        assert world is loaded_world.snapshot()
+        assert world.metadata['goal'] == (5, 5)
+
+        loaded_world.set_cells([(0, 1, 1)])
+        assert world.metadata['goal'] == (5, 5) and world.revision < loaded_world.revision
+
+        data = client.post("/api/map/goal", json={"row": 9, "col": 9}).json()
+        assert data["metadata"]["goal"] == [9, 9]
+        assert data["metadata"] == {**loaded_world.metadata, "goal": [9, 9]}
+
+    def test_reset_keeps_old_snapshot(self, loaded_world):
+        """
+        Test: Limpiar el mundo publica una instantanea vacia sin tocar la anterior
+        """
+        before = loaded_world.snapshot()
+        loaded_world.reset()
+        assert before.is_loaded()
+        assert not loaded_world.is_loaded()
+        assert loaded_world.revision == before.revision + 1
+
+    def test_concurrent_readers_see_consistent_state(self, loaded_world):
+        """
+        Test: Mientras otro hilo edita, cada instantanea leida tiene
+        metadatos que coinciden con su propio mapa
+        """
+        done = threading.Event()
+        errors = []
+
+        def writer():
+            rng = random.Random(1)
+            for _ in range(300):
+                loaded_world.set_cells([(rng.randrange(10), rng.randrange(10), rng.choice([0, 1, 3, 4]))])
+            done.set()
+
+        def reader():
+            while not done.is_set():
+                world = loaded_world.snapshot()
+                obstacles = sum(row.count(1) for row in world.grid)
+                if obstacles != world.metadata['obstacles']:
+                    errors.append((world.revision, obstacles, world.metadata['obstacles']))
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
@@ -0,0 +1,101 @@
+"""
+Test suite para la descomposicion por puntos clave (algorithms/key_points.py),
+comparada con Costo Uniforme y con la busqueda inversa
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import key_points, uniform_cost
+from benchmarks.maps import find_start, generate_map
+from core.cost_to_go import build_cost_to_go
+
+
+def path_cost_with_fuel(grid, path):
+    """Costo de un camino con las reglas del problema (una sola recarga)"""
+    cost, fuel, ship_used = 0, 0, False
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1, "El camino debe ser continuo"
+        cell = grid[r2][c2]
+        assert cell != 1, "El camino no puede pasar por obstaculos"
+        cost += 0.5 if fuel > 0 else {3: 3, 4: 5}.get(cell, 1)
+        if cell == 5 and not ship_used:
+            fuel, ship_used = 20, True
+        elif fuel > 0:
+            fuel -= 1
+    return cost
+
+
+class TestKeyPoints:
+    """Tests para algorithms/key_points.py"""
+
+    def test_matches_uniform_cost_on_random_maps(self):
+        """
+        Test: El costo coincide con Costo Uniforme en mapas aleatorios y el
+        camino unido recoge las 3 muestras con ese mismo costo
+        """
+        for seed in range(60):
+            grid = generate_map(seed, obstacle_density=(0.1, 0.2, 0.3)[seed % 3])
+            start = find_start(grid)
+            expected = uniform_cost.solve({"map": grid, "start": start})
+            result = key_points.solve({"map": grid, "start": start})
+
+            assert result["cost"] == expected["cost"], f"seed {seed}"
+            assert result["path"][0] == list(start)
+            samples = {(r, c) for r in range(10) for c in range(10) if grid[r][c] == 6}
+            assert samples <= {tuple(cell) for cell in result["path"]}
+            assert path_cost_with_fuel(grid, result["path"]) == result["cost"], f"seed {seed}"
+
+    def test_walk_before_ship_does_not_cross_it(self):
+        """
+        Test: Los tramos antes de usar la nave no la atraviesan; entrar a ella
+        la usa, asi que contar una recarga despues daba un costo imposible
+        (35.0 y 33.0 en lugar de 41.0 y 34.0 en estos mapas)
+        """
+        for seed, optimum in ((48, 41.0), (72, 34.0)):
+            grid = generate_map(seed, obstacle_density=0.3)
+            start = find_start(grid)
+            result = key_points.solve({"map": grid, "start": start})
+
+            assert result["cost"] == optimum == build_cost_to_go(grid).cost(tuple(start)), f"seed {seed}"
+            assert path_cost_with_fuel(grid, result["path"]) == result["cost"], f"seed {seed}"
+
+    def test_every_start_is_optimal(self, bundled_maps):
+        """
+        Test: Desde cualquier celda libre (incluidas la nave y las muestras) el
+        costo es el optimo de la busqueda inversa
+        """
+        for name, (grid, _) in bundled_maps.items():
+            exact = build_cost_to_go(grid)
+            for r in range(10):
+                for c in range(10):
+                    if grid[r][c] == 1:
+                        continue
+                    result = key_points.solve({"map": grid, "start": [r, c]})
+                    assert result["cost"] == (exact.cost((r, c)) or 0), f"{name} {(r, c)}"
+
+    def test_visit_order_and_cache(self, bundled_maps):
+        """
+        Test: Se informa el orden de visita y la segunda llamada reutiliza los tramos
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        key_points.solve({"map": grid, "start": start})
+        result = key_points.solve({"map": grid, "start": start})
+
+        assert result["cache_hit"] is True
+        assert result["visit_order"][0] == list(start)
+        assert result["nodes_expanded"] <= 24
+
+    def test_invalid_start(self, bundled_maps):
+        """
+        Test: Un inicio sobre un obstaculo no retorna camino
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        obstacle = next([r, c] for r in range(10) for c in range(10) if grid[r][c] == 1)
+        result = key_points.solve({"map": grid, "start": obstacle})
+        assert result["path"] == []
+
@@ -0,0 +1,131 @@
+"""
+Test suite para las cotas de landmarks ALT (core/landmarks.py)
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar
+from core.landmarks import UNREACHABLE, LandmarkTable, get_landmark_table
+from core.map_cache import map_cache
+from core.routing import find_route, terrain_field_to
+from benchmarks.maps import generate_map
+
+
+class TestLandmarkTable:
+    """Tests de la seleccion de landmarks y las cotas inferiores"""
+
+    def test_bounds_are_admissible(self):
+        """
+        Test: La cota nunca supera el costo de terreno exacto hasta el destino
+        """
+        for seed in range(10):
+            grid = generate_map(seed, size=24, obstacle_density=0.25)
+            table = LandmarkTable(grid, count=4)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(24) for j in range(24) if grid[i][j] != 1]
+            for goal in rng.sample(free, 3):
+                exact, _ = terrain_field_to(grid, goal)
+                bounds = table.lower_bounds_to(goal)
+                for r, c in free:
+                    assert bounds.get(r, c) <= exact[r][c], f"seed {seed} {(r, c)} -> {goal}"
+                assert bounds.get(*goal) == 0
+
+    def test_farthest_point_selection(self):
+        """
+        Test: En un pasillo las dos primeras landmarks son los extremos
+        """
+        grid = [[0] * 12]
+        table = LandmarkTable(grid, count=2)
+        assert sorted(table.landmarks) == [(0, 0), (0, 11)]
+        assert table.fields.dtype.name == "int32"
+        assert table.fields[0].tolist() in (list(range(12)), list(range(11, -1, -1)))
+
+    def test_unreachable_cells(self):
+        """
+        Test: Las celdas fuera del componente de las landmarks quedan
+        UNREACHABLE y su cota es 0
+        """
+        grid = [[0, 0, 1, 0], [0, 0, 1, 0]]
+        table = LandmarkTable(grid, count=3)
+        assert all(c < 2 for _, c in table.landmarks)
+        assert table.fields[0][3] == UNREACHABLE
+        assert table.lower_bounds_to((0, 3)).get(0, 0) == 0
+
+    def test_table_is_cached(self):
+        """
+        Test: La tabla se guarda por mapa, modo y cantidad de landmarks
+        """
+        map_cache.clear()
+        grid = generate_map(1, size=16)
+        assert get_landmark_table(grid, 4)[1] is False
+        assert get_landmark_table(grid, 4)[1] is True
+        assert get_landmark_table(grid, 4, mode="unit")[1] is False
+
+
+class TestAltSearch:
+    """Tests de A* con heuristica ALT en rutas y en algorithms/astar.py"""
+
+    def test_route_matches_optimum(self):
+        """
+        Test: A* con ALT o Manhattan da el costo optimo y ALT expande menos nodos
+        """
+        nodes = {"manhattan": 0, "alt": 0}
+        for seed in range(20):
+            grid = generate_map(seed, size=32, obstacle_density=0.25)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(32) for j in range(32) if grid[i][j] != 1]
+            for _ in range(3):
+                start, goal = rng.sample(free, 2)
+                for mode, key in (("unit", "moves"), ("terrain", "cost")):
+                    expected = find_route(grid, start, goal, mode=mode)
+                    for heuristic in nodes:
+                        route = find_route(grid, start, goal, mode=mode, heuristic=heuristic)
+                        assert route[key] == expected[key], f"seed {seed} {mode} {heuristic}"
+                        nodes[heuristic] += route["nodes_expanded"]
+        assert nodes["alt"] < nodes["manhattan"]
+
+    def test_unknown_heuristic(self):
+        """
+        Test: Una heuristica desconocida lanza ValueError
+        """
+        with pytest.raises(ValueError):
+            find_route([[0, 0]], (0, 0), (0, 1), heuristic="euclidean")
+
+    def test_astar_alt_heuristic(self, bundled_maps):
+        """
+        Test: A* con heuristic="alt" mantiene el costo optimo y expande menos
+        nodos que Manhattan en los mapas incluidos
+        """
+        total = {"manhattan": 0, "alt": 0}
+        for name, (grid, start) in bundled_maps.items():
+            costs = set()
+            for heuristic in total:
+                result = astar.solve({"map": grid, "start": start, "heuristic": heuristic})
+                costs.add(result["cost"])
+                total[heuristic] += result["nodes_expanded"]
+            assert len(costs) == 1, name
+        assert total["alt"] < total["manhattan"]
+
+    def test_route_endpoint_with_alt(self, client):
+        """
+        Test: GET /api/route acepta heuristic=alt
+        """
+        from tests.test_route import ROUTE_MAP
+        from core.world_state import mars_world
+
+        mars_world.load_from_text(ROUTE_MAP)
+        try:
+            client.post("/api/map/goal", json={"row": 9, "col": 9})
+            plain = client.get("/api/route").json()
+            data = client.get("/api/route", params={"heuristic": "alt"}).json()
+            assert data["heuristic"] == "alt"
+            assert data["cost"] == plain["cost"]
+            assert client.get("/api/route", params={"heuristic": "bogus"}).status_code == 400
+        finally:
+            mars_world.reset()
@@ -0,0 +1,108 @@
+"""
+Test suite para el generador de mapas (core/map_generator.py)
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.map_generator import from_binary, generate, to_binary, to_text
+from core.map_loader import load_map
+from core.routing import find_route
+
+
+def assert_solvable(grid):
+    """Verifica que la nave y todas las muestras sean alcanzables desde el astronauta"""
+    start = tuple(int(v) for v in np.argwhere(grid == 2)[0])
+    for target in np.argwhere((grid == 5) | (grid == 6)):
+        route = find_route(grid.tolist(), start, tuple(int(v) for v in target), mode="unit")
+        assert route["path"], f"{tuple(target)} no es alcanzable"
+
+
+class TestMapGenerator:
+    """Tests del generador de mapas"""
+
+    def test_deterministic_per_seed(self):
+        """
+        Test: La misma semilla da el mismo mapa y otra semilla uno distinto
+        """
+        assert np.array_equal(generate(30, seed=4), generate(30, seed=4))
+        assert not np.array_equal(generate(30, seed=4), generate(30, seed=5))
+
+    @pytest.mark.parametrize("topology", ["open", "maze"])
+    def test_points_and_solvability(self, topology):
+        """
+        Test: Hay un astronauta, una nave y las muestras pedidas, todas
+        alcanzables aun con muchos obstaculos
+        """
+        for seed in range(20):
+            grid = generate(17, 13, seed=seed, obstacle_density=0.45, samples=4, topology=topology)
+            assert grid.shape == (17, 13)
+            counts = np.bincount(grid.ravel(), minlength=7)
+            assert (counts[2], counts[5], counts[6]) == (1, 1, 4)
+            assert_solvable(grid)
+
+    def test_density_and_terrain_mix(self):
+        """
+        Test: La proporcion de obstaculos y de terreno sigue los parametros
+        """
+        grid = generate(200, seed=0, obstacle_density=0.3, rocky=0.2, volcanic=0.1)
+        obstacles = np.mean(grid == 1)
+        free = grid != 1
+        assert 0.27 < obstacles < 0.31
+        assert 0.18 < np.mean(grid[free] == 3) < 0.22
+        assert 0.08 < np.mean(grid[free] == 4) < 0.12
+
+    def test_ship_placement(self):
+        """
+        Test: La nave puede ubicarse cerca, lejos o no estar
+        """
+        def ship_distance(grid):
+            (ar, ac), (sr, sc) = np.argwhere(grid == 2)[0], np.argwhere(grid == 5)[0]
+            return abs(ar - sr) + abs(ac - sc)
+
+        assert ship_distance(generate(50, seed=1, ship="near")) == 1
+        assert ship_distance(generate(50, seed=1, ship="far")) > 50
+        assert not (generate(50, seed=1, ship="none") == 5).any()
+
+    def test_invalid_parameters(self):
+        """
+        Test: Parametros invalidos o puntos que no caben levantan ValueError
+        """
+        with pytest.raises(ValueError):
+            generate(10, topology="cave")
+        with pytest.raises(ValueError):
+            generate(10, ship="left")
+        with pytest.raises(ValueError):
+            generate(2, samples=5)
+
+    def test_text_and_binary_formats(self):
+        """
+        Test: El texto es el formato de mapa*.txt y el binario ida y vuelta
+        conserva el mapa (con cantidad impar de celdas)
+        """
+        grid = generate(10, seed=2)
+        assert load_map(to_text(grid)) == grid.tolist()
+
+        odd = generate(7, 9, seed=2, topology="maze")
+        data = to_binary(odd)
+        assert len(data) < odd.size
+        assert np.array_equal(from_binary(data), odd)
+        with pytest.raises(ValueError):
+            from_binary(b"XXXX" + data[4:])
+
+    def test_large_map_is_fast(self):
+        """
+        Test: Un mapa de 1000x1000 se genera en bastante menos de un segundo
+        """
+        for topology in ("open", "maze"):
+            start_time = time.perf_counter()
+            grid = generate(1000, seed=0, topology=topology)
+            assert time.perf_counter() - start_time < 0.5
+            assert grid.shape == (1000, 1000)
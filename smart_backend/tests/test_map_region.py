@@ -0,0 +1,102 @@
+"""
+Test suite para la lectura de regiones del mapa (GET /api/map/region)
+"""
+
+import base64
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.world_state import mars_world
+from tests.test_route import ROUTE_MAP
+
+
+@pytest.fixture
+def loaded_world():
+    """Carga ROUTE_MAP en el mundo global y lo limpia al terminar"""
+    mars_world.load_from_text(ROUTE_MAP)
+    yield mars_world
+    mars_world.reset()
+
+
+def unpack(data):
+    """Decodifica la respuesta empaquetada a una lista de filas"""
+    values = list(base64.b64decode(data["data"]))
+    if len(data["shape"]) == 1:
+        return values
+    height, width = data["shape"]
+    return [values[i * width:(i + 1) * width] for i in range(height)]
+
+
+class TestMapRegion:
+    """Tests para el endpoint GET /api/map/region"""
+
+    def test_rectangle(self, client, loaded_world):
+        """
+        Test: Un rectangulo retorna sus celdas empaquetadas como uint8
+        """
+        response = client.get("/api/map/region", params={"row": 1, "col": 4, "height": 3, "width": 4})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["shape"] == [3, 4]
+        assert data["dtype"] == "uint8"
+        assert data["origin"] == [1, 4]
+        assert unpack(data) == [row[4:8] for row in loaded_world.grid[1:4]]
+
+    def test_full_map_by_default(self, client, loaded_world):
+        """
+        Test: Sin parametros retorna el mapa completo
+        """
+        data = client.get("/api/map/region").json()
+        assert data["shape"] == [10, 10]
+        assert unpack(data) == loaded_world.grid
+
+    def test_cell_list(self, client, loaded_world):
+        """
+        Test: Una lista de coordenadas retorna sus valores en el mismo orden
+        """
+        data = client.get("/api/map/region", params={"cells": "0,0;9,3;2,8"}).json()
+        assert data["shape"] == [3]
+        assert data["cells"] == [[0, 0], [9, 3], [2, 8]]
+        assert unpack(data) == [2, 6, 6]
+
+    def test_not_modified(self, client, loaded_world):
+        """
+        Test: Con el mismo ETag responde 304; si cambia la region, 200
+        """
+        params = {"row": 0, "col": 0, "height": 2, "width": 2}
+        first = client.get("/api/map/region", params=params)
+        etag = first.headers["etag"]
+
+        cached = client.get("/api/map/region", params=params, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # Un cambio fuera de la region no la invalida
+        loaded_world.set_cells([(9, 9, 3)])
+        assert client.get("/api/map/region", params=params,
+                          headers={"If-None-Match": etag}).status_code == 304
+
+        loaded_world.set_cells([(0, 1, 3)])
+        changed = client.get("/api/map/region", params=params, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_invalid_queries(self, client, loaded_world):
+        """
+        Test: Rectangulos o coordenadas fuera del mapa retornan 400
+        """
+        assert client.get("/api/map/region", params={"row": 8, "height": 3}).status_code == 400
+        assert client.get("/api/map/region", params={"width": 0}).status_code == 400
+        assert client.get("/api/map/region", params={"cells": "0,0;10,0"}).status_code == 400
+        assert client.get("/api/map/region", params={"cells": "0;1"}).status_code == 400
+
+    def test_region_without_map(self, client):
+        """
+        Test: Sin mapa cargado debe retornar 404
+        """
+        mars_world.reset()
+        assert client.get("/api/map/region").status_code == 404
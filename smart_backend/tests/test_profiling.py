@@ -0,0 +1,91 @@
+"""
+Test suite para el perfilado opcional con cProfile de POST /api/run
+(profile=true, habilitado con ENABLE_PROFILING y guardado en PROFILE_DIR)
+"""
+
+import pstats
+import sys
+from pathlib import Path
+
+import pytest
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.executor import run_algorithm
+from tests.test_route import ROUTE_MAP
+
+GRID = [[int(value) for value in line.split()] for line in ROUTE_MAP.strip().splitlines()]
+
+
+@pytest.fixture
+def profiling(monkeypatch, tmp_path):
+    """Habilita el perfilado y guarda los .pstats en un directorio temporal"""
+    monkeypatch.setenv("ENABLE_PROFILING", "1")
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestProfiling:
+    """Tests del perfilado por solicitud"""
+
+    def test_profile_disabled_by_default(self, client, monkeypatch):
+        """
+        Test: Sin ENABLE_PROFILING pedir profile=true retorna 403
+        """
+        monkeypatch.delenv("ENABLE_PROFILING", raising=False)
+        response = client.post("/api/run", json={"algorithm": "bfs", "params": {"map": GRID}, "profile": True})
+        assert response.status_code == 403
+
+    def test_run_without_profile_has_no_profile_key(self, client, profiling):
+        """
+        Test: Sin profile=true la respuesta no cambia ni se guardan archivos
+        """
+        response = client.post("/api/run", json={"algorithm": "bfs", "params": {"map": GRID}})
+        assert response.status_code == 200
+        assert "profile" not in response.json()
+        assert list(profiling.iterdir()) == []
+
+    def test_profile_returns_top_functions_and_saves_pstats(self, client, profiling):
+        """
+        Test: Con profile=true la respuesta incluye las funciones de mayor
+        tiempo acumulado y propio, y el .pstats guardado se puede leer
+        """
+        response = client.post("/api/run", json={
+            "algorithm": "astar", "params": {"map": GRID}, "profile": True, "profile_top": 5
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert data["result"]["path"]
+
+        profile = data["profile"]
+        assert len(profile["top_cumulative"]) == 5
+        assert len(profile["top_total"]) == 5
+        cumulative = [entry["cumulative_time"] for entry in profile["top_cumulative"]]
+        assert cumulative == sorted(cumulative, reverse=True)
+        total = [entry["total_time"] for entry in profile["top_total"]]
+        assert total == sorted(total, reverse=True)
+        # solve del algoritmo aparece entre las funciones de mayor tiempo acumulado
+        assert any(entry["function"].startswith("solve (astar.py:") for entry in profile["top_cumulative"])
+
+        path = Path(profile["file"])
+        assert path.parent == profiling and path.name.startswith("astar-") and path.suffix == ".pstats"
+        assert pstats.Stats(str(path)).total_calls == profile["total_calls"]
+
+    def test_profile_top_must_be_positive(self, client, profiling):
+        """
+        Test: profile_top menor que 1 retorna 400
+        """
+        response = client.post("/api/run", json={
+            "algorithm": "bfs", "params": {"map": GRID}, "profile": True, "profile_top": 0
+        })
+        assert response.status_code == 400
+
+    def test_run_algorithm_profile_dir_argument(self, tmp_path):
+        """
+        Test: run_algorithm acepta el directorio de los .pstats como argumento
+        """
+        result = run_algorithm("bfs", {"map": GRID}, profile=True, profile_top=3, profile_dir=str(tmp_path / "sub"))
+        assert result["status"] == "success"
+        assert Path(result["profile"]["file"]).parent == tmp_path / "sub"
+        assert len(result["profile"]["top_total"]) == 3
@@ -0,0 +1,138 @@
+"""
+Test suite para la busqueda inversa (algorithms/reverse_search.py),
+la tabla de costo hasta la meta y la cache por mapa
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import astar, reverse_search
+from core.cost_to_go import build_cost_to_go
+from core.map_cache import MapCache, map_cache, map_fingerprint
+
+
+class TestCostToGoTable:
+    """Tests para core/cost_to_go.py"""
+
+    def test_matches_astar_from_every_start(self, bundled_maps):
+        """
+        Test: El costo de la tabla es el optimo de A* desde cualquier celda libre
+        """
+        for name, (grid, _) in bundled_maps.items():
+            table = build_cost_to_go(grid)
+            for r in range(10):
+                for c in range(10):
+                    if grid[r][c] == 1:
+                        continue
+                    expected = astar.solve({"map": grid, "start": [r, c]})
+                    if expected["path"]:
+                        assert table.cost((r, c)) == expected["cost"], f"{name} {(r, c)}"
+                    else:
+                        assert table.cost((r, c)) is None, f"{name} {(r, c)}"
+
+    def test_path_is_consistent_with_cost(self, bundled_maps):
+        """
+        Test: El camino reconstruido es continuo, recoge las muestras y su
+        costo con las reglas de combustible coincide con la tabla
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        table = build_cost_to_go(grid)
+        path = table.path(start)
+
+        assert path[0] == tuple(start)
+        assert set(table.samples) <= set(path)
+
+        cost, fuel, ship_used = 0, 0, False
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+            cell = grid[r2][c2]
+            cost += 0.5 if fuel > 0 else {3: 3, 4: 5}.get(cell, 1)
+            if cell == 5 and not ship_used:
+                fuel, ship_used = 20, True
+            elif fuel > 0:
+                fuel -= 1
+        assert cost == table.cost(start)
+
+    def test_obstacle_start_has_no_cost(self, bundled_maps):
+        """
+        Test: Una celda obstaculo no tiene costo ni camino
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        table = build_cost_to_go(grid)
+        obstacle = next((r, c) for r in range(10) for c in range(10) if grid[r][c] == 1)
+        assert table.cost(obstacle) is None
+        assert table.path(obstacle) == []
+
+
+class TestReverseSearch:
+    """Tests para algorithms/reverse_search.py"""
+
+    def test_second_call_uses_cache(self, bundled_maps):
+        """
+        Test: La segunda consulta sobre el mismo mapa no vuelve a buscar
+        """
+        map_cache.clear()
+        grid, start = bundled_maps["mapa3.txt"]
+
+        first = reverse_search.solve({"map": grid, "start": start})
+        other_start = next(
+            [r, c] for r in range(10) for c in range(10)
+            if grid[r][c] == 0 and [r, c] != list(start)
+        )
+        second = reverse_search.solve({"map": grid, "start": other_start})
+
+        assert first["cache_hit"] is False and first["nodes_expanded"] > 0
+        assert second["cache_hit"] is True and second["nodes_expanded"] == 0
+        assert second["cost"] == astar.solve({"map": grid, "start": other_start})["cost"]
+
+    def test_include_table(self, bundled_maps):
+        """
+        Test: include_table retorna la matriz 10x10 de costos
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = reverse_search.solve({"map": grid, "start": start, "include_table": True})
+        table = result["cost_table"]
+        assert len(table) == 10 and all(len(row) == 10 for row in table)
+        assert table[start[0]][start[1]] == result["cost"]
+
+    def test_invalid_start(self, bundled_maps):
+        """
+        Test: Un inicio sobre un obstaculo no retorna camino
+        """
+        grid, _ = bundled_maps["mapa.txt"]
+        obstacle = next([r, c] for r in range(10) for c in range(10) if grid[r][c] == 1)
+        result = reverse_search.solve({"map": grid, "start": obstacle})
+        assert result["path"] == []
+        assert result["message"] == "Posición inicial inválida"
+
+
+class TestMapCache:
+    """Tests para core/map_cache.py"""
+
+    def test_fingerprint_changes_with_content(self):
+        """
+        Test: La huella cambia si cambia una celda o la forma del mapa
+        """
+        grid = [[0, 0], [0, 0]]
+        assert map_fingerprint(grid) == map_fingerprint([[0, 0], [0, 0]])
+        assert map_fingerprint(grid) != map_fingerprint([[0, 0], [0, 1]])
+        assert map_fingerprint([[0, 0, 0, 0]]) != map_fingerprint(grid)
+
+    def test_lru_eviction(self):
+        """
+        Test: Al superar max_maps se descarta el mapa menos usado
+        """
+        cache = MapCache(max_maps=2)
+        maps = [[[i]] for i in range(3)]
+        for grid in maps:
+            cache.get(grid, "kind", lambda: object())
+
+        _, hit = cache.get(maps[0], "kind", lambda: object())
+        assert hit is False
+        _, hit = cache.get(maps[2], "kind", lambda: object())
+        assert hit is True
+        assert cache.stats()["maps"] == 2
@@ -0,0 +1,172 @@
+"""
+Test suite para las rutas punto a punto (core/routing.py y GET /api/route)
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.routing import find_route, path_cost
+from core.world_state import mars_world
+from benchmarks.maps import generate_map
+
+
+ROUTE_MAP = """2 0 0 1 0 0 0 0 0 0
+0 1 0 1 0 3 3 0 0 0
+0 1 0 0 0 3 3 0 6 0
+0 1 1 1 0 0 0 0 0 0
+0 0 0 1 0 4 4 4 0 0
+0 5 0 1 0 0 0 4 0 0
+0 0 0 1 1 1 0 4 0 6
+0 0 0 0 0 1 0 0 0 0
+0 1 1 1 0 1 0 1 1 0
+0 0 0 6 0 0 0 1 0 0"""
+
+
+@pytest.fixture
+def loaded_world():
+    """Carga ROUTE_MAP en el mundo global y lo limpia al terminar"""
+    mars_world.load_from_text(ROUTE_MAP)
+    mars_world.metadata.pop('goal', None)
+    yield mars_world
+    mars_world.reset()
+
+
+def assert_valid_path(grid, path, start, goal):
+    """Verifica que el camino sea continuo, sin obstaculos y entre los extremos"""
+    assert path[0] == list(start) and path[-1] == list(goal)
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1
+        assert grid[r2][c2] != 1
+
+
+class TestBidirectionalSearch:
+    """Tests de BFS y Dijkstra bidireccionales"""
+
+    def test_matches_unidirectional_on_random_maps(self):
+        """
+        Test: La busqueda bidireccional encuentra rutas del mismo largo/costo
+        que la unidireccional
+        """
+        for seed in range(40):
+            grid = generate_map(seed, size=20, obstacle_density=0.25)
+            rng = random.Random(seed)
+            free = [(i, j) for i in range(20) for j in range(20) if grid[i][j] != 1]
+            start, goal = rng.sample(free, 2)
+
+            for mode, key in (("unit", "moves"), ("terrain", "cost")):
+                bi = find_route(grid, start, goal, mode=mode, bidirectional=True)
+                uni = find_route(grid, start, goal, mode=mode, bidirectional=False)
+                assert bi[key] == uni[key], f"seed {seed}, modo {mode}"
+                if bi["path"]:
+                    assert_valid_path(grid, bi["path"], start, goal)
+                    assert bi["cost"] == path_cost(grid, bi["path"])
+
+    def test_terrain_mode_avoids_expensive_cells(self):
+        """
+        Test: En modo terreno se rodea el terreno volcanico si es mas barato
+        """
+        grid = [[0] * 5 for _ in range(3)]
+        grid[1] = [0, 4, 4, 4, 0]
+        route = find_route(grid, (1, 0), (1, 4), mode="terrain")
+        assert route["cost"] == 6
+        assert route["moves"] == 6
+        unit = find_route(grid, (1, 0), (1, 4), mode="unit")
+        assert unit["moves"] == 4
+
+    def test_fewer_expansions_on_open_map(self):
+        """
+        Test: En un mapa abierto la busqueda bidireccional expande menos nodos
+        """
+        grid = [[0] * 50 for _ in range(50)]
+        for mode in ("unit", "terrain"):
+            bi = find_route(grid, (15, 25), (35, 25), mode=mode, bidirectional=True)
+            uni = find_route(grid, (15, 25), (35, 25), mode=mode, bidirectional=False)
+            assert bi["nodes_expanded"] < uni["nodes_expanded"]
+
+    def test_unreachable_goal(self):
+        """
+        Test: Sin ruta posible se retorna camino vacio
+        """
+        grid = [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+        route = find_route(grid, (0, 0), (2, 2))
+        assert route["path"] == []
+        assert route["message"] == "No existe ruta entre las celdas"
+
+    def test_invalid_arguments(self):
+        """
+        Test: Modo desconocido o celdas invalidas lanzan ValueError
+        """
+        grid = [[0, 1], [0, 0]]
+        with pytest.raises(ValueError):
+            find_route(grid, (0, 0), (1, 1), mode="diagonal")
+        with pytest.raises(ValueError):
+            find_route(grid, (0, 0), (0, 1))
+        with pytest.raises(ValueError):
+            find_route(grid, (0, 0), (5, 5))
+
+
+class TestRouteEndpoint:
+    """Tests para el endpoint GET /api/route"""
+
+    def test_route_without_map(self, client):
+        """
+        Test: Sin mapa cargado debe retornar 404
+        """
+        mars_world.reset()
+        response = client.get("/api/route")
+        assert response.status_code == 404
+
+    def test_route_without_goal(self, client, loaded_world):
+        """
+        Test: Sin objetivo fijado debe retornar 400
+        """
+        response = client.get("/api/route")
+        assert response.status_code == 400
+
+    def test_route_to_goal(self, client, loaded_world):
+        """
+        Test: Calcula la ruta desde el astronauta hasta el objetivo fijado
+        """
+        assert client.post("/api/map/goal", json={"row": 9, "col": 9}).status_code == 200
+
+        response = client.get("/api/route", params={"mode": "unit"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["start"] == [0, 0]
+        assert data["goal"] == [9, 9]
+        assert data["moves"] == 18
+        assert_valid_path(loaded_world.grid, data["path"], (0, 0), (9, 9))
+
+        terrain = client.get("/api/route").json()
+        assert terrain["cost"] == path_cost(loaded_world.grid, terrain["path"])
+        assert terrain["cost"] <= data["cost"]
+
+    def test_route_with_custom_start(self, client, loaded_world):
+        """
+        Test: Se puede indicar la celda inicial por parametros
+        """
+        client.post("/api/map/goal", json={"row": 2, "col": 8})
+        response = client.get("/api/route", params={"start_row": 2, "start_col": 7})
+        assert response.status_code == 200
+        assert response.json()["path"] == [[2, 7], [2, 8]]
+
+    def test_route_to_obstacle(self, client, loaded_world):
+        """
+        Test: Un objetivo sobre un obstaculo retorna 400
+        """
+        client.post("/api/map/goal", json={"row": 0, "col": 3})
+        response = client.get("/api/route")
+        assert response.status_code == 400
+
+    def test_route_invalid_mode(self, client, loaded_world):
+        """
+        Test: Un modo desconocido retorna 400
+        """
+        client.post("/api/map/goal", json={"row": 9, "col": 9})
+        response = client.get("/api/route", params={"mode": "diagonal"})
+        assert response.status_code == 400
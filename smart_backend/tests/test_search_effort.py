@@ -0,0 +1,141 @@
+"""
+Test suite de regresion del esfuerzo de busqueda (archivos golden)
+
+El tiempo es ruidoso; los nodos expandidos, el tamano maximo de la frontera,
+los estados guardados y el costo son deterministas. Cada algoritmo tiene un
+archivo tests/golden/search_effort/<algoritmo>.json con esas medidas para
+cada mapa mapa*.txt y cada orden de operadores (solo el orden por defecto
+si el algoritmo no lo admite). Cualquier cambio falla con un diff legible.
+
+Actualizar los golden tras un cambio intencional:
+    pytest tests/test_search_effort.py --update-golden
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.maps import find_start, load_bundled_maps
+from benchmarks.suite import registered_algorithms
+from core.map_cache import map_cache
+
+GOLDEN_DIR = Path(__file__).parent / "golden" / "search_effort"
+
+# Las cuatro rotaciones del orden por defecto (arriba, abajo, izquierda, derecha)
+OPERATOR_ORDERS = [
+    ["arriba", "abajo", "izquierda", "derecha"],
+    ["abajo", "izquierda", "derecha", "arriba"],
+    ["izquierda", "derecha", "arriba", "abajo"],
+    ["derecha", "arriba", "abajo", "izquierda"],
+]
+
+# Algoritmos que leen params["operator_order"]
+ORDER_AWARE = {"ara_star", "astar", "beam_search", "dfs", "ida_star", "iddfs", "uniform_cost"}
+
+METRICS = ["nodes_expanded", "max_frontier", "visited_states", "cost"]
+
+# Algoritmos sin frontera de busqueda (recorren ordenes de visita precalculados)
+WITHOUT_FRONTIER = {"key_points"}
+
+
+def measure_effort(name: str) -> dict:
+    """
+    Ejecuta un algoritmo sobre cada mapa y orden de operadores
+
+    Args:
+        name: Nombre del algoritmo
+
+    Returns:
+        Diccionario "mapa / orden" -> medidas (None si el algoritmo no la reporta)
+    """
+    solve = importlib.import_module(f"algorithms.{name}").solve
+    orders = OPERATOR_ORDERS if name in ORDER_AWARE else OPERATOR_ORDERS[:1]
+    effort = {}
+    for map_name, grid in load_bundled_maps().items():
+        for order in orders:
+            # nodes_expanded de algunos algoritmos depende de si la tabla del mapa ya estaba en cache
+            map_cache.clear()
+            result = solve({"map": grid, "start": find_start(grid), "operator_order": order})
+            effort[f"{map_name} / {','.join(order)}"] = {metric: result.get(metric) for metric in METRICS}
+    return effort
+
+
+def effort_diff(expected: dict, actual: dict) -> list:
+    """
+    Diferencias legibles entre las medidas golden y las actuales
+
+    Args:
+        expected: Medidas golden
+        actual: Medidas actuales
+
+    Returns:
+        Lista de lineas, vacia si coinciden
+    """
+    lines = []
+    for key in sorted(set(expected) | set(actual)):
+        if key not in actual:
+            lines.append(f"{key}: ya no se mide")
+            continue
+        if key not in expected:
+            lines.append(f"{key}: sin golden")
+            continue
+        for metric in METRICS:
+            old, new = expected[key].get(metric), actual[key].get(metric)
+            if old == new:
+                continue
+            change = ""
+            if isinstance(old, (int, float)) and isinstance(new, (int, float)) and old:
+                change = f" ({(new - old) / old:+.1%})"
+            lines.append(f"{key}: {metric} {old} -> {new}{change}")
+    return lines
+
+
+class TestSearchEffort:
+    """Tests de regresion del esfuerzo de busqueda contra los golden"""
+
+    @pytest.mark.parametrize("name", registered_algorithms())
+    def test_search_effort(self, name, request):
+        """
+        Test: Nodos expandidos, frontera maxima, estados guardados y costo
+        coinciden con el golden de cada algoritmo
+        """
+        actual = measure_effort(name)
+        path = GOLDEN_DIR / f"{name}.json"
+
+        # Una medida en null nunca falla contra el golden: solo se permite
+        # la frontera y los estados en los algoritmos que no tienen
+        optional = {"max_frontier", "visited_states"} if name in WITHOUT_FRONTIER else set()
+        missing = sorted({metric for effort in actual.values() for metric in METRICS
+                          if effort[metric] is None} - optional)
+        assert not missing, f"{name} no reporta {', '.join(missing)}"
+
+        if request.config.getoption("--update-golden"):
+            GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(actual, indent=2, sort_keys=True) + "\n")
+            return
+
+        assert path.exists(), f"No hay golden para {name}: ejecute pytest tests/{Path(__file__).name} --update-golden"
+        diff = effort_diff(json.loads(path.read_text()), actual)
+        assert not diff, (
+            f"El esfuerzo de busqueda de {name} cambio ({len(diff)} diferencias):\n  "
+            + "\n  ".join(diff)
+            + f"\nSi el cambio es intencional: pytest tests/{Path(__file__).name} --update-golden"
+        )
+
+    def test_effort_diff_is_readable(self):
+        """
+        Test: El diff muestra la medida, el valor anterior, el nuevo y el cambio relativo
+        """
+        expected = {"mapa.txt / a": {"nodes_expanded": 100, "max_frontier": 10, "visited_states": 50, "cost": 20}}
+        actual = {"mapa.txt / a": {"nodes_expanded": 200, "max_frontier": 10, "visited_states": 50, "cost": 20},
+                  "mapa2.txt / a": {"nodes_expanded": 1, "max_frontier": 1, "visited_states": 1, "cost": 1}}
+        assert effort_diff(expected, actual) == [
+            "mapa.txt / a: nodes_expanded 100 -> 200 (+100.0%)",
+            "mapa2.txt / a: sin golden",
+        ]
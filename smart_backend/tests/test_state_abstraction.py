@@ -0,0 +1,99 @@
+"""
+Test suite para la abstraccion de estado (state_abstraction) de la deteccion
+de duplicados de BFS y DFS
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import bfs, dfs
+
+SOLVERS = {"bfs": bfs, "dfs": dfs}
+MODES = ["full", "ship", "samples"]
+
+
+def path_cost_bfs_rules(grid, path):
+    """
+    Costo de un camino con las reglas con que BFS y DFS reconstruyen el costo
+    (la nave recarga 20 de combustible cada vez que se entra a ella)
+    """
+    cost, fuel = 0, 0
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1, "El camino debe ser continuo"
+        cell = grid[r2][c2]
+        assert cell != 1, "El camino no puede pasar por obstaculos"
+        if cell == 5:
+            fuel = 20
+        if fuel > 0:
+            cost += 0.5
+            fuel -= 1
+        else:
+            cost += {3: 3, 4: 5}.get(cell, 1)
+    return cost
+
+
+def run_modes(solver, grid, start):
+    """Resultado del solver en cada modo de abstraccion"""
+    return {mode: solver.solve({"map": grid, "start": start, "state_abstraction": mode}) for mode in MODES}
+
+
+class TestStateAbstraction:
+    """Tests del parametro state_abstraction"""
+
+    @pytest.mark.parametrize("name", sorted(SOLVERS))
+    def test_every_mode_finds_valid_solution(self, bundled_maps, name):
+        """
+        Test: En todos los modos el camino recoge las 3 muestras y el costo
+        informado coincide con el camino
+        """
+        for map_name, (grid, start) in bundled_maps.items():
+            samples = {(r, c) for r in range(10) for c in range(10) if grid[r][c] == 6}
+            for mode, result in run_modes(SOLVERS[name], grid, start).items():
+                assert result["path"][0] == list(start), f"{map_name} {mode}"
+                assert samples <= {tuple(cell) for cell in result["path"]}, f"{map_name} {mode}"
+                assert path_cost_bfs_rules(grid, result["path"]) == result["cost"], f"{map_name} {mode}"
+
+    def test_bfs_path_length_is_the_same(self, bundled_maps):
+        """
+        Test: BFS encuentra un camino de la misma longitud en los tres modos
+        (DFS no busca el mas corto, asi que su camino puede cambiar)
+        """
+        for map_name, (grid, start) in bundled_maps.items():
+            lengths = {mode: len(result["path"]) for mode, result in run_modes(bfs, grid, start).items()}
+            assert len(set(lengths.values())) == 1, f"{map_name} {lengths}"
+
+    @pytest.mark.parametrize("name", sorted(SOLVERS))
+    def test_samples_mode_stores_fewer_states(self, bundled_maps, name):
+        """
+        Test: De "full" a "samples" los estados visitados y los nodos
+        expandidos nunca aumentan y en total disminuyen
+        """
+        totals = {"full": [0, 0], "samples": [0, 0]}
+        for map_name, (grid, start) in bundled_maps.items():
+            results = run_modes(SOLVERS[name], grid, start)
+            full, samples = results["full"], results["samples"]
+
+            assert samples["visited_states"] <= full["visited_states"], map_name
+            assert samples["nodes_expanded"] <= full["nodes_expanded"], map_name
+            for mode in totals:
+                totals[mode][0] += results[mode]["visited_states"]
+                totals[mode][1] += results[mode]["nodes_expanded"]
+
+        assert totals["samples"][0] < totals["full"][0]
+        assert totals["samples"][1] < totals["full"][1]
+
+    @pytest.mark.parametrize("name", sorted(SOLVERS))
+    def test_unknown_mode_is_rejected(self, bundled_maps, name):
+        """
+        Test: Un modo desconocido no ejecuta la busqueda e informa el error
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = SOLVERS[name].solve({"map": grid, "start": start, "state_abstraction": "fuel"})
+
+        assert result["path"] == []
+        assert result["nodes_expanded"] == 0
+        assert "fuel" in result["message"]
@@ -0,0 +1,57 @@
+"""
+Test suite para la ramificación y poda de Costo Uniforme con la cota inicial
+de Avara (upper_bound en algorithms/uniform_cost.py)
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms import uniform_cost
+from benchmarks.maps import find_start, generate_map
+from tests.test_key_points import path_cost_with_fuel
+
+
+class TestUniformCostBound:
+    """Tests de la ramificación y poda de algorithms/uniform_cost.py"""
+
+    def test_same_cost_with_upper_bound(self):
+        """
+        Test: Con la cota de Avara el costo sigue siendo el óptimo, podando
+        solo por g o por g + h
+        """
+        for seed in range(40):
+            grid = generate_map(seed, obstacle_density=(0.1, 0.2, 0.3)[seed % 3])
+            start = find_start(grid)
+            expected = uniform_cost.solve({"map": grid, "start": start})
+            for bound_heuristic in (True, False):
+                result = uniform_cost.solve({
+                    "map": grid, "start": start,
+                    "upper_bound": True, "bound_heuristic": bound_heuristic
+                })
+                assert result["cost"] == expected["cost"], f"seed {seed}"
+                assert path_cost_with_fuel(grid, result["path"]) == result["cost"], f"seed {seed}"
+
+    def test_fewer_nodes_expanded(self, bundled_maps):
+        """
+        Test: La cota poda estados y expande menos nodos en los mapas incluidos
+        """
+        for name, (grid, start) in bundled_maps.items():
+            plain = uniform_cost.solve({"map": grid, "start": start})
+            bounded = uniform_cost.solve({"map": grid, "start": start, "upper_bound": True})
+
+            assert bounded["cost"] == plain["cost"], name
+            assert bounded["nodes_expanded"] <= plain["nodes_expanded"], name
+            assert bounded["bound_pruned"] > 0, name
+            assert bounded["initial_upper_bound"] >= bounded["cost"], name
+
+    def test_disabled_by_default(self, bundled_maps):
+        """
+        Test: Sin la opción no se poda por cota
+        """
+        grid, start = bundled_maps["mapa.txt"]
+        result = uniform_cost.solve({"map": grid, "start": start})
+        assert result["bound_pruned"] == 0
+        assert "initial_upper_bound" not in result
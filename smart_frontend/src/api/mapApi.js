@@ -100,6 +100,27 @@ export const getCell = async (row, col) => {
   }
 };
 
+/**
+ * Obtiene varias celdas en una sola peticion
+ * @param {Object} query - Rectangulo {row, col, height, width} o lista {cells: [[fila, col], ...]}
+ * @returns {Promise} {shape, values} con values como Uint8Array en orden de filas
+ */
+export const getRegion = async (query = {}) => {
+  try {
+    const params = query.cells
+      ? { cells: query.cells.map(([row, col]) => `${row},${col}`).join(';') }
+      : query;
+    const response = await axios.get(`${backendUrl}/api/map/region`, { params });
+    const binary = atob(response.data.data);
+    const values = Uint8Array.from(binary, (char) => char.charCodeAt(0));
+    return { ...response.data, values };
+  } catch (error) {
+    throw new Error(
+      error.response?.data?.detail || 'Error al obtener region'
+    );
+  }
+};
+
 /**
  * Obtiene solo los metadatos del mapa
  * @returns {Promise} Metadatos
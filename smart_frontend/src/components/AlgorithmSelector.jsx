@@ -22,8 +22,8 @@ const AlgorithmSelector = ({ onResultsChange }) => {
   const [operatorOrder, setOperatorOrder] = useState(['arriba', 'abajo', 'izquierda', 'derecha']);
 
   // Clasificación de algoritmos según el enunciado
-  const uninformedAlgorithms = ['bfs', 'uniform_cost', 'dfs'];
-  const informedAlgorithms = ['greedy', 'astar'];
+  const uninformedAlgorithms = ['bfs', 'uniform_cost', 'dfs', 'iddfs', 'reverse_search', 'key_points'];
+  const informedAlgorithms = ['greedy', 'astar', 'ida_star', 'ara_star', 'beam_search'];
 
   useEffect(() => {
     loadAlgorithms();